@@ -5,18 +5,109 @@
 asyncio + aiohttp 기반으로 4분면 동시 호출을 지원하여
 편의점 수집 성능을 75% 개선 (28초 → ~7초)
 
+응답 캐시(kakao_cache.KakaoResponseCache)를 넘기면 같은 rect/page 는 API 대신 캐시에서 읽는다.
+
+적응형 분할 (adaptive=True):
+    카카오 카테고리 검색은 rect 당 최대 45건(15건 x 3페이지)만 반환한다.
+    결과가 잘린 rect(1페이지 total_count > 45 또는 3페이지까지 is_end 아님)는
+    4개의 하위 rect 로 나눠 다시 조회하고, 한 변이 min_cell_m 미만이 될 때까지 재귀한다.
+    (밀집 지역만 세분화하므로 희소 지역은 추가 호출 없음)
+
+격자 타일 수집 (collect_tiles / run_grid_collection):
+    다이소 중심 4분면 대신 구 경계 격자 타일(gu_boundaries.tile_gu)을 한 번씩 조회한다.
+    타일끼리 겹치지 않으므로 중복 조회가 없고, 잘린 타일은 적응형 분할로 보완한다.
+
+페이지 선행 요청 (speculative=True):
+    사분면 1~3페이지를 동시에 요청하고, 1페이지 meta 로 필요 없다고 판단된 페이지는 취소한다.
+    (추가 호출 수 / 취소 수 / 순차 대비 절약 시간을 stats.prefetch_* 로 집계)
+
+다이소 슬라이딩 윈도우 (collect_all):
+    다이소를 하나씩 순서대로 기다리지 않고 max_in_flight 개를 동시에 진행하며,
+    하나가 끝나면 바로 다음 다이소를 넣어 limiter 슬롯이 비지 않게 한다. (place_id 는 다이소 간 공유 집합으로 중복 제거)
+
+스트리밍 저장 (stream_collection / run_streaming_collection):
+    collect_all(sink=...) 가 다이소 완료 순서대로 중복 제거된 편의점을 제한 크기 큐에 넣고,
+    writer 코루틴이 배치 단위로 꺼내 sync_to_async 로 DB 에 저장한다. (네트워크와 DB 작업이 겹침)
+    체크포인트 콜백은 앞에서부터 연속으로 저장된 다이소까지만 전진한다.
+
+연결 재사용:
+    세션은 http_pool.pooled_session(), 동기 헬퍼(run_*)는 http_pool.run_async() 의 공유 이벤트 루프에서 실행되어
+    여러 번 호출해도 같은 aiohttp 세션(keep-alive + DNS 캐시)을 쓴다.
+
+호출 실패:
+    HTTP 호출은 http_client.request_async (429/5xx/타임아웃 재시도 + 호스트 서킷 브레이커)를 거친다.
+    재시도를 소진한 페이지는 빈 결과로 대신하지 않고 stats.failed_daiso / failed_rects 에 남겨
+    호출자가 체크포인트를 멈추고 재수집할 수 있게 한다.
+
 사용법:
     from .async_collector import AsyncKakaoCollector
     
-    collector = AsyncKakaoCollector(api_key)
+    collector = AsyncKakaoCollector(api_key, cache=KakaoResponseCache(mode='write'))
     results = await collector.collect_convenience_stores(daiso_list, target_gu)
 """
 
 import asyncio
+import itertools
 import aiohttp
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import math
 from dataclasses import dataclass, field
+from asgiref.sync import sync_to_async
 from django.contrib.gis.geos import Point
+from django.db import connections
+from .kakao_cache import KakaoResponseCache
+from .http_client import CircuitOpenError, RequestFailedError, request_async
+from .http_pool import pooled_session, run_async
+from .rate_limit import AsyncRateLimiter
+
+
+@dataclass
+class StreamStats:
+    """스트리밍 수집 통계 (수집 / 저장 구간 겹침)"""
+    fetch_seconds: float = 0.0    # 수집 시작 ~ 마지막 다이소 완료
+    write_seconds: float = 0.0    # 배치 저장 소요 합계
+    overlap_seconds: float = 0.0  # 수집 진행 중에 저장한 시간
+    total_seconds: float = 0.0    # 수집 시작 ~ 마지막 배치 저장 완료
+    batches: int = 0
+    rows_written: int = 0
+    max_queue: int = 0            # 큐에 쌓인 최대 다이소 수
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {key: round(value, 2) if isinstance(value, float) else value for key, value in self.__dict__.items()}
+        # 순차 실행(수집 후 저장) 대비: 이상적인 값은 max(fetch, write)
+        data['sequential_seconds'] = round(self.fetch_seconds + self.write_seconds, 2)
+        data['overlap_ratio'] = round(self.overlap_seconds / self.write_seconds * 100, 1) if self.write_seconds else 0.0
+        return data
+
+
+class ContiguousCheckpoint:
+    """
+    완료 순서와 무관하게 앞에서부터 연속으로 끝난 다이소까지만 전진하는 체크포인트 커서
+
+    슬라이딩 윈도우에서는 뒤 순번 다이소가 먼저 끝날 수 있으므로, 저장이 끝난 순번을 모아
+    0번부터 빈틈없이 이어진 구간만 체크포인트로 인정한다. 실패 다이소를 만나면 더 이상 전진하지 않는다.
+    """
+
+    def __init__(self):
+        self.next_position = 0   # 다음에 처리해야 할 순번 (= 연속 완료 다이소 수)
+        self.blocked = False
+        self._finished = {}
+
+    def mark(self, position: int, daiso, failed: bool):
+        """저장 완료된 다이소 기록"""
+        self._finished[position] = (daiso, failed)
+
+    def advance(self):
+        """연속 구간만큼 전진 후 마지막 다이소 반환 (전진하지 않았으면 None)"""
+        advanced = None
+        while not self.blocked and self.next_position in self._finished:
+            daiso, failed = self._finished.pop(self.next_position)
+            if failed:
+                self.blocked = True
+                break
+            self.next_position += 1
+            advanced = daiso
+        return advanced
 
 
 @dataclass
@@ -25,40 +116,57 @@ class CollectionStats:
     api_calls: int = 0
     stored_count: int = 0
     skipped_count: int = 0
+    cache_hits: int = 0
+    split_count: int = 0        # 적응형 분할: 4분할한 rect 수
+    truncated_cells: int = 0    # 최소 크기에서도 45건을 넘어 잘린 rect 수
+    retries: int = 0            # 429/5xx/타임아웃 재시도 횟수
+    throttled: int = 0          # 429 수신 횟수
+    failed_requests: int = 0    # 재시도 소진 / 서킷 차단으로 실패한 페이지 요청 수
+    failed_daiso: List[str] = field(default_factory=list)  # 실패 페이지가 있는 다이소 (재수집 대상)
+    failed_rects: List[str] = field(default_factory=list)  # 실패 페이지가 있는 타일 rect (재수집 대상)
+    prefetch_quadrants: int = 0     # 선행 요청(speculative)으로 수집한 사분면 수
+    prefetch_extra_calls: int = 0   # 응답까지 받았지만 필요 없던 선행 페이지 (추가 비용)
+    prefetch_cancelled: int = 0     # 1페이지 응답 후 취소한 선행 페이지
+    prefetch_saved_seconds: float = 0.0  # 순차 호출 대비 절약한 시간 합계 (초)
     errors: List[str] = field(default_factory=list)
 
 
-class AsyncRateLimiter:
-    """
-    Semaphore 기반 Rate Limiter
-    
-    카카오 API: 초당 10회 제한 준수
-    """
-    
-    def __init__(self, max_concurrent: int = 8, delay: float = 0.1):
-        """
-        Args:
-            max_concurrent: 동시 요청 최대 수 (기본: 8, Rate Limit 여유 확보)
-            delay: 요청 후 대기 시간 (초)
-        """
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._delay = delay
-    
-    async def acquire(self):
-        """Rate limit 슬롯 획득"""
-        await self._semaphore.acquire()
-    
-    def release(self):
-        """Rate limit 슬롯 해제"""
-        self._semaphore.release()
-    
-    async def __aenter__(self):
-        await self.acquire()
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await asyncio.sleep(self._delay)
-        self.release()
+KAKAO_PAGE_SIZE = 15
+DEFAULT_MAX_RETRIES = 3     # 429/5xx/타임아웃 재시도 횟수
+KAKAO_MAX_PAGES = 3
+DEFAULT_MIN_CELL_M = 100.0  # 적응형 분할 최소 rect 한 변 (m)
+DEFAULT_STREAM_BATCH = 200  # 스트리밍 저장 배치 크기 (행)
+DEFAULT_STREAM_QUEUE = 16   # 수집 → 저장 큐 크기 (다이소 단위, 가득 차면 수집 측이 대기)
+DEFAULT_DAISO_WINDOW = 4    # collect_all 동시 처리 다이소 수 (4 x 4분면 = 16개 사분면 → limiter 8 슬롯을 빈틈없이 채움)
+METERS_PER_DEG_LAT = 111_320.0
+
+
+def parse_rect(rect: str) -> List[float]:
+    """'x1,y1,x2,y2' → [x1, y1, x2, y2]"""
+    return [float(value) for value in rect.split(",")]
+
+
+def format_rect(x1: float, y1: float, x2: float, y2: float) -> str:
+    return f"{x1:.6f},{y1:.6f},{x2:.6f},{y2:.6f}"
+
+
+def rect_size_m(rect: str) -> tuple:
+    """rect 너비/높이 (m)"""
+    x1, y1, x2, y2 = parse_rect(rect)
+    m_per_deg_lng = METERS_PER_DEG_LAT * math.cos(math.radians((y1 + y2) / 2))
+    return abs(x2 - x1) * m_per_deg_lng, abs(y2 - y1) * METERS_PER_DEG_LAT
+
+
+def split_rect(rect: str) -> List[str]:
+    """rect 를 중점 기준 4개 하위 rect 로 분할 (우상, 좌상, 좌하, 우하)"""
+    x1, y1, x2, y2 = parse_rect(rect)
+    mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+    return [
+        format_rect(mx, my, x2, y2),
+        format_rect(x1, my, mx, y2),
+        format_rect(x1, y1, mx, my),
+        format_rect(mx, y1, x2, my),
+    ]
 
 
 class AsyncKakaoCollector:
@@ -75,16 +183,35 @@ class AsyncKakaoCollector:
     DELTA_LAT_PER_KM = 0.0090
     DELTA_LNG_PER_KM = 0.0113
     
-    def __init__(self, api_key: str, radius_km: float = 1.8):
+    def __init__(
+        self,
+        api_key: str,
+        radius_km: float = 1.8,
+        cache: Optional[KakaoResponseCache] = None,
+        adaptive: bool = False,
+        min_cell_m: float = DEFAULT_MIN_CELL_M,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        speculative: bool = False,
+    ):
         """
         Args:
             api_key: 카카오 REST API 키
             radius_km: 탐색 반경 (km)
+            cache: 응답 캐시 (None 이면 캐시 미사용)
+            adaptive: 결과가 잘린 rect 를 4분할하여 재조회
+            min_cell_m: 적응형 분할 최소 rect 한 변 (m)
+            max_retries: 429/5xx/타임아웃 재시도 횟수 (지수 백오프 + jitter, Retry-After 우선)
+            speculative: 사분면 1~3페이지를 동시에 요청하고 불필요한 페이지는 취소 (adaptive 가 아닐 때)
         """
         self.api_key = api_key
         self.radius_km = radius_km
+        self.cache = cache
+        self.adaptive = adaptive
+        self.min_cell_m = min_cell_m
+        self.max_retries = max_retries
+        self.speculative = speculative
         self.headers = {"Authorization": f"KakaoAK {api_key}"}
-        self.rate_limiter = AsyncRateLimiter(max_concurrent=8, delay=0.1)
+        self.rate_limiter = AsyncRateLimiter(max_concurrent=8)
         self.stats = CollectionStats()
     
     def _generate_quadrants(self, cx: float, cy: float) -> List[str]:
@@ -130,7 +257,10 @@ class AsyncKakaoCollector:
             page: 페이지 번호 (1-3)
         
         Returns:
-            API 응답 JSON
+            API 응답 JSON (400 이면 빈 결과)
+        
+        Raises:
+            RequestFailedError: 재시도 소진 / 서킷 차단 (빈 결과로 대신하지 않음)
         """
         params = {
             "category_group_code": self.CATEGORY_CONVENIENCE,
@@ -138,34 +268,52 @@ class AsyncKakaoCollector:
             "x": f"{cx:.6f}",
             "y": f"{cy:.6f}",
             "page": page,
-            "size": 15,
+            "size": KAKAO_PAGE_SIZE,
             "sort": "distance"
         }
         
-        async with self.rate_limiter:
-            try:
-                async with session.get(
-                    self.BASE_URL, 
-                    headers=self.headers, 
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    self.stats.api_calls += 1
-                    
-                    if response.status == 400:
-                        error_text = await response.text()
-                        self.stats.errors.append(f"API 400: {error_text}")
-                        return {"documents": [], "meta": {"is_end": True}}
-                    
-                    response.raise_for_status()
-                    return await response.json()
-                    
-            except asyncio.TimeoutError:
-                self.stats.errors.append(f"Timeout: rect={rect}, page={page}")
-                return {"documents": [], "meta": {"is_end": True}}
-            except Exception as e:
-                self.stats.errors.append(f"Error: {str(e)}")
-                return {"documents": [], "meta": {"is_end": True}}
+        if self.cache is not None:
+            cached = await self.cache.get_async(self.BASE_URL, params)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+        
+        try:
+            result = await request_async(
+                session, "GET", self.BASE_URL,
+                limiter=self.rate_limiter,
+                max_retries=self.max_retries,
+                on_retry=self._on_retry,
+                headers=self.headers,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        except RequestFailedError as e:
+            if not isinstance(e, CircuitOpenError):
+                self.stats.api_calls += 1
+            self.stats.failed_requests += 1
+            self.stats.errors.append(f"{e} (rect={rect}, page={page})")
+            raise
+        self.stats.api_calls += 1
+        
+        if result.status == 400:
+            self.stats.errors.append(f"API 400: {result.text()}")
+            return {"documents": [], "meta": {"is_end": True}}
+        if result.status >= 300:
+            self.stats.failed_requests += 1
+            raise RequestFailedError(self.BASE_URL, f"HTTP {result.status}", status=result.status, attempts=1)
+        
+        data = result.json()
+        if self.cache is not None:
+            await self.cache.put_async(self.BASE_URL, params, data)
+        return data
+    
+    def _on_retry(self, attempt: int, status: Optional[int], delay: float):
+        """재시도 통계 (429 면 공유 버킷 정지는 http_client 가 처리)"""
+        self.stats.api_calls += 1
+        self.stats.retries += 1
+        if status == 429:
+            self.stats.throttled += 1
     
     async def _collect_quadrant(
         self,
@@ -173,7 +321,7 @@ class AsyncKakaoCollector:
         rect: str,
         cx: float,
         cy: float,
-        max_pages: int = 3
+        max_pages: int = KAKAO_MAX_PAGES
     ) -> List[Dict[str, Any]]:
         """
         단일 사분면의 모든 페이지 수집
@@ -203,11 +351,156 @@ class AsyncKakaoCollector:
         
         return all_documents
     
+    async def _timed_fetch(self, session, rect: str, cx: float, cy: float, page: int):
+        """(응답, 소요 시간) - 선행 요청의 순차 대비 절약 시간 계산용"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        data = await self._fetch_page(session, rect, cx, cy, page)
+        return data, loop.time() - started
+    
+    @staticmethod
+    def _needed_pages(data: Dict[str, Any], max_pages: int = KAKAO_MAX_PAGES) -> int:
+        """1페이지 응답으로 필요한 페이지 수 추정 (pageable_count → total_count, 없으면 max_pages)"""
+        meta = data.get("meta", {})
+        if not data.get("documents") or meta.get("is_end", True):
+            return 1
+        count = meta.get("pageable_count", meta.get("total_count"))
+        if count is None:
+            return max_pages
+        return max(1, min(max_pages, math.ceil(count / KAKAO_PAGE_SIZE)))
+    
+    async def _collect_quadrant_speculative(
+        self,
+        session: aiohttp.ClientSession,
+        rect: str,
+        cx: float,
+        cy: float,
+        max_pages: int = KAKAO_MAX_PAGES
+    ) -> List[Dict[str, Any]]:
+        """
+        단일 사분면 수집 (1~max_pages 페이지 동시 요청)
+        
+        1페이지 응답의 meta(pageable_count / total_count / is_end)로 필요한 페이지 수를 정하고
+        그 이상 페이지는 취소한다. 이미 응답까지 받은 불필요 페이지는 prefetch_extra_calls,
+        취소한 페이지는 prefetch_cancelled 로 집계한다. (전송 중 취소된 요청도 카카오 쿼터에는 포함될 수 있음)
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        tasks = {
+            page: asyncio.ensure_future(self._timed_fetch(session, rect, cx, cy, page))
+            for page in range(1, max_pages + 1)
+        }
+        self.stats.prefetch_quadrants += 1
+        
+        try:
+            first, sequential = await tasks[1]
+            needed = self._needed_pages(first, max_pages)
+            
+            for page in range(needed + 1, max_pages + 1):
+                self._drop_prefetch(tasks.pop(page))
+            
+            all_documents = list(first.get("documents", []))
+            last_page = 1
+            for page in range(2, needed + 1):
+                data, elapsed = await tasks[page]
+                last_page = page
+                sequential += elapsed
+                documents = data.get("documents", [])
+                all_documents.extend(documents)
+                if not documents or data.get("meta", {}).get("is_end", True):
+                    break
+            
+            # meta 추정보다 일찍 끝난 경우 남은 페이지도 불필요
+            for page in range(last_page + 1, needed + 1):
+                self._drop_prefetch(tasks.pop(page))
+            
+            self.stats.prefetch_saved_seconds += max(0.0, sequential - (loop.time() - started))
+            return all_documents
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+    
+    def _drop_prefetch(self, task: asyncio.Future):
+        """불필요한 선행 페이지 처리 (응답까지 받았으면 추가 비용, 아니면 취소)"""
+        if task.done():
+            self.stats.prefetch_extra_calls += 1
+            if not task.cancelled():
+                task.exception()  # 결과 무시 (미회수 예외 경고 방지)
+        else:
+            task.cancel()
+            self.stats.prefetch_cancelled += 1
+    
+    def _can_split(self, rect: str) -> bool:
+        """분할 후 하위 rect 한 변이 min_cell_m 이상인지"""
+        width, height = rect_size_m(rect)
+        return min(width, height) / 2 >= self.min_cell_m
+    
+    async def _collect_adaptive(
+        self,
+        session: aiohttp.ClientSession,
+        rect: str,
+        cx: float,
+        cy: float
+    ) -> List[Dict[str, Any]]:
+        """
+        rect 수집 + 결과가 잘리면 4분할 재귀 수집
+        
+        1페이지 meta.total_count 가 45건을 넘으면 2~3페이지를 호출하지 않고 바로 분할하고,
+        total_count 가 없거나 작아도 3페이지까지 is_end 가 아니면 분할한다.
+        
+        Returns:
+            수집된 문서 리스트 (분할한 경우 하위 rect 결과만, 중복은 호출자가 제거)
+        """
+        max_results = KAKAO_PAGE_SIZE * KAKAO_MAX_PAGES
+        can_split = self._can_split(rect)
+        all_documents = []
+        
+        for page in range(1, KAKAO_MAX_PAGES + 1):
+            data = await self._fetch_page(session, rect, cx, cy, page)
+            documents = data.get("documents", [])
+            meta = data.get("meta", {})
+            
+            if page == 1 and can_split and meta.get("total_count", 0) > max_results:
+                return await self._collect_children(session, rect, cx, cy)
+            
+            if not documents:
+                return all_documents
+            
+            all_documents.extend(documents)
+            
+            if meta.get("is_end", True):
+                return all_documents
+        
+        # 3페이지까지 받아도 끝이 아님 → 잘린 결과
+        if not can_split:
+            self.stats.truncated_cells += 1
+            return all_documents
+        return await self._collect_children(session, rect, cx, cy)
+    
+    async def _collect_children(
+        self,
+        session: aiohttp.ClientSession,
+        rect: str,
+        cx: float,
+        cy: float
+    ) -> List[Dict[str, Any]]:
+        """rect 4분할 후 하위 rect 동시 수집"""
+        self.stats.split_count += 1
+        results = await asyncio.gather(*[
+            self._collect_adaptive(session, child, cx, cy)
+            for child in split_rect(rect)
+        ])
+        return [item for documents in results for item in documents]
+    
     async def collect_for_daiso(
         self,
         session: aiohttp.ClientSession,
         daiso,
-        target_gu: str
+        target_gu: str,
+        seen_ids: Optional[set] = None
     ) -> List[Dict[str, Any]]:
         """
         단일 다이소 기준 4분면 동시 수집
@@ -216,12 +509,24 @@ class AsyncKakaoCollector:
             session: aiohttp 세션
             daiso: 다이소 모델 인스턴스
             target_gu: 타겟 구 이름
+            seen_ids: 다이소 간 공유 place_id 집합 (None 이면 이 다이소 안에서만 중복 제거)
         
         Returns:
             타겟 구에 해당하는 편의점 데이터 리스트
         """
+        stores, _ = await self._collect_daiso(session, daiso, target_gu, seen_ids)
+        return stores
+    
+    async def _collect_daiso(
+        self,
+        session: aiohttp.ClientSession,
+        daiso,
+        target_gu: str,
+        seen_ids: Optional[set] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """collect_for_daiso 본체 → (편의점 리스트, 실패 페이지 여부)"""
         if not daiso.location:
-            return []
+            return [], False
         
         cx = daiso.location.x  # 경도
         cy = daiso.location.y  # 위도
@@ -229,9 +534,15 @@ class AsyncKakaoCollector:
         # 4분면 좌표 생성
         quadrants = self._generate_quadrants(cx, cy)
         
-        # 4분면 동시 수집 (핵심 병렬화 포인트)
+        # 4분면 동시 수집 (핵심 병렬화 포인트, adaptive 면 잘린 사분면은 재귀 분할, speculative 면 페이지 선행 요청)
+        if self.adaptive:
+            collect = self._collect_adaptive
+        elif self.speculative:
+            collect = self._collect_quadrant_speculative
+        else:
+            collect = self._collect_quadrant
         tasks = [
-            self._collect_quadrant(session, rect, cx, cy)
+            collect(session, rect, cx, cy)
             for rect in quadrants
         ]
         
@@ -239,11 +550,17 @@ class AsyncKakaoCollector:
         
         # 결과 병합 및 필터링
         filtered_stores = []
-        seen_ids = set()
+        if seen_ids is None:
+            seen_ids = set()
+        
+        failed = any(isinstance(result, Exception) for result in results)
+        if failed:
+            self.stats.failed_daiso.append(daiso.name)
         
         for result in results:
             if isinstance(result, Exception):
-                self.stats.errors.append(str(result))
+                if not isinstance(result, RequestFailedError):
+                    self.stats.errors.append(str(result))
                 continue
             
             for item in result:
@@ -265,40 +582,132 @@ class AsyncKakaoCollector:
                 item["_target_gu"] = target_gu
                 filtered_stores.append(item)
         
-        return filtered_stores
+        return filtered_stores, failed
     
     async def collect_all(
         self,
         daiso_list,
         target_gu: str,
-        progress_callback=None
+        progress_callback=None,
+        max_in_flight: int = DEFAULT_DAISO_WINDOW,
+        sink=None
     ) -> List[Dict[str, Any]]:
         """
-        모든 다이소에 대해 편의점 수집
+        모든 다이소에 대해 편의점 수집 (슬라이딩 윈도우)
+        
+        다이소를 하나씩 기다리면 4분면 호출이 끝날 때마다 연결이 쉬므로,
+        최대 max_in_flight 개 다이소를 동시에 진행하고 하나가 끝나면 바로 다음 다이소를 넣는다.
+        실제 호출 속도는 rate_limiter(동시 슬롯 + 토큰 버킷)가 제한한다.
+        place_id 중복은 다이소 간 공유 집합으로 제거한다.
         
         Args:
             daiso_list: 다이소 모델 리스트 (미리 evaluate된 상태)
             target_gu: 타겟 구 이름
-            progress_callback: 진행 상황 콜백 (optional)
+            progress_callback: 진행 상황 콜백 (optional, 완료 순서대로 (완료 수, 전체 수, 다이소명, 건수))
+            max_in_flight: 동시에 진행할 다이소 수
+            sink: 완료 순서대로 await sink(순번, 다이소, 편의점 리스트, 실패 여부) 호출
+                  (지정 시 결과를 모으지 않음 → 스트리밍 저장, sink 가 대기하면 다음 다이소 투입도 대기)
         
         Returns:
-            수집된 모든 편의점 데이터 리스트
+            수집된 모든 편의점 데이터 리스트 (완료 순서, sink 지정 시 빈 리스트)
         """
         all_stores = []
         total = len(daiso_list)
+        done = 0
+        seen_ids = set()
+        queue = enumerate(daiso_list)
         
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=10)
+        async with pooled_session() as session:
+            async def collect(position, daiso):
+                stores, failed = await self._collect_daiso(session, daiso, target_gu, seen_ids)
+                return position, daiso, stores, failed
+            
+            pending = {
+                asyncio.ensure_future(collect(position, daiso))
+                for position, daiso in itertools.islice(queue, max(1, max_in_flight))
+            }
+            try:
+                while pending:
+                    finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in finished:
+                        position, daiso, stores, failed = task.result()
+                        self.stats.stored_count += len(stores)
+                        if sink is not None:
+                            await sink(position, daiso, stores, failed)
+                        else:
+                            all_stores.extend(stores)
+                        done += 1
+                        
+                        if progress_callback:
+                            progress_callback(done, total, daiso.name, len(stores))
+                        
+                        following = next(queue, None)
+                        if following is not None:
+                            pending.add(asyncio.ensure_future(collect(*following)))
+            finally:
+                for task in pending:
+                    task.cancel()
         
-        async with aiohttp.ClientSession(connector=connector) as session:
-            for idx, daiso in enumerate(daiso_list, 1):
-                stores = await self.collect_for_daiso(session, daiso, target_gu)
-                all_stores.extend(stores)
-                self.stats.stored_count += len(stores)
+        return all_stores
+    
+    async def collect_tiles(
+        self,
+        rects: List[str],
+        target_gu: str,
+        progress_callback=None
+    ) -> List[Dict[str, Any]]:
+        """
+        격자 타일 rect 목록 수집 (타일 중심 기준 거리 정렬, 잘린 타일은 4분할)
+        
+        Args:
+            rects: 서로 겹치지 않는 타일 rect 목록
+            target_gu: 타겟 구 이름
+            progress_callback: 진행 상황 콜백 (optional, (완료 수, 전체 수))
+        
+        Returns:
+            타겟 구에 해당하는 편의점 데이터 리스트 (place_id 중복 제거)
+        """
+        total = len(rects)
+        done = 0
+        
+        async def collect_tile(session, index, rect):
+            nonlocal done
+            x1, y1, x2, y2 = parse_rect(rect)
+            try:
+                documents = await self._collect_adaptive(session, rect, (x1 + x2) / 2, (y1 + y2) / 2)
+            except RequestFailedError:
+                self.stats.failed_rects.append(rect)
+                documents = []
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+            return index, documents
+        
+        async with pooled_session() as session:
+            results = await asyncio.gather(*[
+                collect_tile(session, index, rect) for index, rect in enumerate(rects, 1)
+            ])
+        
+        stores = []
+        seen_ids = set()
+        for index, documents in results:
+            for item in documents:
+                place_id = item.get("id")
+                if place_id in seen_ids:
+                    continue
+                seen_ids.add(place_id)
+                
+                address = item.get("road_address_name") or item.get("address_name", "")
+                if target_gu not in address:
+                    self.stats.skipped_count += 1
+                    continue
                 
-                if progress_callback:
-                    progress_callback(idx, total, daiso.name, len(stores))
+                item["_base_daiso"] = f"격자 타일 {index}"
+                item["_target_gu"] = target_gu
+                stores.append(item)
         
-        return all_stores
+        self.stats.stored_count += len(stores)
+        return stores
     
     def get_stats(self) -> Dict[str, Any]:
         """수집 통계 반환"""
@@ -306,11 +715,36 @@ class AsyncKakaoCollector:
             "api_calls": self.stats.api_calls,
             "stored_count": self.stats.stored_count,
             "skipped_count": self.stats.skipped_count,
+            "cache_hits": self.stats.cache_hits,
+            "split_count": self.stats.split_count,
+            "truncated_cells": self.stats.truncated_cells,
+            "retries": self.stats.retries,
+            "throttled": self.stats.throttled,
+            "failed_requests": self.stats.failed_requests,
+            "failed_daiso": list(self.stats.failed_daiso),
+            "failed_rects": list(self.stats.failed_rects),
+            "prefetch_quadrants": self.stats.prefetch_quadrants,
+            "prefetch_extra_calls": self.stats.prefetch_extra_calls,
+            "prefetch_cancelled": self.stats.prefetch_cancelled,
+            "prefetch_saved_seconds": round(self.stats.prefetch_saved_seconds, 2),
+            "rate_limit": self.rate_limiter.bucket.get_stats(),
             "errors": self.stats.errors[:10]  # 최대 10개만
         }
 
 
-def run_async_collection(api_key: str, daiso_list, target_gu: str, radius_km: float = 1.8):
+def run_async_collection(
+    api_key: str,
+    daiso_list,
+    target_gu: str,
+    radius_km: float = 1.8,
+    cache: Optional[KakaoResponseCache] = None,
+    adaptive: bool = False,
+    min_cell_m: float = DEFAULT_MIN_CELL_M,
+    max_in_flight: int = DEFAULT_DAISO_WINDOW,
+    progress_callback=None,
+    speculative: bool = False,
+    sink=None,
+):
     """
     동기 환경에서 비동기 수집 실행 헬퍼
     
@@ -321,23 +755,191 @@ def run_async_collection(api_key: str, daiso_list, target_gu: str, radius_km: fl
         daiso_list: 다이소 QuerySet (내부에서 리스트로 변환됨)
         target_gu: 타겟 구 이름
         radius_km: 탐색 반경
+        cache: 응답 캐시 (None 이면 캐시 미사용)
+        adaptive: 결과가 잘린 rect 4분할 재귀 수집
+        min_cell_m: 적응형 분할 최소 rect 한 변 (m)
+        max_in_flight: 동시에 진행할 다이소 수 (슬라이딩 윈도우)
+        progress_callback: 다이소 완료 콜백 (완료 순서)
+        speculative: 사분면 페이지 선행 요청 (adaptive 가 아닐 때)
+        sink: 동기 콜백 (순번, 다이소, 편의점 리스트, 실패 여부), 완료 순서대로 sync_to_async 로 호출
+              (지정 시 결과를 모으지 않으므로 DB 저장 / 체크포인트는 sink 에서 처리)
     
     Returns:
-        (수집된 편의점 리스트, 통계 딕셔너리)
+        (수집된 편의점 리스트 - sink 지정 시 빈 리스트, 통계 딕셔너리)
     """
     # Django QuerySet을 미리 리스트로 변환 (async context 진입 전)
     daiso_list_evaluated = list(daiso_list)
     
-    collector = AsyncKakaoCollector(api_key, radius_km)
+    collector = AsyncKakaoCollector(
+        api_key, radius_km, cache=cache, adaptive=adaptive, min_cell_m=min_cell_m, speculative=speculative,
+    )
     
-    # 이벤트 루프 실행
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    async def collect():
+        if sink is None:
+            return await collector.collect_all(daiso_list_evaluated, target_gu, progress_callback, max_in_flight)
+        try:
+            return await collector.collect_all(
+                daiso_list_evaluated, target_gu, progress_callback, max_in_flight, sink=sync_to_async(sink),
+            )
+        finally:
+            await sync_to_async(connections.close_all)()  # sink 스레드의 DB 연결 정리
     
+    # 공유 이벤트 루프에서 실행 (호출 간 aiohttp 세션 재사용)
+    stores = run_async(collect())
+    return stores, collector.get_stats()
+
+
+
+def run_grid_collection(
+    api_key: str,
+    rects: List[str],
+    target_gu: str,
+    cache: Optional[KakaoResponseCache] = None,
+    min_cell_m: float = DEFAULT_MIN_CELL_M,
+    progress_callback=None,
+):
+    """
+    동기 환경에서 격자 타일 수집 실행 헬퍼
+
+    Returns:
+        (수집된 편의점 리스트, 통계 딕셔너리)
+    """
+    collector = AsyncKakaoCollector(api_key, cache=cache, adaptive=True, min_cell_m=min_cell_m)
+
+    stores = run_async(collector.collect_tiles(rects, target_gu, progress_callback))
+    return stores, collector.get_stats()
+
+
+async def stream_collection(
+    collector: AsyncKakaoCollector,
+    daiso_list,
+    target_gu: str,
+    write_batch,
+    on_written=None,
+    batch_size: int = DEFAULT_STREAM_BATCH,
+    queue_size: int = DEFAULT_STREAM_QUEUE,
+    max_in_flight: int = DEFAULT_DAISO_WINDOW,
+    progress_callback=None,
+) -> StreamStats:
+    """
+    수집 → 제한 크기 큐 → 배치 저장 스트리밍
+
+    Args:
+        collector: AsyncKakaoCollector
+        daiso_list: 다이소 리스트 (evaluate 된 상태)
+        target_gu: 타겟 구 이름
+        write_batch: 동기 저장 함수 (편의점 리스트 → 저장 건수), sync_to_async 로 스레드에서 실행
+        on_written: 동기 체크포인트 콜백 (연속 완료 다이소 수, 마지막 다이소), 실패 다이소 이후로는 호출 안 함
+        batch_size: 저장 배치 크기 (행)
+        queue_size: 큐 크기 (다이소 단위)
+        max_in_flight: 동시에 진행할 다이소 수
+        progress_callback: collect_all 진행 콜백
+
+    Returns:
+        StreamStats
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=max(1, queue_size))
+    stream = StreamStats()
+    write = sync_to_async(write_batch)
+    written = sync_to_async(on_written) if on_written else None
+    write_intervals = []
+    started = loop.time()
+
+    async def writer():
+        rows, positions = [], []
+        checkpoint = ContiguousCheckpoint()
+
+        async def flush():
+            nonlocal rows, positions
+            if rows:
+                write_started = loop.time()
+                stream.rows_written += await write(rows)
+                write_intervals.append((write_started, loop.time()))
+                stream.batches += 1
+            for position, daiso, failed in positions:
+                checkpoint.mark(position, daiso, failed)
+            rows, positions = [], []
+
+            # 체크포인트: 앞에서부터 연속으로 저장된 다이소까지 (실패 다이소에서 멈춤)
+            advanced = checkpoint.advance()
+            if advanced is not None and written is not None:
+                await written(checkpoint.next_position, advanced)
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                position, daiso, stores, failed = item
+                rows.extend(stores)
+                positions.append((position, daiso, failed))
+                if len(rows) >= batch_size:
+                    await flush()
+            await flush()
+        finally:
+            await sync_to_async(connections.close_all)()  # 저장 스레드의 DB 연결 정리
+
+    writer_task = asyncio.ensure_future(writer())
+
+    async def sink(position, daiso, stores, failed):
+        # 저장이 실패해 writer 가 멈추면 큐가 가득 찬 채로 기다리지 않고 바로 예외 전달
+        put = asyncio.ensure_future(queue.put((position, daiso, stores, failed)))
+        await asyncio.wait({put, writer_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            writer_task.result()
+        stream.max_queue = max(stream.max_queue, queue.qsize())
+
     try:
-        stores = loop.run_until_complete(
-            collector.collect_all(daiso_list_evaluated, target_gu)
-        )
-        return stores, collector.get_stats()
-    finally:
-        loop.close()
+        await collector.collect_all(daiso_list, target_gu, progress_callback, max_in_flight, sink=sink)
+        fetch_ended = loop.time()
+        await queue.put(None)
+        await writer_task
+    except BaseException:
+        writer_task.cancel()
+        raise
+
+    ended = loop.time()
+    stream.fetch_seconds = fetch_ended - started
+    stream.total_seconds = ended - started
+    stream.write_seconds = sum(end - start for start, end in write_intervals)
+    stream.overlap_seconds = sum(max(0.0, min(end, fetch_ended) - start) for start, end in write_intervals)
+    return stream
+
+
+def run_streaming_collection(
+    api_key: str,
+    daiso_list,
+    target_gu: str,
+    write_batch,
+    on_written=None,
+    radius_km: float = 1.8,
+    cache: Optional[KakaoResponseCache] = None,
+    adaptive: bool = False,
+    min_cell_m: float = DEFAULT_MIN_CELL_M,
+    speculative: bool = False,
+    batch_size: int = DEFAULT_STREAM_BATCH,
+    queue_size: int = DEFAULT_STREAM_QUEUE,
+    max_in_flight: int = DEFAULT_DAISO_WINDOW,
+    progress_callback=None,
+):
+    """
+    동기 환경에서 스트리밍 수집 실행 헬퍼 (수집과 DB 저장을 겹쳐 실행)
+
+    Returns:
+        통계 딕셔너리 (get_stats() + 'stream': StreamStats.to_dict())
+    """
+    daiso_list_evaluated = list(daiso_list)
+    collector = AsyncKakaoCollector(
+        api_key, radius_km, cache=cache, adaptive=adaptive, min_cell_m=min_cell_m, speculative=speculative,
+    )
+
+    stream = run_async(stream_collection(
+        collector, daiso_list_evaluated, target_gu, write_batch, on_written,
+        batch_size=batch_size, queue_size=queue_size, max_in_flight=max_in_flight,
+        progress_callback=progress_callback,
+    ))
+    stats = collector.get_stats()
+    stats['stream'] = stream.to_dict()
+    return stats
@@ -0,0 +1,223 @@
+# stores/management/commands/benchmark_gu_indexes.py
+"""
+구 단위 조회 인덱스 벤치마크 (EXPLAIN ANALYZE 인덱스 적용 전/후 비교)
+- 25개 구 규모 합성 데이터를 트랜잭션 안에서 적재하고 측정 후 롤백 (실제 데이터는 변경되지 않음)
+- 0009_gu_indexes 의 gu 인덱스를 DROP 한 상태(전)와 원래 상태(후)의 실행 계획 / 실행 시간 비교
+- 모든 location 컬럼의 GiST 인덱스 존재 확인
+- 측정 중에는 DROP INDEX 때문에 대상 테이블이 잠기므로 운영 DB 에서는 실행하지 말 것
+
+사용법:
+    python manage.py benchmark_gu_indexes
+    python manage.py benchmark_gu_indexes --rows-per-gu 2000 --gu 강남구 --show-plans
+"""
+import random
+import re
+import statistics
+
+from django.apps import apps
+from django.contrib.gis.db import models as gis_models
+from django.contrib.gis.geos import Point
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from stores.models import (
+    SeoulRestaurantLicense,
+    StoreClosureResult,
+    TobaccoRetailLicense,
+    YeongdeungpoConvenience,
+    YeongdeungpoDaiso,
+)
+from .gu_codes import list_supported_gu
+
+
+GU_INDEXED_MODELS = (
+    YeongdeungpoDaiso,
+    YeongdeungpoConvenience,
+    SeoulRestaurantLicense,
+    TobaccoRetailLicense,
+    StoreClosureResult,
+)
+
+# 서울 전역 경계 박스 (합성 좌표용)
+SEOUL_BBOX = (126.76, 37.41, 127.18, 37.70)
+
+# 조회 화면 / 명령에서 실제로 쓰는 구 단위 쿼리
+BENCHMARK_QUERIES = (
+    ('다이소 목록 (v2_3_2)', lambda gu: YeongdeungpoDaiso.objects.filter(gu=gu).order_by('id')),
+    ('편의점 목록 (check_store_closure)', lambda gu: YeongdeungpoConvenience.objects.filter(gu=gu)),
+    ('편의점 인허가 (gu + uptaenm)', lambda gu: SeoulRestaurantLicense.objects.filter(gu=gu, uptaenm='편의점')),
+    ('담배소매업 (check_store_closure)', lambda gu: TobaccoRetailLicense.objects.filter(gu=gu)),
+    ('폐업 건수 (gu + status)', lambda gu: StoreClosureResult.objects.filter(gu=gu, status='폐업')),
+    ('결과 조회 (get_results)', lambda gu: StoreClosureResult.objects.filter(gu=gu).values('place_id', 'name', 'status')),
+)
+
+EXECUTION_TIME_RE = re.compile(r'Execution Time: ([\d.]+) ms')
+SCAN_RE = re.compile(r'((?:Parallel )?(?:Seq|Index Only|Index|Bitmap Heap|Bitmap Index) Scan)')
+
+
+def parse_plan(plan: str):
+    """EXPLAIN ANALYZE 결과 → (첫 스캔 노드 종류, 실행 시간 ms)"""
+    scan = SCAN_RE.search(plan)
+    elapsed = EXECUTION_TIME_RE.search(plan)
+    return (scan.group(1) if scan else '-'), (float(elapsed.group(1)) if elapsed else 0.0)
+
+
+class Command(BaseCommand):
+    help = '구 단위 조회 인덱스 전/후 실행 계획 비교 (합성 25개 구 데이터, 측정 후 롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows-per-gu',
+            type=int,
+            default=400,
+            help='구별 합성 행 수 (테이블별, 기본: 400 → 25개 구 10,000건)'
+        )
+        parser.add_argument(
+            '--gu',
+            type=str,
+            default='영등포구',
+            help='조회 대상 구 (기본: 영등포구)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='쿼리별 반복 측정 횟수 (중앙값 사용, 기본: 5)'
+        )
+        parser.add_argument(
+            '--show-plans',
+            action='store_true',
+            help='전/후 전체 실행 계획 출력'
+        )
+
+    def load_synthetic(self, rows_per_gu, seed=42):
+        """25개 구 합성 데이터 적재 (모델별 적재 건수 반환)"""
+        rng = random.Random(seed)
+        min_x, min_y, max_x, max_y = SEOUL_BBOX
+
+        def point():
+            return Point(rng.uniform(min_x, max_x), rng.uniform(min_y, max_y), srid=4326)
+
+        daiso, convenience, restaurant, tobacco, closure = [], [], [], [], []
+        for gu_index, gu in enumerate(list_supported_gu()):
+            for i in range(max(1, rows_per_gu // 20)):
+                daiso.append(YeongdeungpoDaiso(
+                    name=f'다이소 {gu} {i}', address=f'서울 {gu}', daiso_id=f'bench-{gu_index}-{i}',
+                    gu=gu, location=point(),
+                ))
+            for i in range(rows_per_gu):
+                key = f'bench-{gu_index}-{i}'
+                location = point()
+                convenience.append(YeongdeungpoConvenience(
+                    place_id=key, base_daiso=f'다이소 {gu}', gu=gu, name=f'편의점 {i}',
+                    address=f'서울 {gu} {i}', distance=rng.randint(0, 1800), location=location,
+                ))
+                restaurant.append(SeoulRestaurantLicense(
+                    mgtno=key, gu=gu, bplcnm=f'업소 {i}', location=location,
+                    uptaenm='편의점' if rng.random() < 0.2 else rng.choice(('한식', '커피숍', '분식', '기타')),
+                ))
+                tobacco.append(TobaccoRetailLicense(mgtno=key, gu=gu, bplcnm=f'담배 {i}', location=location))
+                closure.append(StoreClosureResult(
+                    place_id=key, name=f'편의점 {i}', address=f'서울 {gu} {i}', gu=gu, location=location,
+                    status='폐업' if rng.random() < 0.2 else '정상', match_reason='합성 데이터',
+                ))
+
+        counts = {}
+        for model, objs in (
+            (YeongdeungpoDaiso, daiso),
+            (YeongdeungpoConvenience, convenience),
+            (SeoulRestaurantLicense, restaurant),
+            (TobaccoRetailLicense, tobacco),
+            (StoreClosureResult, closure),
+        ):
+            model.objects.bulk_create(objs, batch_size=1000)
+            counts[model._meta.db_table] = len(objs)
+
+        with connection.cursor() as cursor:
+            for model in GU_INDEXED_MODELS:
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+        return counts
+
+    def measure(self, target_gu, repeat):
+        """쿼리별 (스캔 종류, 중앙값 ms, 마지막 실행 계획)"""
+        results = {}
+        for label, build in BENCHMARK_QUERIES:
+            timings, scan, plan = [], '-', ''
+            for _ in range(max(1, repeat)):
+                plan = build(target_gu).explain(analyze=True)
+                scan, elapsed = parse_plan(plan)
+                timings.append(elapsed)
+            results[label] = (scan, statistics.median(timings), plan)
+        return results
+
+    def drop_gu_indexes(self):
+        """0009_gu_indexes 인덱스 DROP (트랜잭션 롤백 시 복구)"""
+        names = [index.name for model in GU_INDEXED_MODELS for index in model._meta.indexes]
+        with connection.cursor() as cursor:
+            for name in names:
+                cursor.execute(f'DROP INDEX IF EXISTS {connection.ops.quote_name(name)}')
+        return names
+
+    def check_gist(self):
+        """location PointField 별 GiST 인덱스 이름 (없으면 None)"""
+        found = {}
+        with connection.cursor() as cursor:
+            for model in apps.get_app_config('stores').get_models():
+                for field in model._meta.concrete_fields:
+                    if not isinstance(field, gis_models.PointField):
+                        continue
+                    cursor.execute(
+                        """
+                        SELECT i.relname
+                        FROM pg_index x
+                        JOIN pg_class i ON i.oid = x.indexrelid
+                        JOIN pg_class t ON t.oid = x.indrelid
+                        JOIN pg_am am ON am.oid = i.relam
+                        JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(x.indkey)
+                        WHERE t.relname = %s AND a.attname = %s AND am.amname = 'gist'
+                        """,
+                        [model._meta.db_table, field.column],
+                    )
+                    row = cursor.fetchone()
+                    found[f'{model._meta.db_table}.{field.column}'] = row[0] if row else None
+        return found
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('EXPLAIN ANALYZE 비교는 PostgreSQL(PostGIS) 에서만 지원합니다.')
+        if options['rows_per_gu'] < 1:
+            raise CommandError('--rows-per-gu 는 1 이상이어야 합니다.')
+
+        target_gu = options['gu']
+        if target_gu not in list_supported_gu():
+            raise CommandError(f"지원하지 않는 구입니다: {target_gu}")
+
+        with transaction.atomic():
+            counts = self.load_synthetic(options['rows_per_gu'])
+            after = self.measure(target_gu, options['repeat'])
+            dropped = self.drop_gu_indexes()
+            before = self.measure(target_gu, options['repeat'])
+            gist = self.check_gist()
+            transaction.set_rollback(True)  # 합성 데이터 / DROP INDEX 모두 되돌림
+
+        loaded = ", ".join(f"{table} {count:,}건" for table, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"""
+--- 📇 구 단위 조회 인덱스 벤치마크 ({target_gu}) ---
+  합성 데이터 (25개 구, 롤백됨): {loaded}
+  비교 인덱스: {", ".join(dropped)}
+        """))
+
+        for label, _ in BENCHMARK_QUERIES:
+            before_scan, before_ms, before_plan = before[label]
+            after_scan, after_ms, after_plan = after[label]
+            speedup = before_ms / after_ms if after_ms else 0.0
+            self.stdout.write(
+                f"  {label}: {before_scan} {before_ms:.3f}ms → {after_scan} {after_ms:.3f}ms (x{speedup:.1f})"
+            )
+            if options['show_plans']:
+                self.stdout.write(f"    [전]\n{before_plan}\n    [후]\n{after_plan}\n")
+
+        missing = [column for column, index in gist.items() if index is None]
+        self.stdout.write(f"\n🗺️ GiST 인덱스: {len(gist) - len(missing)}/{len(gist)}개 location 컬럼 확인")
+        for column in missing:
+            self.stdout.write(self.style.WARNING(f"  ⚠️ GiST 인덱스 없음: {column}"))
@@ -0,0 +1,103 @@
+# stores/management/commands/bulk_upsert.py
+"""
+공용 대량 upsert 모듈
+
+행마다 transaction.atomic() + select_for_update().update_or_create()를 호출하던
+방식을 배치 단위 INSERT ... ON CONFLICT (unique_field) DO UPDATE 로 대체한다.
+(Django bulk_create(update_conflicts=True, unique_fields=[...]))
+
+- 배치당 왕복 2회 (기존 키 조회 1회 + upsert 1회)
+- 신규/업데이트 건수를 그대로 반환하여 기존 로그 메시지 유지
+- 같은 배치 안의 중복 키는 마지막 값만 사용 (ON CONFLICT 는 한 행을 두 번 갱신할 수 없음)
+
+사용법:
+    from .bulk_upsert import bulk_upsert
+
+    created, updated = bulk_upsert(
+        SeoulRestaurantLicense,
+        rows,                    # [{'mgtno': ..., 'bplcnm': ..., ...}, ...]
+        unique_field='mgtno',
+        batch_size=500,
+    )
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import models, transaction
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def default_update_fields(model, unique_field: str) -> List[str]:
+    """
+    ON CONFLICT 시 갱신할 필드 목록
+
+    PK, unique 키, auto_now_add(최초 생성일) 필드는 제외한다.
+    """
+    fields = []
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.name == unique_field:
+            continue
+        if isinstance(field, models.DateTimeField) and field.auto_now_add:
+            continue
+        fields.append(field.name)
+    return fields
+
+
+def bulk_upsert(
+    model,
+    rows: Iterable[Dict],
+    unique_field: str,
+    update_fields: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Tuple[int, int]:
+    """
+    배치 단위 upsert
+
+    Args:
+        model: 대상 모델 클래스
+        rows: 필드명 → 값 딕셔너리 목록 (unique_field 포함)
+        unique_field: 충돌 판정 키 (unique 제약이 있는 필드)
+        update_fields: 충돌 시 갱신할 필드 (기본: default_update_fields)
+        batch_size: 배치 크기
+
+    Returns:
+        (신규 건수, 업데이트 건수)
+    """
+    if update_fields is None:
+        update_fields = default_update_fields(model, unique_field)
+    batch_size = max(1, batch_size)
+
+    # 중복 키 제거 (마지막 값 우선, 최초 등장 순서 유지)
+    deduped = {}
+    for row in rows:
+        key = row.get(unique_field)
+        if not key:
+            continue
+        deduped[key] = row
+    unique_rows = list(deduped.values())
+
+    created_count = 0
+    updated_count = 0
+
+    for offset in range(0, len(unique_rows), batch_size):
+        batch = unique_rows[offset:offset + batch_size]
+        keys = [row[unique_field] for row in batch]
+
+        with transaction.atomic():
+            existing = set(
+                model.objects.filter(**{f'{unique_field}__in': keys})
+                .values_list(unique_field, flat=True)
+            )
+            model.objects.bulk_create(
+                [model(**row) for row in batch],
+                update_conflicts=True,
+                unique_fields=[unique_field],
+                update_fields=update_fields,
+            )
+
+        updated_count += len(existing)
+        created_count += len(batch) - len(existing)
+
+    return created_count, updated_count
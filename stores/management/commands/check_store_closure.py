@@ -11,79 +11,23 @@ public_data.csv (소상공인상권 데이터) (Default)기본값으로 영등
 - 이름이 일치하거나
 - 주소가 일치하거나
 - 위도/경도가 일치하면 → 정상(영업)
+  (--tolerance-m 이내 근접 좌표면 일치, 0이면 소수점 반올림 좌표 완전 일치)
 
 아무것도 일치하지 않으면 → 폐업
 
 --gu 옵션으로 대상 구 지정 가능
+--engine sql: 매칭 + 저장을 PostgreSQL 단일 INSERT ... SELECT ... ON CONFLICT 문으로 실행
 """
 
-import os
-import re
-import pandas as pd
 from django.core.management.base import BaseCommand
 from django.contrib.gis.geos import Point
 from stores.models import SeoulRestaurantLicense, TobaccoRetailLicense, YeongdeungpoConvenience, StoreClosureResult
+from .bulk_upsert import DEFAULT_BATCH_SIZE, bulk_upsert
+from .closure_sql import run_sql_closure
 from .gu_codes import list_supported_gu
-
-
-def normalize_name(name):
-    """이름 정규화: 공백 제거, 소문자, 특수문자 제거"""
-    if not name or pd.isna(name):
-        return ""
-    name = str(name).strip()
-    name = name.replace(" ", "").replace("-", "").replace("_", "")
-    name = name.lower()
-    return name
-
-
-def extract_road_address(address, target_gu='영등포구'):
-    """
-    도로명 주소에서 핵심 부분 추출
-    - 서울특별시/서울시/서울 → 통일
-    - 도로명 + 번호 추출 (예: 양평로 49)
-    - target_gu: 동적으로 구 이름 지정
-    """
-    if not address or pd.isna(address):
-        return ""
-    
-    address = str(address).strip()
-    if address == 'nan':
-        return ""
-    
-    # 서울 표기 통일
-    address = address.replace("서울특별시", "서울")
-    address = address.replace("서울시", "서울")
-    
-    # 도로명 주소 패턴 추출: "~로/길/대로 + 숫자"
-    road_pattern = r'([가-힣]+(?:로|길|대로)[0-9가-힣]*)\s*(\d+(?:-\d+)?)'
-    match = re.search(road_pattern, address)
-    
-    if match:
-        road_name = match.group(1)
-        road_num = match.group(2)
-        
-        # 구 이름 추출 (동적으로 target_gu 사용)
-        gu_pattern = rf'({target_gu})'
-        gu_match = re.search(gu_pattern, address)
-        gu = gu_match.group(1) if gu_match else ""
-        
-        normalized = f"서울 {gu} {road_name} {road_num}".strip()
-        normalized = " ".join(normalized.split())
-        return normalized
-    
-    # 패턴 없으면 정리해서 반환
-    address = re.sub(r'\([^)]*\)', '', address)
-    address = re.sub(r',.*$', '', address)
-    address = " ".join(address.split())
-    return address
-
-
-def round_coord(val, decimals=4):
-    """좌표 반올림"""
-    try:
-        return round(float(val), decimals)
-    except (ValueError, TypeError):
-        return None
+from .normalize import extract_road_address, normalize_name, round_coord
+from .public_data_cache import load_public_data, to_records
+from .spatial_match import DEFAULT_TOLERANCE_M, GridIndex
 
 
 class Command(BaseCommand):
@@ -100,7 +44,13 @@ class Command(BaseCommand):
             '--decimals',
             type=int,
             default=4,
-            help='좌표 비교 시 소수점 자릿수 (기본: 4)'
+            help='좌표 비교 시 소수점 자릿수 (기본: 4, --tolerance-m 0 일 때 사용)'
+        )
+        parser.add_argument(
+            '--tolerance-m',
+            type=float,
+            default=DEFAULT_TOLERANCE_M,
+            help=f'좌표 매칭 허용 거리(m) (기본: {DEFAULT_TOLERANCE_M:g}, 0이면 반올림 좌표 완전 일치)'
         )
         parser.add_argument(
             '--save-db',
@@ -119,10 +69,23 @@ class Command(BaseCommand):
             default=False,
             help='실행 전 해당 구의 기존 데이터 삭제'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'DB 배치 upsert 크기 (기본: {DEFAULT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--engine',
+            choices=['python', 'sql'],
+            default='python',
+            help='매칭 엔진 (python: 집합 비교, sql: PostgreSQL 단일 쿼리) (기본: python)'
+        )
 
     def handle(self, *args, **options):
         target_gu = options['gu']
         decimals = options['decimals']
+        tolerance_m = options['tolerance_m']
         
         self.stdout.write(self.style.SUCCESS("=" * 70))
         self.stdout.write(self.style.SUCCESS(f"🔍 {target_gu} 폐업 매장 체크 프로그램"))
@@ -133,6 +96,10 @@ class Command(BaseCommand):
             deleted_count, _ = StoreClosureResult.objects.filter(gu=target_gu).delete()
             self.stdout.write(self.style.WARNING(f"\n🧹 기존 {target_gu} 데이터 {deleted_count}건 삭제 완료"))
         
+        if options['engine'] == 'sql':
+            self.handle_sql(target_gu, options)
+            return
+        
         # ========================================
         # 1단계: 카카오 API 편의점 데이터 로드 (기준 데이터) - 해당 구만
         # ========================================
@@ -172,6 +139,7 @@ class Command(BaseCommand):
         restaurant_names = set()
         restaurant_addresses = set()
         restaurant_coords = set()
+        restaurant_points = []
         
         for store in restaurant_qs:
             name_norm = normalize_name(store.bplcnm)
@@ -189,6 +157,7 @@ class Command(BaseCommand):
             lng_r = round_coord(store.longitude, decimals)
             if lat_r is not None and lng_r is not None:
                 restaurant_coords.add((lat_r, lng_r))
+                restaurant_points.append((float(store.latitude), float(store.longitude)))
         
         # 2-2. 담배소매점 (TobaccoRetailLicense) - 해당 구만
         tobacco_qs = TobaccoRetailLicense.objects.filter(gu=target_gu)
@@ -197,6 +166,7 @@ class Command(BaseCommand):
         tobacco_names = set()
         tobacco_addresses = set()
         tobacco_coords = set()
+        tobacco_points = []
         
         for store in tobacco_qs:
             name_norm = normalize_name(store.bplcnm)
@@ -214,45 +184,17 @@ class Command(BaseCommand):
             lng_r = round_coord(store.longitude, decimals)
             if lat_r is not None and lng_r is not None:
                 tobacco_coords.add((lat_r, lng_r))
+                tobacco_points.append((float(store.latitude), float(store.longitude)))
         
         # 2-3. public_data.csv (소상공인상권)
-        csv_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'public_data.csv')
-        csv_path = os.path.normpath(csv_path)
-        
-        if not os.path.exists(csv_path):
-            csv_path = os.path.join(os.getcwd(), 'public_data.csv')
-        
-        csv_df = pd.read_csv(csv_path, encoding='cp949')
-        self.stdout.write(f"  ✅ 소상공인상권 CSV: {len(csv_df)}개")
-        
-        csv_names = set()
-        csv_addresses = set()
-        csv_coords = set()
+        #      (정규화 키가 미리 계산된 Parquet 캐시 사용)
+        csv_df = self.load_csv_frame(target_gu, decimals)
         
-        for _, row in csv_df.iterrows():
-            name = str(row['Column2']) if pd.notna(row['Column2']) else ""
-            name_norm = normalize_name(name)
-            if name_norm:
-                csv_names.add(name_norm)
-            
-            road_addr = str(row['Column32']) if pd.notna(row['Column32']) else ""
-            lot_addr = str(row['Column25']) if pd.notna(row['Column25']) else ""
-            
-            if not road_addr or road_addr == 'nan':
-                address = lot_addr
-            else:
-                address = road_addr
-            
-            addr_norm = extract_road_address(address, target_gu)
-            if addr_norm:
-                csv_addresses.add(addr_norm)
-            
-            lat = row['Column39'] if pd.notna(row['Column39']) else None
-            lng = row['Column38'] if pd.notna(row['Column38']) else None
-            lat_r = round_coord(lat, decimals)
-            lng_r = round_coord(lng, decimals)
-            if lat_r is not None and lng_r is not None:
-                csv_coords.add((lat_r, lng_r))
+        csv_names = set(csv_df['name_norm'][csv_df['name_norm'] != ''])
+        csv_addresses = set(csv_df['address_norm'][csv_df['address_norm'] != ''])
+        has_coord = csv_df['lat_round'].notna() & csv_df['lng_round'].notna()
+        csv_coords = set(zip(csv_df['lat_round'][has_coord], csv_df['lng_round'][has_coord]))
+        csv_points = list(zip(csv_df['lat'][has_coord], csv_df['lng'][has_coord]))
         
         # ========================================
         # 3단계: 매칭 수행
@@ -268,6 +210,15 @@ class Command(BaseCommand):
         self.stdout.write(f"  📊 전체 비교 주소: {len(all_addresses)}개")
         self.stdout.write(f"  📊 전체 비교 좌표: {len(all_coords)}개")
         
+        # 좌표 매칭: 허용 거리 기반 격자 해시 (0이면 기존 반올림 완전 일치)
+        coord_index = None
+        if tolerance_m > 0:
+            coord_index = GridIndex(tolerance_m)
+            coord_index.add_many(restaurant_points + tobacco_points + csv_points)
+            self.stdout.write(f"  📍 좌표 매칭: 허용 거리 {tolerance_m:g}m (격자 해시 {coord_index.size}개)")
+        else:
+            self.stdout.write(f"  📍 좌표 매칭: 소수점 {decimals}자리 반올림 완전 일치")
+        
         results = []
         normal_count = 0
         closed_count = 0
@@ -287,8 +238,12 @@ class Command(BaseCommand):
                 match_reasons.append("주소")
             
             # 좌표 매칭
-            coord = (store['lat_round'], store['lng_round'])
-            if coord[0] is not None and coord[1] is not None and coord in all_coords:
+            if coord_index is not None:
+                coord_matched = coord_index.has_neighbor(store['lat'], store['lng'])
+            else:
+                coord = (store['lat_round'], store['lng_round'])
+                coord_matched = coord[0] is not None and coord[1] is not None and coord in all_coords
+            if coord_matched:
                 is_matched = True
                 match_reasons.append("좌표")
             
@@ -326,35 +281,29 @@ class Command(BaseCommand):
         # DB 저장
         save_db = options['save_db'] and not options['no_save_db']
         if save_db:
-            from django.db import transaction
             self.stdout.write("\n💾 [5단계] DB 저장 중...")
-            new_count = 0
-            update_count = 0
+            rows = []
             
             for r in results:
                 lat = r['위도']
                 lng = r['경도']
                 location = Point(lng, lat, srid=4326) if lat and lng else None
-                
-                # Race Condition 방지: transaction.atomic + select_for_update
-                with transaction.atomic():
-                    obj, created = StoreClosureResult.objects.select_for_update().update_or_create(
-                        place_id=r['place_id'],
-                        defaults={
-                            'name': r['이름'],
-                            'address': r['주소'],
-                            'gu': target_gu,  # 구 정보 저장
-                            'latitude': lat,
-                            'longitude': lng,
-                            'location': location,
-                            'status': r['상태'],
-                            'match_reason': r['매칭이유'],
-                        }
-                    )
-                if created:
-                    new_count += 1
-                else:
-                    update_count += 1
+                rows.append({
+                    'place_id': r['place_id'],
+                    'name': r['이름'],
+                    'address': r['주소'],
+                    'gu': target_gu,  # 구 정보 저장
+                    'latitude': lat,
+                    'longitude': lng,
+                    'location': location,
+                    'status': r['상태'],
+                    'match_reason': r['매칭이유'],
+                })
+            
+            # place_id 기준 배치 upsert (INSERT ... ON CONFLICT DO UPDATE)
+            new_count, update_count = bulk_upsert(
+                StoreClosureResult, rows, unique_field='place_id', batch_size=options['batch_size']
+            )
             
             self.stdout.write(self.style.SUCCESS(f"  ✅ DB 저장 완료: 신규 {new_count}건, 업데이트 {update_count}건"))
         
@@ -374,3 +323,67 @@ class Command(BaseCommand):
         self.stdout.write("\n" + "=" * 70)
         self.stdout.write(self.style.SUCCESS("✅ 완료"))
         self.stdout.write("=" * 70)
+
+    def load_csv_frame(self, target_gu, decimals=4):
+        """public_data.csv (소상공인상권) 정규화 DataFrame 로드 (Parquet 캐시)"""
+        csv_df = load_public_data(target_gu, decimals)
+        self.stdout.write(f"  ✅ 소상공인상권 CSV: {len(csv_df)}개")
+        return csv_df
+
+    def load_csv_keys(self, target_gu, decimals=4):
+        """
+        public_data.csv 정규화 키 (SQL 엔진 임시 테이블 적재용)
+
+        Returns:
+            [(이름 정규화, 주소 정규화, 위도, 경도), ...]
+        """
+        csv_df = self.load_csv_frame(target_gu, decimals)
+        return [
+            (row['name_norm'], row['address_norm'], row['lat'], row['lng'])
+            for row in to_records(csv_df[['name_norm', 'address_norm', 'lat', 'lng']])
+        ]
+
+    def handle_sql(self, target_gu, options):
+        """--engine sql: 이름/주소/좌표 OR 매칭 + 저장을 PostgreSQL 단일 문장으로 실행"""
+        save_db = options['save_db'] and not options['no_save_db']
+        tolerance_m = options['tolerance_m']
+        
+        self.stdout.write("\n📥 [1단계] 소상공인상권 CSV 키 로드 (DB 외부 데이터)...")
+        csv_keys = self.load_csv_keys(target_gu, options['decimals'])
+        
+        coord_rule = f"허용 거리 {tolerance_m:g}m" if tolerance_m > 0 else f"소수점 {options['decimals']}자리 반올림 완전 일치"
+        self.stdout.write(f"\n🔎 [2단계] PostgreSQL 매칭 수행 (OR 조건, 좌표: {coord_rule})...")
+        results = run_sql_closure(
+            target_gu, csv_keys, tolerance_m, decimals=options['decimals'], save=save_db
+        )
+        
+        normal_count = sum(1 for r in results if r['status'] == '정상')
+        closed_count = len(results) - normal_count
+        
+        self.stdout.write("\n" + "=" * 70)
+        self.stdout.write(self.style.SUCCESS("🎯 매칭 결과"))
+        self.stdout.write("=" * 70)
+        self.stdout.write(f"  🔵 정상 영업: {normal_count}개")
+        self.stdout.write(f"  🔴 폐업 (카카오맵 업데이트 필요): {closed_count}개")
+        self.stdout.write(f"  📊 전체: {len(results)}개")
+        
+        if save_db:
+            new_count = sum(1 for r in results if r['inserted'])
+            update_count = len(results) - new_count
+            self.stdout.write(self.style.SUCCESS(f"  ✅ DB 저장 완료: 신규 {new_count}건, 업데이트 {update_count}건"))
+        
+        closed_stores = [r for r in results if r['status'] == '폐업']
+        if closed_stores:
+            self.stdout.write("\n" + "-" * 70)
+            self.stdout.write("🔴 폐업 추정 매장 (상위 20개):")
+            self.stdout.write("-" * 70)
+            for i, store in enumerate(closed_stores[:20], 1):
+                self.stdout.write(f"  [{i}] {store['name']}")
+                self.stdout.write(f"      주소: {store['address']}")
+            
+            if len(closed_stores) > 20:
+                self.stdout.write(f"\n  ... 외 {len(closed_stores) - 20}개")
+        
+        self.stdout.write("\n" + "=" * 70)
+        self.stdout.write(self.style.SUCCESS("✅ 완료"))
+        self.stdout.write("=" * 70)
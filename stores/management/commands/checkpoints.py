@@ -0,0 +1,78 @@
+# stores/management/commands/checkpoints.py
+"""
+파이프라인 체크포인트 헬퍼
+
+구별 · 단계별 진행 상태와 단계 내부 진행 위치(cursor)를 DB에 저장하여
+중단된 파이프라인을 실패 지점부터 재개할 수 있도록 한다.
+
+cursor 예시:
+    편의점 수집: {'next_index': 12, 'last_daiso_id': '10234'}  (다음에 처리할 다이소 순번)
+    OpenAPI:     {'next_start': 5001, 'total_count': 18234}      (다음에 조회할 시작 인덱스)
+
+사용법:
+    from .checkpoints import get_cursor, save_cursor
+
+    cursor = get_cursor(target_gu, 'restaurant') if resume else {}
+    start_index = cursor.get('next_start', 1)
+    ...
+    save_cursor(target_gu, 'restaurant', next_start=end_index + 1)
+"""
+
+from stores.models import PipelineCheckpoint
+
+
+def get_checkpoint(gu, stage):
+    """체크포인트 조회 (없으면 None)"""
+    return PipelineCheckpoint.objects.filter(gu=gu, stage=stage).first()
+
+
+def is_completed(gu, stage):
+    """단계 완료 여부"""
+    return PipelineCheckpoint.objects.filter(gu=gu, stage=stage, status='completed').exists()
+
+
+def get_cursor(gu, stage):
+    """단계 내부 진행 위치 조회 (없으면 빈 dict)"""
+    checkpoint = get_checkpoint(gu, stage)
+    return dict(checkpoint.cursor) if checkpoint else {}
+
+
+def save_cursor(gu, stage, **cursor):
+    """단계 내부 진행 위치 저장 (기존 cursor에 병합)"""
+    checkpoint, _ = PipelineCheckpoint.objects.get_or_create(gu=gu, stage=stage)
+    checkpoint.cursor = {**checkpoint.cursor, **cursor}
+    checkpoint.save(update_fields=['cursor', 'updated_at'])
+
+
+def reset_cursor(gu, stage):
+    """단계 내부 진행 위치 초기화 (처음부터 다시 수집할 때)"""
+    PipelineCheckpoint.objects.filter(gu=gu, stage=stage).update(cursor={})
+
+
+def mark_running(gu, stage):
+    """단계 시작 기록"""
+    PipelineCheckpoint.objects.update_or_create(
+        gu=gu, stage=stage,
+        defaults={'status': 'running', 'error': None},
+    )
+
+
+def mark_completed(gu, stage):
+    """단계 완료 기록 (cursor 초기화)"""
+    PipelineCheckpoint.objects.update_or_create(
+        gu=gu, stage=stage,
+        defaults={'status': 'completed', 'cursor': {}, 'error': None},
+    )
+
+
+def mark_failed(gu, stage, error):
+    """단계 실패 기록 (cursor는 유지하여 재개 지점으로 사용)"""
+    PipelineCheckpoint.objects.update_or_create(
+        gu=gu, stage=stage,
+        defaults={'status': 'failed', 'error': str(error)[:1000]},
+    )
+
+
+def reset_checkpoints(gu):
+    """구 전체 체크포인트 삭제 (새로 실행할 때)"""
+    return PipelineCheckpoint.objects.filter(gu=gu).delete()[0]
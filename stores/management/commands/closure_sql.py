@@ -0,0 +1,237 @@
+# stores/management/commands/closure_sql.py
+"""
+폐업 검증 SQL 엔진 (check_store_closure --engine sql)
+
+카카오 편의점 / 휴게음식점 / 담배소매점 행을 Python 으로 읽어 집합을 만드는 대신,
+이름·주소·좌표 OR 매칭과 결과 저장을 PostgreSQL 안에서 한 번의 set-based 문장
+(INSERT ... SELECT ... ON CONFLICT (place_id) DO UPDATE) 으로 처리한다.
+
+- 이름/주소 정규화: check_store_closure.normalize_name / extract_road_address 와 같은 규칙의
+  세션 임시 함수 (pg_temp.closure_name_norm / pg_temp.closure_road_address)
+- 좌표: tolerance_m > 0 이면 ST_DWithin(geography), 0 이면 소수점 반올림 완전 일치
+  (기준점마다 편의점 location GiST 인덱스를 && ST_Expand 상자로 먼저 조회한 뒤 정확한 조건 검사)
+- public_data.csv 는 DB 에 없으므로 정규화 키만 임시 테이블(closure_csv_keys)에 적재 후 조인
+
+사용법:
+    from .closure_sql import run_sql_closure
+
+    rows = run_sql_closure(target_gu, csv_keys, tolerance_m=11, decimals=4, save=True)
+    # [{'place_id', 'name', 'address', 'status', 'match_reason', 'inserted'}, ...]
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection, transaction
+
+from stores.models import (
+    SeoulRestaurantLicense,
+    StoreClosureResult,
+    TobaccoRetailLicense,
+    YeongdeungpoConvenience,
+)
+
+
+# normalize_name 과 같은 규칙: 공백/-/_ 제거 + 소문자
+NAME_NORM_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION pg_temp.closure_name_norm(name text) RETURNS text AS $$
+    SELECT CASE WHEN name IS NULL THEN ''
+                ELSE lower(replace(replace(replace(btrim(name), ' ', ''), '-', ''), '_', ''))
+           END
+$$ LANGUAGE sql IMMUTABLE
+"""
+
+# extract_road_address 와 같은 규칙: 서울 표기 통일 → "서울 {구} {도로명} {번호}" 추출
+ROAD_ADDRESS_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION pg_temp.closure_road_address(addr text, target_gu text) RETURNS text AS $$
+DECLARE
+    normalized text;
+    matched text[];
+    gu text;
+BEGIN
+    normalized := btrim(coalesce(addr, ''));
+    IF normalized = '' OR normalized = 'nan' THEN
+        RETURN '';
+    END IF;
+
+    normalized := replace(replace(normalized, '서울특별시', '서울'), '서울시', '서울');
+    matched := regexp_match(normalized, '([가-힣]+(?:로|길|대로)[0-9가-힣]*)\s*(\d+(?:-\d+)?)');
+
+    IF matched IS NOT NULL THEN
+        gu := CASE WHEN strpos(normalized, target_gu) > 0 THEN target_gu ELSE '' END;
+        RETURN btrim(regexp_replace('서울 ' || gu || ' ' || matched[1] || ' ' || matched[2], '\s+', ' ', 'g'));
+    END IF;
+
+    normalized := regexp_replace(normalized, '\([^)]*\)', '', 'g');
+    normalized := regexp_replace(normalized, ',.*$', '');
+    RETURN btrim(regexp_replace(normalized, '\s+', ' ', 'g'));
+END;
+$$ LANGUAGE plpgsql IMMUTABLE
+"""
+
+# 바깥 트랜잭션(atomic) 안에서 두 번 실행되면 ON COMMIT DROP 전이라 테이블이 남아 있으므로 재사용 후 비움
+CSV_KEYS_TABLE = """
+CREATE TEMP TABLE IF NOT EXISTS closure_csv_keys (
+    name_norm text,
+    address_norm text,
+    lat double precision,
+    lng double precision
+) ON COMMIT DROP
+"""
+
+MATCH_SELECT = """
+WITH kakao AS (
+    SELECT place_id, name, address, location,
+           pg_temp.closure_name_norm(name) AS name_norm,
+           pg_temp.closure_road_address(address, %(gu)s) AS address_norm
+    FROM {kakao_table}
+    WHERE gu = %(gu)s
+),
+licenses AS (
+    SELECT bplcnm, coalesce(nullif(rdnwhladdr, ''), sitewhladdr) AS addr, latitude, longitude
+    FROM {restaurant_table}
+    WHERE gu = %(gu)s AND uptaenm = '편의점'
+    UNION ALL
+    SELECT bplcnm, coalesce(nullif(rdnwhladdr, ''), sitewhladdr) AS addr, latitude, longitude
+    FROM {tobacco_table}
+    WHERE gu = %(gu)s
+),
+ref_names AS (
+    SELECT pg_temp.closure_name_norm(bplcnm) AS key FROM licenses
+    UNION
+    SELECT name_norm FROM closure_csv_keys
+),
+ref_addresses AS (
+    SELECT pg_temp.closure_road_address(addr, %(gu)s) AS key FROM licenses
+    UNION
+    SELECT address_norm FROM closure_csv_keys
+),
+ref_points AS (
+    SELECT latitude AS lat, longitude AS lng FROM licenses
+    WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+    UNION ALL
+    SELECT lat, lng FROM closure_csv_keys
+    WHERE lat IS NOT NULL AND lng IS NOT NULL
+),
+coord_hits AS (
+    -- 기준점 → 편의점 테이블 방향으로 조인해야 k.location 의 GiST 인덱스를 쓸 수 있음
+    SELECT DISTINCT k.place_id
+    FROM ref_points p
+    JOIN {kakao_table} k ON k.gu = %(gu)s AND {coord_condition}
+),
+matched AS (
+    SELECT k.*,
+           (k.name_norm <> '' AND EXISTS (SELECT 1 FROM ref_names n WHERE n.key = k.name_norm)) AS by_name,
+           (k.address_norm <> '' AND EXISTS (SELECT 1 FROM ref_addresses a WHERE a.key = k.address_norm)) AS by_address,
+           EXISTS (SELECT 1 FROM coord_hits c WHERE c.place_id = k.place_id) AS by_coord
+    FROM kakao k
+)
+SELECT place_id, name, address, %(gu)s AS gu,
+       ST_Y(location) AS latitude, ST_X(location) AS longitude, location,
+       CASE WHEN by_name OR by_address OR by_coord THEN '정상' ELSE '폐업' END AS status,
+       coalesce(nullif(concat_ws(', ',
+           CASE WHEN by_name THEN '이름' END,
+           CASE WHEN by_address THEN '주소' END,
+           CASE WHEN by_coord THEN '좌표' END
+       ), ''), '없음') AS match_reason,
+       now() AS checked_at, now() AS created_at
+FROM matched
+"""
+
+METERS_PER_DEG_LAT = 111_320.0
+PREFILTER_PAD = 1.1  # 인덱스 상자 여유 배율 (구면 거리와 도 환산 오차 흡수, 경계 판정은 정확한 조건이 담당)
+
+# 허용 거리(m) 이내: 도 단위 상자(경도 폭은 위도 보정)로 인덱스 조회 후 geography 거리 검사
+COORD_WITHIN = (
+    "k.location && ST_Expand(ST_SetSRID(ST_MakePoint(p.lng, p.lat), 4326), "
+    "%(pad_deg)s / cos(radians(p.lat)), %(pad_deg)s) "
+    "AND ST_DWithin(ST_SetSRID(ST_MakePoint(p.lng, p.lat), 4326)::geography, "
+    "k.location::geography, %(tolerance_m)s)"
+)
+
+# 소수점 반올림 완전 일치 (--tolerance-m 0): 같은 반올림 값이면 좌표 차이는 한 자리 단위 미만
+COORD_ROUNDED = (
+    "k.location && ST_Expand(ST_SetSRID(ST_MakePoint(p.lng, p.lat), 4326), %(pad_deg)s) "
+    "AND round(p.lat::numeric, %(decimals)s) = round(ST_Y(k.location)::numeric, %(decimals)s) "
+    "AND round(p.lng::numeric, %(decimals)s) = round(ST_X(k.location)::numeric, %(decimals)s)"
+)
+
+
+def prefilter_pad(tolerance_m: float, decimals: int) -> float:
+    """인덱스 상자 반경 (도, 위도 방향)"""
+    if tolerance_m > 0:
+        return tolerance_m * PREFILTER_PAD / METERS_PER_DEG_LAT
+    return 10 ** -decimals
+
+
+UPSERT = """
+INSERT INTO {result_table}
+    (place_id, name, address, gu, latitude, longitude, location, status, match_reason, checked_at, created_at)
+{select}
+ON CONFLICT (place_id) DO UPDATE SET
+    name = EXCLUDED.name,
+    address = EXCLUDED.address,
+    gu = EXCLUDED.gu,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    location = EXCLUDED.location,
+    status = EXCLUDED.status,
+    match_reason = EXCLUDED.match_reason,
+    checked_at = EXCLUDED.checked_at
+RETURNING place_id, name, address, status, match_reason, (xmax = 0) AS inserted
+"""
+
+
+def build_statement(tolerance_m: float, save: bool) -> str:
+    """매칭 SQL 생성 (save=True: INSERT ... SELECT ... ON CONFLICT, False: SELECT 만)"""
+    select = MATCH_SELECT.format(
+        kakao_table=YeongdeungpoConvenience._meta.db_table,
+        restaurant_table=SeoulRestaurantLicense._meta.db_table,
+        tobacco_table=TobaccoRetailLicense._meta.db_table,
+        coord_condition=COORD_WITHIN if tolerance_m > 0 else COORD_ROUNDED,
+    )
+    if not save:
+        return select + "ORDER BY place_id"
+    return UPSERT.format(result_table=StoreClosureResult._meta.db_table, select=select)
+
+
+def run_sql_closure(
+    target_gu: str,
+    csv_keys: Iterable[Tuple[str, str, Optional[float], Optional[float]]],
+    tolerance_m: float,
+    decimals: int = 4,
+    save: bool = True,
+) -> List[Dict]:
+    """
+    폐업 검증 SQL 실행
+
+    Args:
+        target_gu: 대상 구
+        csv_keys: public_data.csv 정규화 키 (이름, 주소, 위도, 경도)
+        tolerance_m: 좌표 허용 거리 (0 이면 반올림 완전 일치)
+        decimals: 반올림 자릿수 (tolerance_m == 0 일 때)
+        save: True 면 store_closure_result 에 upsert
+
+    Returns:
+        카카오 편의점별 판정 결과 (save=True 면 inserted 포함)
+    """
+    params = {
+        'gu': target_gu,
+        'tolerance_m': tolerance_m,
+        'decimals': decimals,
+        'pad_deg': prefilter_pad(tolerance_m, decimals),
+    }
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(NAME_NORM_FUNCTION)
+        cursor.execute(ROAD_ADDRESS_FUNCTION)
+        cursor.execute(CSV_KEYS_TABLE)
+        cursor.execute("TRUNCATE closure_csv_keys")
+        cursor.executemany(
+            "INSERT INTO closure_csv_keys (name_norm, address_norm, lat, lng) VALUES (%s, %s, %s, %s)",
+            list(csv_keys),
+        )
+        cursor.execute(build_statement(tolerance_m, save), params)
+        columns = [col[0] for col in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    return rows
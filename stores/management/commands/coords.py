@@ -0,0 +1,56 @@
+# stores/management/commands/coords.py
+"""
+좌표계 변환 모듈 (서울시 OpenAPI TM → WGS84)
+
+서울시 OpenAPI의 X, Y 좌표는 Korea 1985 / Central Belt (EPSG:5174) 좌표계를 사용한다.
+페이지 단위로 X/Y 를 NumPy 배열로 모아 Transformer.transform 1회 호출로 변환한다.
+(행마다 transform + try/except 를 반복하던 방식 대체)
+
+사용법:
+    from .coords import convert_tm_to_wgs84_batch
+
+    lats, lngs = convert_tm_to_wgs84_batch(xs, ys)   # 변환 불가 입력은 NaN
+"""
+
+from typing import Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+from pyproj import Transformer
+
+
+# 좌표계 변환기: Korea 1985 / Central Belt (EPSG:5174) -> WGS84 (EPSG:4326)
+transformer = Transformer.from_crs("EPSG:5174", "EPSG:4326", always_xy=True)
+
+
+def to_float_array(values: Iterable) -> np.ndarray:
+    """문자열/숫자 목록 → float 배열 (공백 허용, 빈 값·숫자 아닌 값은 NaN)"""
+    return pd.to_numeric(pd.Series(list(values), dtype=object), errors='coerce').to_numpy(dtype=float)
+
+
+def convert_tm_to_wgs84_batch(xs: Iterable, ys: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    TM 좌표 배열을 WGS84 위도/경도 배열로 변환
+
+    Returns:
+        (위도 배열, 경도 배열) - 변환할 수 없는 입력 위치는 NaN
+    """
+    x = to_float_array(xs)
+    y = to_float_array(ys)
+    lon, lat = transformer.transform(x, y)
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+
+    # 입력 NaN 또는 변환 결과 inf → NaN
+    invalid = ~(np.isfinite(lat) & np.isfinite(lon))
+    lat[invalid] = np.nan
+    lon[invalid] = np.nan
+    return lat, lon
+
+
+def convert_tm_to_wgs84(x, y):
+    """TM 좌표 1건을 WGS84 위도/경도로 변환 (변환 불가 시 (None, None))"""
+    lats, lngs = convert_tm_to_wgs84_batch([x], [y])
+    if np.isnan(lats[0]):
+        return None, None
+    return float(lats[0]), float(lngs[0])
@@ -0,0 +1,470 @@
+# stores/management/commands/gu_boundaries.py
+"""
+서울 25개 구 경계 폴리곤 + 격자 타일링
+
+경계 데이터는 test_core (최적 반경 산출 테스트)에서 사용하던 것을 옮겨 와 수집기와 공유한다.
+좌표는 (경도, 위도) 순서, area_km2 는 행정구역 공식 면적.
+
+격자 타일링 (v2_3_2_collect_Convenience_Only --strategy grid):
+    다이소 중심 4분면(1.8km) 방식은 이웃 다이소끼리 탐색 영역이 크게 겹쳐
+    같은 편의점을 여러 번 조회한 뒤 seen_ids / upsert 로 버린다.
+    구 경계의 외접 사각형을 tile_km 격자로 나누고 경계 폴리곤과 겹치는 타일만
+    서로 겹치지 않는 rect 로 한 번씩 조회한다.
+
+사용법:
+    from .gu_boundaries import tile_gu
+
+    rects = tile_gu('영등포구', tile_km=1.0)   # ['x1,y1,x2,y2', ...]
+"""
+
+import math
+from typing import List, Tuple
+
+from django.contrib.gis.geos import Polygon
+
+
+DEFAULT_TILE_KM = 1.0
+METERS_PER_DEG_LAT = 111_320.0
+
+SEOUL_GU_BOUNDARIES = {
+    '강남구': {'area_km2': 39.50, 'boundary': [
+        (127.0587, 37.5263), (127.0691, 37.5223), (127.0686, 37.5181), (127.0693, 37.5172),
+        (127.0719, 37.5022), (127.0765, 37.4986), (127.0805, 37.4978), (127.0989, 37.4930),
+        (127.1043, 37.4907), (127.1078, 37.4886), (127.1112, 37.4857), (127.1144, 37.4807),
+        (127.1138, 37.4796), (127.1227, 37.4676), (127.1244, 37.4644), (127.1244, 37.4624),
+        (127.1196, 37.4594), (127.1189, 37.4558), (127.1154, 37.4572), (127.1141, 37.4588),
+        (127.1084, 37.4597), (127.1056, 37.4568), (127.1003, 37.4560), (127.0984, 37.4586),
+        (127.0971, 37.4608), (127.0904, 37.4655), (127.0866, 37.4701), (127.0864, 37.4727),
+        (127.0803, 37.4720), (127.0760, 37.4701), (127.0748, 37.4720), (127.0723, 37.4723),
+        (127.0714, 37.4711), (127.0646, 37.4700), (127.0637, 37.4662), (127.0589, 37.4656),
+        (127.0559, 37.4659), (127.0471, 37.4745), (127.0435, 37.4828), (127.0362, 37.4818),
+        (127.0337, 37.4867), (127.0227, 37.5100), (127.0204, 37.5177), (127.0192, 37.5201),
+        (127.0140, 37.5250), (127.0230, 37.5323), (127.0270, 37.5348), (127.0320, 37.5361),
+        (127.0481, 37.5297), (127.0490, 37.5314), (127.0512, 37.5298), (127.0587, 37.5263)]},
+    '강동구': {'area_km2': 24.59, 'boundary': [
+        (127.1152, 37.5575), (127.1188, 37.5572), (127.1215, 37.5599), (127.1244, 37.5614),
+        (127.1359, 37.5656), (127.1493, 37.5689), (127.1551, 37.5709), (127.1668, 37.5767),
+        (127.1704, 37.5765), (127.1761, 37.5768), (127.1791, 37.5779), (127.1775, 37.5745),
+        (127.1782, 37.5715), (127.1800, 37.5693), (127.1812, 37.5664), (127.1817, 37.5629),
+        (127.1841, 37.5581), (127.1835, 37.5501), (127.1853, 37.5489), (127.1848, 37.5453),
+        (127.1854, 37.5426), (127.1836, 37.5424), (127.1812, 37.5438), (127.1777, 37.5424),
+        (127.1744, 37.5428), (127.1683, 37.5415), (127.1653, 37.5422), (127.1557, 37.5312),
+        (127.1554, 37.5265), (127.1515, 37.5228), (127.1498, 37.5193), (127.1479, 37.5192),
+        (127.1468, 37.5166), (127.1467, 37.5142), (127.1453, 37.5146), (127.1212, 37.5253),
+        (127.1225, 37.5275), (127.1253, 37.5357), (127.1206, 37.5381), (127.1117, 37.5407),
+        (127.1142, 37.5447), (127.1160, 37.5505), (127.1160, 37.5558), (127.1152, 37.5575)]},
+    '강북구': {'area_km2': 23.60, 'boundary': [
+        (127.0104, 37.6819), (127.0107, 37.6769), (127.0140, 37.6765), (127.0160, 37.6726),
+        (127.0187, 37.6699), (127.0206, 37.6672), (127.0178, 37.6639), (127.0173, 37.6588),
+        (127.0160, 37.6562), (127.0147, 37.6494), (127.0153, 37.6477), (127.0177, 37.6463),
+        (127.0223, 37.6463), (127.0266, 37.6447), (127.0295, 37.6423), (127.0348, 37.6388),
+        (127.0366, 37.6351), (127.0391, 37.6340), (127.0406, 37.6311), (127.0436, 37.6285),
+        (127.0500, 37.6241), (127.0521, 37.6216), (127.0489, 37.6197), (127.0461, 37.6159),
+        (127.0420, 37.6128), (127.0389, 37.6097), (127.0325, 37.6063), (127.0323, 37.6095),
+        (127.0285, 37.6099), (127.0243, 37.6085), (127.0214, 37.6110), (127.0169, 37.6128),
+        (127.0128, 37.6137), (127.0106, 37.6157), (127.0096, 37.6182), (127.0100, 37.6211),
+        (127.0021, 37.6230), (126.9987, 37.6263), (126.9961, 37.6272), (126.9953, 37.6292),
+        (126.9934, 37.6292), (126.9877, 37.6327), (126.9867, 37.6338), (126.9883, 37.6374),
+        (126.9854, 37.6408), (126.9871, 37.6432), (126.9858, 37.6470), (126.9833, 37.6495),
+        (126.9817, 37.6521), (126.9821, 37.6538), (126.9871, 37.6565), (126.9903, 37.6610),
+        (126.9949, 37.6622), (126.9958, 37.6651), (126.9962, 37.6694), (126.9951, 37.6748),
+        (126.9938, 37.6767), (126.9960, 37.6775), (127.0000, 37.6810), (127.0057, 37.6823),
+        (127.0104, 37.6819)]},
+    '강서구': {'area_km2': 41.44, 'boundary': [
+        (126.8598, 37.5718), (126.8595, 37.5683), (126.8605, 37.5668), (126.8684, 37.5631),
+        (126.8800, 37.5551), (126.8918, 37.5474), (126.8874, 37.5435), (126.8883, 37.5408),
+        (126.8872, 37.5408), (126.8828, 37.5451), (126.8761, 37.5441), (126.8728, 37.5449),
+        (126.8664, 37.5486), (126.8643, 37.5417), (126.8658, 37.5382), (126.8655, 37.5338),
+        (126.8661, 37.5270), (126.8510, 37.5251), (126.8426, 37.5237), (126.8366, 37.5337),
+        (126.8372, 37.5349), (126.8352, 37.5390), (126.8325, 37.5390), (126.8319, 37.5415),
+        (126.8302, 37.5426), (126.8289, 37.5391), (126.8242, 37.5379), (126.8167, 37.5378),
+        (126.8125, 37.5388), (126.8114, 37.5403), (126.8054, 37.5401), (126.8019, 37.5376),
+        (126.8009, 37.5350), (126.7969, 37.5330), (126.7958, 37.5366), (126.7969, 37.5387),
+        (126.7939, 37.5390), (126.7939, 37.5410), (126.7908, 37.5417), (126.7888, 37.5435),
+        (126.7820, 37.5434), (126.7776, 37.5461), (126.7732, 37.5459), (126.7698, 37.5505),
+        (126.7670, 37.5528), (126.7707, 37.5530), (126.7715, 37.5543), (126.7788, 37.5592),
+        (126.7789, 37.5614), (126.7767, 37.5645), (126.7799, 37.5642), (126.7825, 37.5654),
+        (126.7847, 37.5675), (126.7840, 37.5691), (126.7850, 37.5709), (126.7917, 37.5747),
+        (126.7954, 37.5745), (126.7952, 37.5776), (126.7959, 37.5802), (126.7980, 37.5804),
+        (126.8009, 37.5854), (126.8029, 37.5862), (126.8013, 37.5884), (126.8015, 37.5901),
+        (126.7997, 37.5930), (126.7991, 37.5957), (126.8005, 37.5983), (126.8020, 37.5985),
+        (126.8027, 37.6013), (126.8039, 37.6019), (126.8076, 37.6009), (126.8181, 37.5916),
+        (126.8225, 37.5880), (126.8289, 37.5856), (126.8530, 37.5728), (126.8598, 37.5718)]},
+    '관악구': {'area_km2': 29.57, 'boundary': [
+        (126.9837, 37.4739), (126.9846, 37.4700), (126.9866, 37.4669), (126.9890, 37.4650),
+        (126.9903, 37.4627), (126.9896, 37.4576), (126.9907, 37.4553), (126.9848, 37.4539),
+        (126.9829, 37.4502), (126.9784, 37.4477), (126.9761, 37.4448), (126.9731, 37.4447),
+        (126.9665, 37.4428), (126.9662, 37.4394), (126.9652, 37.4382), (126.9615, 37.4380),
+        (126.9605, 37.4367), (126.9553, 37.4367), (126.9474, 37.4348), (126.9444, 37.4348),
+        (126.9415, 37.4332), (126.9404, 37.4346), (126.9406, 37.4375), (126.9377, 37.4404),
+        (126.9331, 37.4429), (126.9331, 37.4453), (126.9308, 37.4474), (126.9253, 37.4516),
+        (126.9245, 37.4539), (126.9189, 37.4550), (126.9168, 37.4549), (126.9164, 37.4587),
+        (126.9150, 37.4612), (126.9158, 37.4625), (126.9137, 37.4638), (126.9103, 37.4698),
+        (126.9128, 37.4708), (126.9141, 37.4742), (126.9116, 37.4754), (126.9118, 37.4781),
+        (126.9028, 37.4765), (126.9016, 37.4775), (126.9053, 37.4822), (126.9081, 37.4822),
+        (126.9153, 37.4844), (126.9192, 37.4866), (126.9264, 37.4872), (126.9287, 37.4913),
+        (126.9298, 37.4922), (126.9335, 37.4904), (126.9367, 37.4903), (126.9384, 37.4894),
+        (126.9437, 37.4894), (126.9492, 37.4913), (126.9540, 37.4896), (126.9560, 37.4882),
+        (126.9588, 37.4887), (126.9633, 37.4906), (126.9629, 37.4880), (126.9644, 37.4844),
+        (126.9634, 37.4807), (126.9726, 37.4726), (126.9790, 37.4738), (126.9837, 37.4739)]},
+    '광진구': {'area_km2': 17.06, 'boundary': [
+        (127.0807, 37.5691), (127.0855, 37.5686), (127.0933, 37.5668), (127.1016, 37.5697),
+        (127.1030, 37.5708), (127.1063, 37.5681), (127.1055, 37.5669), (127.1041, 37.5596),
+        (127.1033, 37.5572), (127.1127, 37.5570), (127.1152, 37.5575), (127.1160, 37.5558),
+        (127.1160, 37.5505), (127.1142, 37.5447), (127.1117, 37.5407), (127.1048, 37.5312),
+        (127.1009, 37.5248), (127.0944, 37.5240), (127.0864, 37.5216), (127.0797, 37.5208),
+        (127.0750, 37.5209), (127.0691, 37.5223), (127.0587, 37.5263), (127.0690, 37.5444),
+        (127.0758, 37.5566), (127.0742, 37.5572), (127.0807, 37.5691)]},
+    '구로구': {'area_km2': 20.12, 'boundary': [
+        (126.8269, 37.5055), (126.8312, 37.5054), (126.8342, 37.5024), (126.8385, 37.4997),
+        (126.8427, 37.5012), (126.8421, 37.5027), (126.8469, 37.5029), (126.8473, 37.5052),
+        (126.8508, 37.5060), (126.8522, 37.5073), (126.8550, 37.5078), (126.8577, 37.5064),
+        (126.8602, 37.5071), (126.8622, 37.5039), (126.8645, 37.5039), (126.8653, 37.5024),
+        (126.8680, 37.5028), (126.8711, 37.5020), (126.8743, 37.5026), (126.8756, 37.5057),
+        (126.8805, 37.5115), (126.8816, 37.5140), (126.8925, 37.5088), (126.8959, 37.5047),
+        (126.8955, 37.5003), (126.8958, 37.4939), (126.8986, 37.4863), (126.9026, 37.4828),
+        (126.9053, 37.4822), (126.9016, 37.4775), (126.9010, 37.4761), (126.8969, 37.4757),
+        (126.8912, 37.4768), (126.8880, 37.4798), (126.8827, 37.4832), (126.8808, 37.4838),
+        (126.8768, 37.4898), (126.8669, 37.4885), (126.8633, 37.4870), (126.8598, 37.4831),
+        (126.8572, 37.4824), (126.8558, 37.4801), (126.8540, 37.4788), (126.8491, 37.4793),
+        (126.8480, 37.4782), (126.8476, 37.4715), (126.8415, 37.4729), (126.8375, 37.4725),
+        (126.8339, 37.4748), (126.8314, 37.4734), (126.8266, 37.4736), (126.8242, 37.4730),
+        (126.8218, 37.4752), (126.8221, 37.4789), (126.8214, 37.4814), (126.8221, 37.4830),
+        (126.8256, 37.4850), (126.8248, 37.4872), (126.8199, 37.4888), (126.8165, 37.4905),
+        (126.8148, 37.4934), (126.8152, 37.4952), (126.8177, 37.4947), (126.8208, 37.4959),
+        (126.8220, 37.4985), (126.8237, 37.4993), (126.8250, 37.5030), (126.8247, 37.5050),
+        (126.8269, 37.5055)]},
+    '금천구': {'area_km2': 13.01, 'boundary': [
+        (126.9016, 37.4775), (126.9028, 37.4765), (126.9118, 37.4781), (126.9116, 37.4754),
+        (126.9141, 37.4742), (126.9128, 37.4708), (126.9103, 37.4698), (126.9137, 37.4638),
+        (126.9158, 37.4625), (126.9150, 37.4612), (126.9164, 37.4587), (126.9168, 37.4549),
+        (126.9189, 37.4550), (126.9245, 37.4539), (126.9253, 37.4516), (126.9256, 37.4438),
+        (126.9232, 37.4413), (126.9220, 37.4385), (126.9200, 37.4371), (126.9164, 37.4372),
+        (126.9134, 37.4347), (126.9108, 37.4310), (126.9049, 37.4313), (126.9048, 37.4331),
+        (126.9015, 37.4353), (126.9008, 37.4365), (126.9011, 37.4403), (126.9003, 37.4418),
+        (126.8977, 37.4429), (126.8981, 37.4455), (126.8962, 37.4498), (126.8947, 37.4491),
+        (126.8916, 37.4499), (126.8911, 37.4524), (126.8883, 37.4536), (126.8883, 37.4566),
+        (126.8907, 37.4597), (126.8820, 37.4700), (126.8787, 37.4748), (126.8755, 37.4819),
+        (126.8768, 37.4826), (126.8808, 37.4838), (126.8827, 37.4832), (126.8880, 37.4798),
+        (126.8912, 37.4768), (126.8969, 37.4757), (126.9010, 37.4761), (126.9016, 37.4775)]},
+    '노원구': {'area_km2': 35.44, 'boundary': [
+        (127.1078, 37.6180), (127.1036, 37.6170), (127.1019, 37.6153), (127.0983, 37.6143),
+        (127.0913, 37.6170), (127.0880, 37.6175), (127.0833, 37.6163), (127.0735, 37.6128),
+        (127.0701, 37.6128), (127.0673, 37.6114), (127.0641, 37.6116), (127.0563, 37.6174),
+        (127.0521, 37.6216), (127.0500, 37.6241), (127.0460, 37.6306), (127.0471, 37.6341),
+        (127.0523, 37.6420), (127.0570, 37.6380), (127.0580, 37.6432), (127.0564, 37.6481),
+        (127.0562, 37.6530), (127.0537, 37.6578), (127.0534, 37.6609), (127.0509, 37.6663),
+        (127.0512, 37.6703), (127.0526, 37.6746), (127.0540, 37.6820), (127.0529, 37.6842),
+        (127.0567, 37.6865), (127.0589, 37.6868), (127.0637, 37.6860), (127.0672, 37.6871),
+        (127.0715, 37.6916), (127.0750, 37.6917), (127.0795, 37.6936), (127.0839, 37.6936),
+        (127.0864, 37.6912), (127.0883, 37.6875), (127.0971, 37.6864), (127.0984, 37.6830),
+        (127.0948, 37.6788), (127.0939, 37.6764), (127.0957, 37.6738), (127.0966, 37.6707),
+        (127.0977, 37.6700), (127.0980, 37.6674), (127.0962, 37.6635), (127.0985, 37.6591),
+        (127.0979, 37.6567), (127.0885, 37.6527), (127.0950, 37.6521), (127.0962, 37.6500),
+        (127.0944, 37.6471), (127.0969, 37.6428), (127.1002, 37.6423), (127.1027, 37.6429),
+        (127.1101, 37.6419), (127.1141, 37.6374), (127.1145, 37.6324), (127.1131, 37.6278),
+        (127.1074, 37.6241), (127.1074, 37.6224), (127.1056, 37.6201), (127.1078, 37.6180)]},
+    '도봉구': {'area_km2': 20.70, 'boundary': [
+        (127.0529, 37.6842), (127.0540, 37.6820), (127.0526, 37.6746), (127.0512, 37.6703),
+        (127.0509, 37.6663), (127.0534, 37.6609), (127.0537, 37.6578), (127.0562, 37.6530),
+        (127.0564, 37.6481), (127.0580, 37.6432), (127.0570, 37.6380), (127.0523, 37.6420),
+        (127.0471, 37.6341), (127.0460, 37.6306), (127.0436, 37.6311), (127.0391, 37.6340),
+        (127.0366, 37.6351), (127.0348, 37.6388), (127.0295, 37.6423), (127.0266, 37.6447),
+        (127.0223, 37.6463), (127.0177, 37.6463), (127.0153, 37.6477), (127.0147, 37.6494),
+        (127.0160, 37.6562), (127.0173, 37.6588), (127.0178, 37.6639), (127.0206, 37.6672),
+        (127.0187, 37.6699), (127.0160, 37.6726), (127.0140, 37.6765), (127.0107, 37.6769),
+        (127.0104, 37.6819), (127.0102, 37.6844), (127.0110, 37.6919), (127.0141, 37.6955),
+        (127.0165, 37.6955), (127.0180, 37.6983), (127.0214, 37.6986), (127.0242, 37.6968),
+        (127.0270, 37.6967), (127.0302, 37.6978), (127.0313, 37.6962), (127.0318, 37.6934),
+        (127.0333, 37.6901), (127.0345, 37.6890), (127.0379, 37.6894), (127.0438, 37.6926),
+        (127.0451, 37.6910), (127.0477, 37.6896), (127.0511, 37.6912), (127.0529, 37.6842)]},
+    '동대문구': {'area_km2': 14.22, 'boundary': [
+        (127.0253, 37.5752), (127.0312, 37.5796), (127.0385, 37.5871), (127.0412, 37.5885),
+        (127.0427, 37.5924), (127.0461, 37.5935), (127.0498, 37.5935), (127.0524, 37.5983),
+        (127.0541, 37.5972), (127.0595, 37.5987), (127.0613, 37.5982), (127.0642, 37.6023),
+        (127.0675, 37.6027), (127.0708, 37.6041), (127.0707, 37.6065), (127.0726, 37.6065),
+        (127.0738, 37.6040), (127.0748, 37.6000), (127.0746, 37.5983), (127.0722, 37.5954),
+        (127.0715, 37.5934), (127.0733, 37.5860), (127.0791, 37.5786), (127.0803, 37.5752),
+        (127.0807, 37.5691), (127.0742, 37.5572), (127.0729, 37.5578), (127.0615, 37.5594),
+        (127.0603, 37.5599), (127.0501, 37.5676), (127.0443, 37.5702), (127.0400, 37.5701),
+        (127.0348, 37.5675), (127.0318, 37.5671), (127.0255, 37.5689), (127.0253, 37.5752)]},
+    '동작구': {'area_km2': 16.35, 'boundary': [
+        (126.9822, 37.5093), (126.9824, 37.5012), (126.9832, 37.4995), (126.9872, 37.4972),
+        (126.9850, 37.4936), (126.9837, 37.4739), (126.9790, 37.4738), (126.9726, 37.4726),
+        (126.9634, 37.4807), (126.9644, 37.4844), (126.9629, 37.4880), (126.9633, 37.4906),
+        (126.9588, 37.4887), (126.9560, 37.4882), (126.9540, 37.4896), (126.9492, 37.4913),
+        (126.9437, 37.4894), (126.9384, 37.4894), (126.9367, 37.4903), (126.9335, 37.4904),
+        (126.9298, 37.4922), (126.9287, 37.4913), (126.9264, 37.4872), (126.9192, 37.4866),
+        (126.9153, 37.4844), (126.9081, 37.4822), (126.9053, 37.4822), (126.9146, 37.4936),
+        (126.9218, 37.4949), (126.9232, 37.4993), (126.9275, 37.5099), (126.9292, 37.5102),
+        (126.9281, 37.5133), (126.9345, 37.5129), (126.9441, 37.5146), (126.9525, 37.5172),
+        (126.9555, 37.5147), (126.9595, 37.5125), (126.9667, 37.5100), (126.9822, 37.5093)]},
+    '마포구': {'area_km2': 23.84, 'boundary': [
+        (126.9052, 37.5741), (126.9037, 37.5727), (126.9069, 37.5706), (126.9219, 37.5639),
+        (126.9278, 37.5625), (126.9303, 37.5605), (126.9288, 37.5582), (126.9287, 37.5560),
+        (126.9390, 37.5523), (126.9431, 37.5536), (126.9592, 37.5547), (126.9608, 37.5539),
+        (126.9636, 37.5561), (126.9652, 37.5536), (126.9638, 37.5525), (126.9645, 37.5487),
+        (126.9660, 37.5469), (126.9640, 37.5458), (126.9623, 37.5435), (126.9606, 37.5427),
+        (126.9593, 37.5390), (126.9534, 37.5335), (126.9472, 37.5321), (126.9457, 37.5266),
+        (126.9368, 37.5334), (126.9313, 37.5342), (126.9083, 37.5392), (126.9028, 37.5413),
+        (126.8918, 37.5474), (126.8800, 37.5551), (126.8684, 37.5631), (126.8605, 37.5668),
+        (126.8595, 37.5683), (126.8598, 37.5718), (126.8599, 37.5728), (126.8638, 37.5731),
+        (126.8656, 37.5739), (126.8677, 37.5727), (126.8701, 37.5746), (126.8728, 37.5750),
+        (126.8780, 37.5768), (126.8792, 37.5797), (126.8788, 37.5813), (126.8811, 37.5838),
+        (126.8824, 37.5868), (126.8843, 37.5881), (126.8915, 37.5820), (126.8953, 37.5794),
+        (126.8974, 37.5787), (126.9002, 37.5755), (126.9037, 37.5731), (126.9052, 37.5741)]},
+    '서대문구': {'area_km2': 17.61, 'boundary': [
+        (126.9525, 37.6051), (126.9548, 37.6038), (126.9556, 37.6018), (126.9548, 37.5976),
+        (126.9562, 37.5958), (126.9592, 37.5955), (126.9584, 37.5924), (126.9604, 37.5887),
+        (126.9605, 37.5872), (126.9588, 37.5819), (126.9618, 37.5797), (126.9579, 37.5779),
+        (126.9557, 37.5761), (126.9687, 37.5631), (126.9717, 37.5592), (126.9690, 37.5585),
+        (126.9657, 37.5565), (126.9636, 37.5561), (126.9608, 37.5539), (126.9592, 37.5547),
+        (126.9431, 37.5536), (126.9390, 37.5523), (126.9287, 37.5560), (126.9288, 37.5582),
+        (126.9303, 37.5605), (126.9278, 37.5625), (126.9219, 37.5639), (126.9069, 37.5706),
+        (126.9037, 37.5727), (126.9052, 37.5741), (126.9146, 37.5832), (126.9183, 37.5828),
+        (126.9179, 37.5803), (126.9244, 37.5812), (126.9260, 37.5844), (126.9282, 37.5844),
+        (126.9302, 37.5856), (126.9300, 37.5877), (126.9310, 37.5900), (126.9358, 37.5936),
+        (126.9428, 37.5959), (126.9436, 37.6003), (126.9445, 37.6020), (126.9470, 37.6020),
+        (126.9492, 37.6051), (126.9525, 37.6051)]},
+    '서초구': {'area_km2': 47.00, 'boundary': [
+        (127.0140, 37.5250), (127.0192, 37.5201), (127.0204, 37.5177), (127.0227, 37.5100),
+        (127.0337, 37.4867), (127.0362, 37.4818), (127.0435, 37.4828), (127.0471, 37.4745),
+        (127.0559, 37.4659), (127.0589, 37.4656), (127.0637, 37.4662), (127.0646, 37.4700),
+        (127.0714, 37.4711), (127.0723, 37.4723), (127.0748, 37.4720), (127.0760, 37.4701),
+        (127.0803, 37.4720), (127.0864, 37.4727), (127.0866, 37.4701), (127.0904, 37.4655),
+        (127.0971, 37.4608), (127.0984, 37.4586), (127.0967, 37.4560), (127.0972, 37.4537),
+        (127.0958, 37.4533), (127.0947, 37.4509), (127.0929, 37.4500), (127.0905, 37.4464),
+        (127.0905, 37.4430), (127.0862, 37.4412), (127.0844, 37.4384), (127.0769, 37.4396),
+        (127.0738, 37.4390), (127.0741, 37.4372), (127.0767, 37.4360), (127.0760, 37.4343),
+        (127.0736, 37.4332), (127.0727, 37.4294), (127.0734, 37.4281), (127.0689, 37.4273),
+        (127.0678, 37.4262), (127.0632, 37.4273), (127.0600, 37.4273), (127.0542, 37.4257),
+        (127.0520, 37.4275), (127.0496, 37.4280), (127.0485, 37.4307), (127.0419, 37.4357),
+        (127.0380, 37.4363), (127.0375, 37.4384), (127.0403, 37.4419), (127.0396, 37.4436),
+        (127.0399, 37.4466), (127.0383, 37.4488), (127.0392, 37.4518), (127.0388, 37.4538),
+        (127.0370, 37.4554), (127.0357, 37.4587), (127.0368, 37.4610), (127.0334, 37.4630),
+        (127.0282, 37.4557), (127.0226, 37.4534), (127.0183, 37.4526), (127.0132, 37.4526),
+        (127.0111, 37.4546), (127.0084, 37.4594), (127.0074, 37.4598), (127.0055, 37.4645),
+        (127.0001, 37.4646), (126.9984, 37.4639), (126.9993, 37.4611), (126.9989, 37.4594),
+        (126.9953, 37.4586), (126.9907, 37.4553), (126.9896, 37.4576), (126.9903, 37.4627),
+        (126.9890, 37.4650), (126.9866, 37.4669), (126.9846, 37.4700), (126.9837, 37.4739),
+        (126.9850, 37.4936), (126.9872, 37.4972), (126.9832, 37.4995), (126.9824, 37.5012),
+        (126.9822, 37.5093), (126.9846, 37.5107), (126.9895, 37.5109), (126.9915, 37.5099),
+        (127.0001, 37.5139), (127.0058, 37.5169), (127.0082, 37.5188), (127.0102, 37.5220),
+        (127.0140, 37.5250)]},
+    '성동구': {'area_km2': 16.86, 'boundary': [
+        (127.0255, 37.5689), (127.0318, 37.5671), (127.0348, 37.5675), (127.0400, 37.5701),
+        (127.0443, 37.5702), (127.0501, 37.5676), (127.0603, 37.5599), (127.0615, 37.5594),
+        (127.0729, 37.5578), (127.0742, 37.5572), (127.0758, 37.5566), (127.0690, 37.5444),
+        (127.0587, 37.5263), (127.0512, 37.5298), (127.0490, 37.5314), (127.0481, 37.5297),
+        (127.0320, 37.5361), (127.0270, 37.5348), (127.0230, 37.5323), (127.0169, 37.5361),
+        (127.0116, 37.5368), (127.0104, 37.5391), (127.0107, 37.5412), (127.0117, 37.5453),
+        (127.0138, 37.5457), (127.0189, 37.5506), (127.0195, 37.5532), (127.0217, 37.5547),
+        (127.0250, 37.5551), (127.0258, 37.5584), (127.0284, 37.5602), (127.0288, 37.5622),
+        (127.0257, 37.5624), (127.0255, 37.5689)]},
+    '성북구': {'area_km2': 24.57, 'boundary': [
+        (126.9772, 37.6286), (126.9794, 37.6307), (126.9836, 37.6319), (126.9867, 37.6338),
+        (126.9877, 37.6327), (126.9934, 37.6292), (126.9953, 37.6292), (126.9961, 37.6272),
+        (126.9987, 37.6263), (127.0021, 37.6230), (127.0100, 37.6211), (127.0096, 37.6182),
+        (127.0106, 37.6157), (127.0128, 37.6137), (127.0169, 37.6128), (127.0214, 37.6110),
+        (127.0243, 37.6085), (127.0285, 37.6099), (127.0323, 37.6095), (127.0325, 37.6063),
+        (127.0389, 37.6097), (127.0420, 37.6128), (127.0461, 37.6159), (127.0489, 37.6197),
+        (127.0521, 37.6216), (127.0563, 37.6174), (127.0641, 37.6116), (127.0673, 37.6114),
+        (127.0701, 37.6128), (127.0735, 37.6128), (127.0738, 37.6040), (127.0726, 37.6065),
+        (127.0707, 37.6065), (127.0708, 37.6041), (127.0675, 37.6027), (127.0642, 37.6023),
+        (127.0613, 37.5982), (127.0595, 37.5987), (127.0541, 37.5972), (127.0524, 37.5983),
+        (127.0498, 37.5935), (127.0461, 37.5935), (127.0427, 37.5924), (127.0412, 37.5885),
+        (127.0385, 37.5871), (127.0312, 37.5796), (127.0253, 37.5752), (127.0095, 37.5777),
+        (127.0091, 37.5793), (127.0091, 37.5825), (127.0080, 37.5841), (127.0045, 37.5863),
+        (127.0030, 37.5896), (126.9977, 37.5894), (126.9965, 37.5885), (126.9935, 37.5886),
+        (126.9886, 37.5897), (126.9860, 37.5911), (126.9841, 37.5931), (126.9837, 37.5964),
+        (126.9870, 37.5966), (126.9898, 37.5984), (126.9880, 37.6043), (126.9891, 37.6078),
+        (126.9888, 37.6119), (126.9849, 37.6139), (126.9830, 37.6200), (126.9813, 37.6218),
+        (126.9816, 37.6264), (126.9788, 37.6261), (126.9772, 37.6286)]},
+    '송파구': {'area_km2': 33.88, 'boundary': [
+        (127.0691, 37.5223), (127.0750, 37.5209), (127.0797, 37.5208), (127.0864, 37.5216),
+        (127.0944, 37.5240), (127.1009, 37.5248), (127.1048, 37.5312), (127.1117, 37.5407),
+        (127.1206, 37.5381), (127.1253, 37.5357), (127.1225, 37.5275), (127.1212, 37.5253),
+        (127.1453, 37.5146), (127.1467, 37.5142), (127.1467, 37.5128), (127.1446, 37.5115),
+        (127.1432, 37.5095), (127.1421, 37.5058), (127.1432, 37.5026), (127.1474, 37.5007),
+        (127.1498, 37.5005), (127.1522, 37.5017), (127.1540, 37.5003), (127.1609, 37.4989),
+        (127.1635, 37.4974), (127.1620, 37.4940), (127.1622, 37.4916), (127.1604, 37.4878),
+        (127.1589, 37.4861), (127.1539, 37.4848), (127.1515, 37.4775), (127.1515, 37.4756),
+        (127.1486, 37.4738), (127.1442, 37.4737), (127.1411, 37.4706), (127.1363, 37.4721),
+        (127.1328, 37.4726), (127.1331, 37.4689), (127.1375, 37.4665), (127.1348, 37.4651),
+        (127.1308, 37.4651), (127.1273, 37.4667), (127.1273, 37.4642), (127.1244, 37.4624),
+        (127.1244, 37.4644), (127.1227, 37.4676), (127.1138, 37.4796), (127.1144, 37.4807),
+        (127.1112, 37.4857), (127.1078, 37.4886), (127.1043, 37.4907), (127.0989, 37.4930),
+        (127.0805, 37.4978), (127.0765, 37.4986), (127.0719, 37.5022), (127.0693, 37.5172),
+        (127.0686, 37.5181), (127.0691, 37.5223)]},
+    '양천구': {'area_km2': 17.41, 'boundary': [
+        (126.8242, 37.5379), (126.8289, 37.5391), (126.8302, 37.5426), (126.8319, 37.5415),
+        (126.8325, 37.5390), (126.8352, 37.5390), (126.8372, 37.5349), (126.8366, 37.5337),
+        (126.8426, 37.5237), (126.8510, 37.5251), (126.8661, 37.5270), (126.8655, 37.5338),
+        (126.8658, 37.5382), (126.8643, 37.5417), (126.8664, 37.5486), (126.8728, 37.5449),
+        (126.8761, 37.5441), (126.8828, 37.5451), (126.8872, 37.5408), (126.8883, 37.5408),
+        (126.8894, 37.5406), (126.8934, 37.5330), (126.8936, 37.5303), (126.8921, 37.5276),
+        (126.8906, 37.5279), (126.8888, 37.5259), (126.8838, 37.5235), (126.8826, 37.5224),
+        (126.8819, 37.5194), (126.8816, 37.5140), (126.8805, 37.5115), (126.8756, 37.5057),
+        (126.8743, 37.5026), (126.8711, 37.5020), (126.8680, 37.5028), (126.8653, 37.5024),
+        (126.8645, 37.5039), (126.8622, 37.5039), (126.8602, 37.5071), (126.8577, 37.5064),
+        (126.8550, 37.5078), (126.8522, 37.5073), (126.8508, 37.5060), (126.8473, 37.5052),
+        (126.8469, 37.5029), (126.8421, 37.5027), (126.8427, 37.5012), (126.8385, 37.4997),
+        (126.8342, 37.5024), (126.8312, 37.5054), (126.8269, 37.5055), (126.8261, 37.5078),
+        (126.8267, 37.5104), (126.8253, 37.5134), (126.8276, 37.5169), (126.8274, 37.5200),
+        (126.8305, 37.5239), (126.8294, 37.5268), (126.8277, 37.5271), (126.8239, 37.5320),
+        (126.8242, 37.5379)]},
+    '영등포구': {'area_km2': 24.53, 'boundary': [
+        (126.8918, 37.5474), (126.9028, 37.5413), (126.9083, 37.5392), (126.9313, 37.5342),
+        (126.9368, 37.5334), (126.9457, 37.5266), (126.9488, 37.5242), (126.9500, 37.5208),
+        (126.9525, 37.5172), (126.9441, 37.5146), (126.9345, 37.5129), (126.9281, 37.5133),
+        (126.9292, 37.5102), (126.9275, 37.5099), (126.9232, 37.4993), (126.9218, 37.4949),
+        (126.9146, 37.4936), (126.9053, 37.4822), (126.9026, 37.4828), (126.8986, 37.4863),
+        (126.8958, 37.4939), (126.8955, 37.5003), (126.8959, 37.5047), (126.8925, 37.5088),
+        (126.8816, 37.5140), (126.8819, 37.5194), (126.8826, 37.5224), (126.8838, 37.5235),
+        (126.8888, 37.5259), (126.8906, 37.5279), (126.8921, 37.5276), (126.8936, 37.5303),
+        (126.8934, 37.5330), (126.8894, 37.5406), (126.8883, 37.5408), (126.8874, 37.5435),
+        (126.8918, 37.5474)]},
+    '용산구': {'area_km2': 21.87, 'boundary': [
+        (127.0107, 37.5412), (127.0104, 37.5391), (127.0116, 37.5368), (127.0169, 37.5361),
+        (127.0230, 37.5323), (127.0140, 37.5250), (127.0102, 37.5220), (127.0082, 37.5188),
+        (127.0058, 37.5169), (127.0001, 37.5139), (126.9915, 37.5099), (126.9895, 37.5109),
+        (126.9846, 37.5107), (126.9822, 37.5093), (126.9667, 37.5100), (126.9595, 37.5125),
+        (126.9555, 37.5147), (126.9525, 37.5172), (126.9500, 37.5208), (126.9457, 37.5266),
+        (126.9472, 37.5321), (126.9534, 37.5335), (126.9593, 37.5390), (126.9606, 37.5427),
+        (126.9623, 37.5435), (126.9640, 37.5458), (126.9660, 37.5469), (126.9645, 37.5487),
+        (126.9678, 37.5513), (126.9743, 37.5511), (126.9793, 37.5503), (126.9793, 37.5522),
+        (126.9826, 37.5506), (126.9858, 37.5502), (126.9875, 37.5509), (126.9899, 37.5487),
+        (126.9924, 37.5486), (126.9974, 37.5444), (127.0006, 37.5471), (127.0048, 37.5468),
+        (127.0063, 37.5476), (127.0069, 37.5434), (127.0094, 37.5410), (127.0107, 37.5412)]},
+    '은평구': {'area_km2': 29.71, 'boundary': [
+        (126.9739, 37.6295), (126.9714, 37.6274), (126.9616, 37.6257), (126.9589, 37.6226),
+        (126.9543, 37.6220), (126.9539, 37.6188), (126.9528, 37.6161), (126.9515, 37.6149),
+        (126.9525, 37.6133), (126.9531, 37.6093), (126.9519, 37.6060), (126.9525, 37.6051),
+        (126.9492, 37.6051), (126.9470, 37.6020), (126.9445, 37.6020), (126.9436, 37.6003),
+        (126.9428, 37.5959), (126.9358, 37.5936), (126.9310, 37.5900), (126.9300, 37.5877),
+        (126.9302, 37.5856), (126.9282, 37.5844), (126.9260, 37.5844), (126.9244, 37.5812),
+        (126.9179, 37.5803), (126.9183, 37.5828), (126.9146, 37.5832), (126.9052, 37.5741),
+        (126.9037, 37.5731), (126.9002, 37.5755), (126.8974, 37.5787), (126.8953, 37.5794),
+        (126.8843, 37.5881), (126.8872, 37.5910), (126.8894, 37.5910), (126.8875, 37.5883),
+        (126.8894, 37.5858), (126.8935, 37.5857), (126.8953, 37.5864), (126.8991, 37.5858),
+        (126.9019, 37.5871), (126.9011, 37.5899), (126.9040, 37.5923), (126.9032, 37.5945),
+        (126.9036, 37.5966), (126.9024, 37.6004), (126.9042, 37.6010), (126.9040, 37.6072),
+        (126.9030, 37.6100), (126.9055, 37.6160), (126.9072, 37.6165), (126.9094, 37.6191),
+        (126.9085, 37.6212), (126.9108, 37.6234), (126.9112, 37.6256), (126.9086, 37.6297),
+        (126.9130, 37.6331), (126.9123, 37.6359), (126.9138, 37.6382), (126.9146, 37.6415),
+        (126.9097, 37.6435), (126.9104, 37.6447), (126.9160, 37.6419), (126.9234, 37.6428),
+        (126.9275, 37.6447), (126.9310, 37.6472), (126.9366, 37.6478), (126.9391, 37.6491),
+        (126.9425, 37.6538), (126.9457, 37.6554), (126.9494, 37.6561), (126.9498, 37.6546),
+        (126.9533, 37.6522), (126.9565, 37.6525), (126.9589, 37.6499), (126.9597, 37.6464),
+        (126.9622, 37.6455), (126.9642, 37.6407), (126.9665, 37.6403), (126.9709, 37.6359),
+        (126.9709, 37.6337), (126.9739, 37.6295)]},
+    '종로구': {'area_km2': 23.91, 'boundary': [
+        (126.9739, 37.6295), (126.9772, 37.6286), (126.9788, 37.6261), (126.9816, 37.6264),
+        (126.9813, 37.6218), (126.9830, 37.6200), (126.9849, 37.6139), (126.9888, 37.6119),
+        (126.9891, 37.6078), (126.9880, 37.6043), (126.9898, 37.5984), (126.9870, 37.5966),
+        (126.9837, 37.5964), (126.9841, 37.5931), (126.9860, 37.5911), (126.9886, 37.5897),
+        (126.9935, 37.5886), (126.9965, 37.5885), (126.9977, 37.5894), (127.0030, 37.5896),
+        (127.0045, 37.5863), (127.0080, 37.5841), (127.0091, 37.5825), (127.0091, 37.5793),
+        (127.0095, 37.5777), (127.0253, 37.5752), (127.0225, 37.5689), (127.0179, 37.5670),
+        (127.0037, 37.5668), (126.9988, 37.5659), (126.9910, 37.5653), (126.9799, 37.5664),
+        (126.9750, 37.5664), (126.9711, 37.5654), (126.9687, 37.5631), (126.9557, 37.5761),
+        (126.9579, 37.5779), (126.9618, 37.5797), (126.9588, 37.5819), (126.9605, 37.5872),
+        (126.9604, 37.5887), (126.9584, 37.5924), (126.9592, 37.5955), (126.9562, 37.5958),
+        (126.9548, 37.5976), (126.9556, 37.6018), (126.9548, 37.6038), (126.9525, 37.6051),
+        (126.9519, 37.6060), (126.9531, 37.6093), (126.9525, 37.6133), (126.9515, 37.6149),
+        (126.9528, 37.6161), (126.9539, 37.6188), (126.9543, 37.6220), (126.9589, 37.6226),
+        (126.9616, 37.6257), (126.9714, 37.6274), (126.9739, 37.6295)]},
+    '중구': {'area_km2': 9.96, 'boundary': [
+        (127.0255, 37.5689), (127.0257, 37.5624), (127.0288, 37.5622), (127.0284, 37.5602),
+        (127.0258, 37.5584), (127.0250, 37.5551), (127.0217, 37.5547), (127.0195, 37.5532),
+        (127.0189, 37.5506), (127.0138, 37.5457), (127.0117, 37.5453), (127.0107, 37.5412),
+        (127.0094, 37.5410), (127.0069, 37.5434), (127.0063, 37.5476), (127.0048, 37.5468),
+        (127.0006, 37.5471), (126.9974, 37.5444), (126.9924, 37.5486), (126.9899, 37.5487),
+        (126.9875, 37.5509), (126.9858, 37.5502), (126.9826, 37.5506), (126.9793, 37.5522),
+        (126.9793, 37.5503), (126.9743, 37.5511), (126.9678, 37.5513), (126.9638, 37.5525),
+        (126.9652, 37.5536), (126.9636, 37.5561), (126.9657, 37.5565), (126.9690, 37.5585),
+        (126.9717, 37.5592), (126.9687, 37.5631), (126.9711, 37.5654), (126.9750, 37.5664),
+        (126.9799, 37.5664), (126.9910, 37.5653), (126.9988, 37.5659), (127.0037, 37.5668),
+        (127.0179, 37.5670), (127.0225, 37.5689), (127.0255, 37.5689)]},
+    '중랑구': {'area_km2': 18.50, 'boundary': [
+        (127.0735, 37.6128), (127.0833, 37.6163), (127.0880, 37.6175), (127.0913, 37.6170),
+        (127.0983, 37.6143), (127.1019, 37.6153), (127.1036, 37.6170), (127.1078, 37.6180),
+        (127.1135, 37.6179), (127.1192, 37.6150), (127.1188, 37.6134), (127.1197, 37.6089),
+        (127.1188, 37.6061), (127.1204, 37.6048), (127.1201, 37.6018), (127.1159, 37.5972),
+        (127.1162, 37.5962), (127.1205, 37.5922), (127.1199, 37.5912), (127.1155, 37.5905),
+        (127.1126, 37.5864), (127.1114, 37.5819), (127.1036, 37.5810), (127.1049, 37.5790),
+        (127.1048, 37.5755), (127.1032, 37.5729), (127.1030, 37.5708), (127.1016, 37.5697),
+        (127.0933, 37.5668), (127.0855, 37.5686), (127.0807, 37.5691), (127.0803, 37.5752),
+        (127.0791, 37.5786), (127.0733, 37.5860), (127.0715, 37.5934), (127.0722, 37.5954),
+        (127.0746, 37.5983), (127.0748, 37.6000), (127.0738, 37.6040), (127.0735, 37.6128)]},
+}
+
+
+def get_boundary(gu_name: str) -> List[Tuple[float, float]]:
+    """구 경계 좌표 목록 (경도, 위도), 없는 구는 ValueError"""
+    try:
+        return SEOUL_GU_BOUNDARIES[gu_name]['boundary']
+    except KeyError:
+        raise ValueError(f"경계 데이터가 없는 구입니다: {gu_name}")
+
+
+def boundary_polygon(gu_name: str) -> Polygon:
+    """구 경계 GEOS 폴리곤 (SRID 4326)"""
+    coords = list(get_boundary(gu_name))
+    if coords[0] != coords[-1]:
+        coords.append(coords[0])
+    return Polygon(coords, srid=4326)
+
+
+def grid_spec(gu_name: str, tile_km: float) -> Tuple[float, float, float, float, int, int]:
+    """
+    구 외접 사각형 기준 격자 (min_x, min_y, step_x, step_y, 행 수, 열 수)
+
+    경도 방향 간격은 구 중심 위도 기준으로 tile_km 이 되도록 환산한다.
+    """
+    if tile_km <= 0:
+        raise ValueError('tile_km 은 0보다 커야 합니다.')
+
+    min_x, min_y, max_x, max_y = boundary_polygon(gu_name).extent
+    m_per_deg_lng = METERS_PER_DEG_LAT * math.cos(math.radians((min_y + max_y) / 2))
+    step_x = tile_km * 1000 / m_per_deg_lng
+    step_y = tile_km * 1000 / METERS_PER_DEG_LAT
+    rows = math.ceil((max_y - min_y) / step_y)
+    cols = math.ceil((max_x - min_x) / step_x)
+    return min_x, min_y, step_x, step_y, rows, cols
+
+
+def tile_cells(gu_name: str, tile_km: float = DEFAULT_TILE_KM) -> List[Tuple[int, int]]:
+    """구 경계와 겹치는 격자 칸 (행, 열) 목록 (남→북, 서→동 순)"""
+    polygon = boundary_polygon(gu_name)
+    min_x, min_y, step_x, step_y, rows, cols = grid_spec(gu_name, tile_km)
+
+    cells = []
+    for row in range(rows):
+        y1 = min_y + row * step_y
+        for col in range(cols):
+            x1 = min_x + col * step_x
+            tile = Polygon.from_bbox((x1, y1, x1 + step_x, y1 + step_y))
+            if tile.intersects(polygon):
+                cells.append((row, col))
+    return cells
+
+
+def tile_gu(gu_name: str, tile_km: float = DEFAULT_TILE_KM) -> List[str]:
+    """
+    구 경계와 겹치는 격자 타일 rect 목록 (서로 겹치지 않음)
+
+    Args:
+        gu_name: 구 이름
+        tile_km: 타일 한 변 (km)
+
+    Returns:
+        카카오 rect 파라미터 형식 'x1,y1,x2,y2' 목록 (남→북, 서→동 순)
+    """
+    min_x, min_y, step_x, step_y, _, _ = grid_spec(gu_name, tile_km)
+    rects = []
+    for row, col in tile_cells(gu_name, tile_km):
+        x1 = min_x + col * step_x
+        y1 = min_y + row * step_y
+        rects.append(f"{x1:.6f},{y1:.6f},{(x1 + step_x):.6f},{(y1 + step_y):.6f}")
+    return rects
@@ -0,0 +1,312 @@
+# stores/management/commands/http_client.py
+"""
+외부 HTTP 호출 공용 래퍼 (재시도 + 호스트별 서킷 브레이커 + 오류 카운터)
+
+기존 수집 코드는 예외가 나면 빈 결과({"documents": []}, [], 0)를 돌려주고 넘어가
+일시적인 오류 한 번에 페이지 전체가 조용히 빠졌다.
+
+- 네트워크 오류 / 타임아웃 / 429 / 5xx 는 최대 max_retries 회 재시도 (rate_limit.backoff_delay)
+- 그 외 상태 코드(400, 401 등)는 재시도 없이 그대로 반환 → 호출자가 처리
+- 재시도를 모두 소진하면 RequestFailedError (빈 결과 대신 예외로 실패를 드러냄)
+- 호스트별 서킷 브레이커: 연속 실패가 threshold 에 도달하면 reset_timeout 초 동안
+  즉시 CircuitOpenError (장애 중인 서버에 재시도를 쌓지 않음), 이후 1건 시험 호출로 복구 확인
+- 호스트별 요청/재시도/실패/차단 카운터 → http_stats() (dev_status API 에 노출)
+
+사용법:
+    from .http_client import RequestFailedError, request, request_async
+
+    response = request('GET', url, limiter_key='kakao', headers=headers, params=params, timeout=5)
+    result = await request_async(session, 'GET', url, limiter=rate_limiter, params=params)
+    data = result.json()
+"""
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+
+from .http_pool import get_session
+from .rate_limit import backoff_delay, get_limiter, is_retryable_status, parse_retry_after
+
+
+DEFAULT_MAX_RETRIES = 3
+BREAKER_THRESHOLD = 5         # 연속 실패 N회 → 차단
+BREAKER_RESET_TIMEOUT = 30.0  # 차단 유지 시간 (초), 이후 시험 호출 1건 허용
+
+RetryCallback = Callable[[int, Optional[int], float], None]  # (attempt, status, delay)
+
+
+class RequestFailedError(Exception):
+    """재시도를 모두 소진한 요청 (status: 마지막 HTTP 상태, 네트워크 오류면 None)"""
+
+    def __init__(self, url: str, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None, attempts: int = 0):
+        super().__init__(f"{message} ({attempts}회 시도): {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+        self.attempts = attempts
+
+
+class CircuitOpenError(RequestFailedError):
+    """서킷 브레이커가 열려 호출하지 않은 요청"""
+
+
+class CircuitBreaker:
+    """호스트 단위 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.short_circuits = 0
+        self.last_error = ''
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return 'closed'
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open 이면 동시에 1건만 시험 호출)"""
+        with self._lock:
+            state = self.state
+            if state == 'closed' or (state == 'half_open' and not self._probing):
+                self._probing = state == 'half_open'
+                self.requests += 1
+                return True
+            self.short_circuits += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def abort_probe(self):
+        """시험 호출이 결과 없이 중단됨 (취소 / 예상 밖 예외): 상태는 유지하고 다음 시험 호출 허용"""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self, error: str):
+        with self._lock:
+            self._failures += 1
+            self.failures += 1
+            self.last_error = error
+            if self._probing or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'requests': self.requests,
+            'retries': self.retries,
+            'failures': self.failures,
+            'short_circuits': self.short_circuits,
+            'last_error': self.last_error,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(url: str) -> CircuitBreaker:
+    """URL 호스트별 공유 브레이커"""
+    host = urlsplit(url).netloc.lower()
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+        return breaker
+
+
+def http_stats() -> Dict[str, Dict[str, Any]]:
+    """호스트별 요청/재시도/실패/차단 카운터"""
+    with _breakers_lock:
+        return {host: breaker.get_stats() for host, breaker in _breakers.items()}
+
+
+def reset_http_stats():
+    """브레이커 / 카운터 초기화 (테스트용)"""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def _retry_or_raise(breaker, url, attempt, max_retries, error, status=None, retry_after=None, on_retry=None):
+    """실패 기록 후 재시도 대기 시간 반환 (소진 시 RequestFailedError)"""
+    breaker.record_failure(error)
+    if attempt >= max_retries or breaker.state == 'open':
+        raise RequestFailedError(url, error, status=status, retry_after=retry_after, attempts=attempt + 1)
+    delay = backoff_delay(attempt, retry_after)
+    breaker.record_retry()
+    if on_retry is not None:
+        on_retry(attempt, status, delay)
+    return delay
+
+
+def request(
+    method: str,
+    url: str,
+    limiter_key: Optional[str] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    session: Optional[requests.Session] = None,
+    on_retry: Optional[RetryCallback] = None,
+    **kwargs,
+) -> requests.Response:
+    """
+    동기 HTTP 요청 (재시도 + 서킷 브레이커)
+
+    Args:
+        method: 'GET' / 'POST' ...
+        url: 요청 URL
+        limiter_key: rate_limit 토큰 버킷 키 (매 시도 전 토큰 획득, 429 면 버킷 정지)
+        max_retries: 재시도 횟수
+        session: requests.Session (없으면 http_pool 공유 세션 - 호스트별 keep-alive)
+        on_retry: 재시도 콜백 (attempt, status, delay)
+        **kwargs: requests.request 인자 (headers, params, data, timeout ...)
+
+    Returns:
+        재시도 대상이 아닌 응답 (2xx, 4xx)
+
+    Raises:
+        RequestFailedError: 재시도 소진, CircuitOpenError: 호스트 차단 중
+    """
+    breaker = get_breaker(url)
+    bucket = get_limiter(limiter_key) if limiter_key else None
+    client = session or get_session()
+
+    for attempt in range(max_retries + 1):
+        if not breaker.allow():
+            raise CircuitOpenError(url, '서킷 브레이커 열림', attempts=attempt)
+
+        try:
+            if bucket is not None:
+                bucket.acquire()
+            response = client.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            delay = _retry_or_raise(breaker, url, attempt, max_retries, f"{type(e).__name__}: {e}", on_retry=on_retry)
+        except BaseException:
+            breaker.abort_probe()  # 결과 없이 중단된 시험 호출이 호스트를 계속 막지 않도록
+            raise
+        else:
+            if not is_retryable_status(response.status_code):
+                breaker.record_success()
+                return response
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            delay = _retry_or_raise(
+                breaker, url, attempt, max_retries, f"HTTP {response.status_code}",
+                status=response.status_code, retry_after=retry_after, on_retry=on_retry,
+            )
+            if response.status_code == 429 and bucket is not None:
+                bucket.penalize(delay)
+        time.sleep(delay)
+
+    raise RequestFailedError(url, '재시도 소진', attempts=max_retries + 1)
+
+
+@dataclass
+class AsyncResult:
+    """비동기 응답 (본문까지 읽은 상태, 세션 컨텍스트 밖에서 사용 가능)"""
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+
+async def request_async(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    limiter=None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    on_retry: Optional[RetryCallback] = None,
+    **kwargs,
+) -> AsyncResult:
+    """
+    비동기 HTTP 요청 (재시도 + 서킷 브레이커)
+
+    Args:
+        session: aiohttp 세션
+        limiter: rate_limit.AsyncRateLimiter (매 시도마다 슬롯 + 토큰 획득, 429 면 penalize)
+        on_retry: 재시도 콜백 (attempt, status, delay)
+        **kwargs: session.request 인자 (headers, params, timeout ...)
+
+    Returns:
+        재시도 대상이 아닌 응답 (2xx, 4xx)
+
+    Raises:
+        RequestFailedError: 재시도 소진, CircuitOpenError: 호스트 차단 중
+    """
+    breaker = get_breaker(url)
+
+    for attempt in range(max_retries + 1):
+        if not breaker.allow():
+            raise CircuitOpenError(url, '서킷 브레이커 열림', attempts=attempt)
+
+        # 취소(선행 요청 취소, run_async 중단) 등으로 결과 없이 끝난 시험 호출은 반납
+        try:
+            if limiter is not None:
+                await limiter.acquire()
+        except BaseException:
+            breaker.abort_probe()
+            raise
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                status = response.status
+                headers = response.headers.copy()
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = None
+            error = f"{type(e).__name__}: {e}"
+        except BaseException:
+            breaker.abort_probe()
+            raise
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+        if status is not None and not is_retryable_status(status):
+            breaker.record_success()
+            return AsyncResult(status=status, headers=headers, body=body)
+
+        # 슬롯을 반납한 뒤 대기 (다른 요청은 계속 진행, 429 면 버킷 전체가 대기)
+        if status is None:
+            delay = _retry_or_raise(breaker, url, attempt, max_retries, error, on_retry=on_retry)
+        else:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            delay = _retry_or_raise(
+                breaker, url, attempt, max_retries, f"HTTP {status}",
+                status=status, retry_after=retry_after, on_retry=on_retry,
+            )
+            if status == 429 and limiter is not None:
+                limiter.penalize(delay)
+        await asyncio.sleep(delay)
+
+    raise RequestFailedError(url, '재시도 소진', attempts=max_retries + 1)
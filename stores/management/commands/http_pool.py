@@ -0,0 +1,245 @@
+# stores/management/commands/http_pool.py
+"""
+프로세스 공용 HTTP 연결 풀 (requests.Session 레지스트리 + 공유 aiohttp 세션/이벤트 루프)
+
+기존에는 동기 명령이 모듈 함수 requests.get/post 로 매 호출마다 TCP+TLS 연결을 새로 맺었고,
+run_async_collection 등은 호출마다 이벤트 루프와 ClientSession 을 만들고 닫아
+다음 구간 / 다음 구에서 같은 호스트에 다시 연결했다.
+
+- get_session(): 이름별 공유 requests.Session (HTTPAdapter 호스트별 keep-alive 풀, 재시도는 http_client 담당)
+- run_async(): 백그라운드 스레드의 공유 이벤트 루프에서 코루틴 실행 (여러 스레드에서 동시 호출 가능)
+- pooled_session(): 공유 루프에서는 프로세스 공용 aiohttp 세션 (DNS 캐시 + keep-alive),
+  그 외 루프(테스트의 asyncio.run 등)에서는 같은 설정의 임시 세션
+- pool_stats(): 연결 재사용(hit) / 새 연결(miss), aiohttp DNS 캐시 hit/miss (dev_status API 에 노출)
+
+requests 쪽은 별도 DNS 캐시가 없지만, 연결을 재사용하는 동안은 DNS 조회도 다시 하지 않는다.
+
+사용법:
+    from .http_pool import get_session, pooled_session, run_async
+
+    response = get_session().get(url, timeout=5)
+
+    async def main():
+        async with pooled_session() as session:
+            ...
+    result = run_async(main())
+"""
+
+import asyncio
+import atexit
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+
+POOL_CONNECTIONS = 16     # 호스트별 풀 보관 수 (requests)
+POOL_MAXSIZE = 16         # 호스트당 유지 연결 수 (requests, run_all --all-gu 스레드 수 이상)
+ASYNC_LIMIT = 32          # aiohttp 전체 동시 연결 수
+ASYNC_LIMIT_PER_HOST = 10 # aiohttp 호스트당 동시 연결 수 (기존 TCPConnector 설정)
+DNS_CACHE_TTL = 300       # aiohttp DNS 캐시 유지 시간 (초)
+KEEPALIVE_TIMEOUT = 30    # aiohttp 유휴 연결 유지 시간 (초)
+
+
+class PooledAdapter(HTTPAdapter):
+    """연결 재사용 카운터가 있는 HTTPAdapter (urllib3 풀의 요청 수 / 새 연결 수)"""
+
+    def __init__(self, *args, **kwargs):
+        self._retired_requests = 0
+        self._retired_connections = 0
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # 오래된 호스트 풀이 밀려나도 카운터는 누적 유지
+        pools = self.poolmanager.pools
+        dispose = pools.dispose_func
+
+        def retire(pool):
+            self._retired_requests += pool.num_requests
+            self._retired_connections += pool.num_connections
+            if dispose is not None:
+                dispose(pool)
+
+        pools.dispose_func = retire
+
+    def get_stats(self) -> Dict[str, int]:
+        pools = self.poolmanager.pools
+        requests_made, connections = self._retired_requests, self._retired_connections
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests_made += pool.num_requests
+                connections += pool.num_connections
+        return {
+            'requests': requests_made,
+            'hits': max(0, requests_made - connections),
+            'misses': connections,
+        }
+
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(name: str = 'default') -> requests.Session:
+    """이름별 공유 requests.Session (없으면 생성)"""
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = _sessions[name] = requests.Session()
+            adapter = PooledAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        return session
+
+
+class _AsyncPoolStats:
+    """aiohttp 연결 / DNS 캐시 카운터 (TraceConfig 로 수집)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.dns_hits = 0
+            self.dns_misses = 0
+            self.sessions = 0
+
+    def incr(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'dns_hits': self.dns_hits,
+                'dns_misses': self.dns_misses,
+                'sessions': self.sessions,
+            }
+
+
+_async_stats = _AsyncPoolStats()
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    def counter(field):
+        async def handler(session, context, params):
+            _async_stats.incr(field)
+        return handler
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_reuseconn.append(counter('hits'))
+    trace.on_connection_create_end.append(counter('misses'))
+    trace.on_dns_cache_hit.append(counter('dns_hits'))
+    trace.on_dns_cache_miss.append(counter('dns_misses'))
+    return trace
+
+
+def _new_async_session() -> aiohttp.ClientSession:
+    """공용 설정의 aiohttp 세션 (실행 중인 루프 안에서 호출)"""
+    connector = aiohttp.TCPConnector(
+        limit=ASYNC_LIMIT,
+        limit_per_host=ASYNC_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    _async_stats.incr('sessions')
+    return aiohttp.ClientSession(connector=connector, trace_configs=[_trace_config()])
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+_async_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """공유 이벤트 루프 (백그라운드 데몬 스레드에서 run_forever)"""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name='http-pool-loop', daemon=True)
+            _loop_thread.start()
+        return _loop
+
+
+def run_async(coro) -> Any:
+    """
+    동기 코드에서 공유 이벤트 루프로 코루틴 실행 후 결과 반환
+
+    호출 스레드가 중단되면(KeyboardInterrupt 등) 실행 중인 코루틴도 취소한다.
+    """
+    loop = get_loop()
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+@asynccontextmanager
+async def pooled_session():
+    """
+    aiohttp 세션 컨텍스트
+
+    공유 루프에서는 프로세스 공용 세션(종료 시 닫지 않음), 다른 루프에서는 임시 세션을 연다.
+    """
+    global _async_session
+    if asyncio.get_running_loop() is _loop:
+        if _async_session is None or _async_session.closed:
+            _async_session = _new_async_session()
+        yield _async_session
+    else:
+        async with _new_async_session() as session:
+            yield session
+
+
+def pool_stats() -> Dict[str, Any]:
+    """requests 세션별 / aiohttp 연결 재사용 통계"""
+    with _sessions_lock:
+        sessions = dict(_sessions)
+    stats = {
+        name: session.get_adapter('https://').get_stats()
+        for name, session in sessions.items()
+    }
+    stats['aiohttp'] = _async_stats.get_stats()
+    return stats
+
+
+def close_pools():
+    """공유 세션 / 루프 종료 (프로세스 종료 시 자동 호출, 테스트에서 초기화용)"""
+    global _loop, _loop_thread, _async_session
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop, _loop_thread = None, None
+    if loop is not None and not loop.is_closed():
+        if _async_session is not None and not _async_session.closed:
+            try:
+                asyncio.run_coroutine_threadsafe(_async_session.close(), loop).result(timeout=5)
+            except Exception:
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not thread.is_alive():
+            loop.close()
+    _async_session = None
+    _async_stats.reset()
+
+
+atexit.register(close_pools)
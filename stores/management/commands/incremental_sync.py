@@ -0,0 +1,99 @@
+# stores/management/commands/incremental_sync.py
+"""
+서울시 OpenAPI 증분 동기화 헬퍼 (LASTMODTS / UPDATEDT 워터마크)
+
+매번 구 데이터를 삭제하고 전체 이력을 다시 저장하는 대신,
+DB에 저장된 해당 구 행들의 최종 수정 시각(워터마크) 이후 변경된 행만 반영한다.
+
+- 워터마크: max(LASTMODTS, UPDATEDT) (구/서비스별 저장 행 기준)
+- UPDATEGBN == 'D' (삭제) 또는 필터 조건에서 벗어난 행(폐업 등) → DB에서 삭제
+- 나머지 변경 행 → upsert
+- 워터마크가 없으면 (저장된 행 없음) 전체 재적재로 대체
+
+사용법:
+    from .incremental_sync import get_watermark, split_changes, delete_rows
+
+    watermark = get_watermark(SeoulRestaurantLicense, gu=target_gu, uptaenm='편의점')
+    upserts, deletes = split_changes(rows, watermark, keep=is_open_convenience)
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.db.models import Max
+
+
+DELETE_FLAG = 'D'  # UPDATEGBN 삭제 구분값 (I: 신규, U: 갱신, D: 삭제)
+
+
+def normalize_ts(value) -> str:
+    """
+    수정 시각 문자열을 비교 가능한 14자리 숫자 문자열로 변환
+
+    '2023-05-10 14:22:33'   → '20230510142233'
+    '2023-05-12 02:40:00.0' → '20230512024000'
+    """
+    if not value:
+        return ''
+    digits = re.sub(r'\D', '', str(value))[:14]
+    return digits.ljust(14, '0') if digits else ''
+
+
+def row_changed_at(row: Dict) -> str:
+    """API 행의 최종 변경 시각 (LASTMODTS, UPDATEDT 중 늦은 값)"""
+    return max(normalize_ts(row.get('LASTMODTS')), normalize_ts(row.get('UPDATEDT')))
+
+
+def get_watermark(model, **filters) -> Optional[str]:
+    """
+    저장된 행 기준 워터마크 조회
+
+    Returns:
+        14자리 시각 문자열 (저장된 행이 없으면 None → 전체 재적재)
+    """
+    latest = model.objects.filter(**filters).aggregate(
+        lastmodts=Max('lastmodts'),
+        updatedt=Max('updatedt'),
+    )
+    watermark = max(normalize_ts(latest['lastmodts']), normalize_ts(latest['updatedt']))
+    return watermark or None
+
+
+def split_changes(
+    rows: List[Dict],
+    watermark: str,
+    keep: Callable[[Dict], bool],
+) -> Tuple[List[Dict], List[str]]:
+    """
+    워터마크 이후 변경 행을 upsert / 삭제 대상으로 분리
+
+    같은 시각에 갱신된 행을 놓치지 않도록 워터마크와 같은 시각도 포함한다.
+    (upsert 는 멱등이므로 중복 반영해도 안전)
+
+    Args:
+        rows: API 원본 행 목록
+        watermark: get_watermark() 결과
+        keep: 저장 대상 여부 판별 함수 (예: 영업중 편의점)
+
+    Returns:
+        (upsert 대상 행 목록, 삭제 대상 MGTNO 목록)
+    """
+    upserts, deletes = [], []
+    for row in rows:
+        if row_changed_at(row) < watermark:
+            continue
+        mgtno = row.get('MGTNO', '')
+        if not mgtno:
+            continue
+        if row.get('UPDATEGBN', '').strip() == DELETE_FLAG or not keep(row):
+            deletes.append(mgtno)
+        else:
+            upserts.append(row)
+    return upserts, deletes
+
+
+def delete_rows(model, mgtnos: List[str], **filters) -> int:
+    """삭제 대상 MGTNO 행 삭제 (삭제 건수 반환)"""
+    if not mgtnos:
+        return 0
+    return model.objects.filter(mgtno__in=mgtnos, **filters).delete()[0]
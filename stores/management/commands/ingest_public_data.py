@@ -0,0 +1,178 @@
+# stores/management/commands/ingest_public_data.py
+"""
+전국 소상공인시장진흥공단 상가(상권)정보 CSV → 구 단위 Parquet 파티션 적재
+- 수백만 행 원본을 chunksize 단위로 스트리밍 (필요한 9개 컬럼만 읽음)
+- 시도(기본: 서울특별시) + 업종(기본: 편의점) 필터 후 시군구명으로 분할
+  (중구/동구/서구 등은 여러 시도에 있으므로 시도명까지 확인)
+- 청크별 임시 파일 → 구별로 모아 정규화(build_frame) + 공간 셀 정렬 후 파티션 1개로 저장
+- 결과: .cache/public_data_dataset/gu=<구>/part-0.parquet
+  check_store_closure --gu X 는 이후 해당 구 파티션만 읽는다 (public_data_cache.load_public_data)
+
+원본 헤더는 public_data.csv 와 같은 Column1~Column39 형식이나 공식 한글 헤더
+(상가업소번호, 상호명, ...) 모두 지원 - 39개 컬럼 순서가 같으므로 위치 기준으로 읽는다.
+
+사용법:
+    python manage.py ingest_public_data --source 소상공인시장진흥공단_상가정보_서울_202409.csv
+    python manage.py ingest_public_data --source 전국.csv --encoding utf-8 --gu 강남구 --gu 마포구
+"""
+import os
+import shutil
+import time
+
+import pandas as pd
+import pyarrow.parquet as pq
+from django.core.management.base import BaseCommand, CommandError
+
+from .gu_codes import list_supported_gu
+from .public_data_cache import DATASET_DIR, build_frame, write_partition
+from .spatial_match import DEFAULT_CELL_M
+
+
+COLUMN_COUNT = 39
+COLUMN_NAMES = [f'Column{i}' for i in range(1, COLUMN_COUNT + 1)]
+# 상가업소번호, 상호명, 상권업종소분류명, 시도명, 시군구명, 지번주소, 도로명주소, 경도, 위도
+USE_COLUMNS = ['Column1', 'Column2', 'Column9', 'Column13', 'Column15', 'Column25', 'Column32', 'Column38', 'Column39']
+DEFAULT_CHUNKSIZE = 200_000
+
+
+class Command(BaseCommand):
+    help = '전국 상가(상권)정보 CSV 를 구 단위 Parquet 파티션으로 적재 (check_store_closure 용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            type=str,
+            required=True,
+            help='상가(상권)정보 CSV 경로',
+        )
+        parser.add_argument(
+            '--encoding',
+            type=str,
+            default='cp949',
+            help='CSV 인코딩 (기본: cp949)',
+        )
+        parser.add_argument(
+            '--chunksize',
+            type=int,
+            default=DEFAULT_CHUNKSIZE,
+            help=f'한 번에 읽을 행 수 (기본: {DEFAULT_CHUNKSIZE})',
+        )
+        parser.add_argument(
+            '--sido',
+            type=str,
+            default='서울특별시',
+            help='대상 시도명 (기본: 서울특별시)',
+        )
+        parser.add_argument(
+            '--category',
+            type=str,
+            default='편의점',
+            help='상권업종소분류명 필터 (기본: 편의점, 빈 문자열이면 전체)',
+        )
+        parser.add_argument(
+            '--gu',
+            action='append',
+            default=None,
+            help=f'적재할 구 (여러 번 지정 가능, 기본: 전체). 지원: {", ".join(list_supported_gu())}',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=DATASET_DIR,
+            help=f'파티션 데이터셋 경로 (기본: {DATASET_DIR})',
+        )
+        parser.add_argument(
+            '--cell-m',
+            type=float,
+            default=DEFAULT_CELL_M,
+            help=f'파티션 정렬용 공간 셀 크기 m (기본: {DEFAULT_CELL_M:g})',
+        )
+
+    def handle(self, *args, **options):
+        source = options['source']
+        output = options['output']
+        target_gus = set(options['gu']) if options['gu'] else None
+
+        if not os.path.exists(source):
+            raise CommandError(f'CSV 파일이 없습니다: {source}')
+        if options['chunksize'] <= 0:
+            raise CommandError('--chunksize 는 1 이상이어야 합니다.')
+
+        self.stdout.write("=" * 60)
+        self.stdout.write(self.style.SUCCESS("📦 상가(상권)정보 구 단위 파티션 적재"))
+        self.stdout.write("=" * 60)
+        self.stdout.write(f"  원본: {source}")
+        self.stdout.write(f"  필터: {options['sido']} / {options['category'] or '전체 업종'}")
+        self.stdout.write(f"  출력: {output}")
+
+        staging_dir = os.path.join(output, '_staging')
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        started = time.time()
+
+        # 1. 청크 스트리밍 → 구별 임시 파일
+        total_rows, kept_rows, staged = self.stage_chunks(source, staging_dir, target_gus, options)
+        self.stdout.write(f"\n  읽은 행: {total_rows:,}개 / 대상 행: {kept_rows:,}개")
+
+        if not staged:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            self.stdout.write(self.style.WARNING("⚠️ 조건에 맞는 행이 없습니다."))
+            return
+
+        # 2. 구별 정규화 + 공간 셀 정렬 → 파티션 교체
+        self.stdout.write("\n🗂️ 구 파티션 생성")
+        for gu in sorted(staged):
+            raw = pq.read_table(os.path.join(staging_dir, gu)).to_pandas()
+            frame = build_frame(raw.drop_duplicates('Column1', keep='last'), gu)
+            write_partition(frame, gu, dataset_dir=output, cell_m=options['cell_m'])
+            self.stdout.write(f"  ✅ {gu}: {len(frame):,}개")
+
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 완료: {len(staged)}개 구, {time.time() - started:.1f}초"
+        ))
+        self.stdout.write("=" * 60)
+
+    def stage_chunks(self, source, staging_dir, target_gus, options):
+        """
+        CSV 를 청크 단위로 읽어 대상 행만 구별 임시 Parquet 파일로 저장
+
+        Returns:
+            (읽은 행 수, 대상 행 수, 임시 파일이 생성된 구 집합)
+        """
+        reader = pd.read_csv(
+            source,
+            encoding=options['encoding'],
+            header=0,
+            names=COLUMN_NAMES,
+            usecols=USE_COLUMNS,
+            dtype=str,
+            chunksize=options['chunksize'],
+        )
+
+        total_rows = 0
+        kept_rows = 0
+        staged = set()
+        for chunk_no, chunk in enumerate(reader, 1):
+            total_rows += len(chunk)
+
+            mask = chunk['Column13'].str.strip() == options['sido']
+            if options['category']:
+                mask &= chunk['Column9'].str.strip() == options['category']
+            chunk = chunk[mask]
+            gu_names = chunk['Column15'].str.strip()
+            if target_gus is not None:
+                chunk = chunk[gu_names.isin(target_gus)]
+                gu_names = gu_names[chunk.index]
+
+            for gu, rows in chunk.groupby(gu_names, sort=False):
+                gu_dir = os.path.join(staging_dir, gu)
+                os.makedirs(gu_dir, exist_ok=True)
+                rows.to_parquet(os.path.join(gu_dir, f'chunk-{chunk_no:06d}.parquet'), index=False)
+                staged.add(gu)
+
+            kept_rows += len(chunk)
+            self.stdout.write(f"  📄 청크 {chunk_no}: 누적 {total_rows:,}행 읽음, 대상 {kept_rows:,}행")
+
+        return total_rows, kept_rows, staged
@@ -0,0 +1,183 @@
+# stores/management/commands/kakao_cache.py
+"""
+카카오 로컬 API 응답 디스크 캐시 (SQLite)
+
+편의점 수집은 실행할 때마다 같은 rect/page 를 다시 호출하여 일일 쿼터를 소모한다.
+(category_group_code, rect, x, y, page) 등 요청 파라미터를 키로 성공 응답 JSON 을 저장하고,
+TTL 이내의 재실행 / 테스트 실행은 API 호출 없이 캐시에서 응답을 돌려준다.
+
+- 위치: <프로젝트>/.cache/kakao_responses.sqlite3 (KAKAO_CACHE_PATH 환경변수로 변경)
+- 인증 헤더는 키에 포함하지 않음 (API 키가 바뀌어도 같은 응답 재사용)
+- 성공(200) 응답만 저장, 400/타임아웃 등 실패는 저장하지 않음
+- 저장은 COMMIT_EVERY 건마다 / flush() / close() 시 한 번에 커밋 (비정상 종료 시 마지막 묶음만 유실)
+- 비동기 수집기는 get_async / put_async 로 SQLite I/O 를 기본 스레드 풀에서 실행 (공유 이벤트 루프를 막지 않음)
+
+캐시 모드 (--cache-mode):
+    off     : 캐시 미사용 (기본, 기존 동작)
+    read    : 유효한 캐시만 읽음, 미스는 API 호출하되 저장하지 않음
+    write   : 읽기 + 미스 응답 저장 (read-through)
+    refresh : 캐시를 읽지 않고 모두 API 호출 후 덮어씀
+
+사용법:
+    from .kakao_cache import KakaoResponseCache
+
+    cache = KakaoResponseCache(mode='write', ttl_hours=24)
+    data = cache.get(url, params)
+    if data is None:
+        data = requests.get(url, headers=headers, params=params).json()
+        cache.put(url, params, data)
+    cache.close()   # 남은 저장분 커밋
+
+    # 코루틴 안에서
+    data = await cache.get_async(url, params)
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .public_data_cache import CACHE_DIR
+
+
+CACHE_MODES = ('off', 'read', 'write', 'refresh')
+DEFAULT_CACHE_MODE = os.environ.get('KAKAO_CACHE_MODE', 'off')
+DEFAULT_TTL_HOURS = 24.0
+COMMIT_EVERY = 50  # 저장 커밋 묶음 크기 (fsync 횟수 절감)
+DEFAULT_CACHE_PATH = os.environ.get('KAKAO_CACHE_PATH', os.path.join(CACHE_DIR, 'kakao_responses.sqlite3'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kakao_response (
+    cache_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class KakaoResponseCache:
+    """카카오 API 응답 캐시 (SQLite, 스레드/코루틴 공용)"""
+
+    def __init__(self, mode: str = DEFAULT_CACHE_MODE, ttl_hours: float = DEFAULT_TTL_HOURS,
+                 path: str = DEFAULT_CACHE_PATH, commit_every: int = COMMIT_EVERY):
+        if mode not in CACHE_MODES:
+            raise ValueError(f'지원하지 않는 캐시 모드: {mode} ({", ".join(CACHE_MODES)})')
+        self.mode = mode
+        self.ttl_seconds = ttl_hours * 3600
+        self.path = path
+        self.commit_every = max(1, commit_every)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pending = 0
+
+    @property
+    def reads(self) -> bool:
+        return self.mode in ('read', 'write')
+
+    @property
+    def writes_enabled(self) -> bool:
+        return self.mode in ('write', 'refresh')
+
+    def _connection(self) -> sqlite3.Connection:
+        """첫 사용 시 연결 (mode=off 면 파일을 만들지 않음)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            # run_all --all-gu 의 여러 구 스레드가 같은 파일을 쓰므로 WAL + busy timeout
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """요청 URL + 파라미터(정렬) → 캐시 키"""
+        return json.dumps([url, sorted((key, str(value)) for key, value in params.items())], ensure_ascii=False)
+
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """TTL 이내 캐시 응답 (없거나 읽기 모드가 아니면 None)"""
+        if not self.reads:
+            return None
+
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT body, fetched_at FROM kakao_response WHERE cache_key = ?',
+                (self.make_key(url, params),),
+            ).fetchone()
+
+            if row is None or time.time() - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, url: str, params: Dict[str, Any], data: Dict[str, Any]):
+        """성공 응답 저장 (쓰기 모드가 아니면 무시)"""
+        if not self.writes_enabled:
+            return
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                'INSERT OR REPLACE INTO kakao_response (cache_key, url, body, fetched_at) VALUES (?, ?, ?, ?)',
+                (self.make_key(url, params), url, json.dumps(data, ensure_ascii=False), time.time()),
+            )
+            self.writes += 1
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self._commit()
+
+    async def get_async(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """get() 을 스레드 풀에서 실행 (읽기 모드가 아니면 스레드 전환 없이 None)"""
+        if not self.reads:
+            return None
+        return await asyncio.to_thread(self.get, url, params)
+
+    async def put_async(self, url: str, params: Dict[str, Any], data: Dict[str, Any]):
+        """put() 을 스레드 풀에서 실행 (쓰기 모드가 아니면 무시)"""
+        if not self.writes_enabled:
+            return
+        await asyncio.to_thread(self.put, url, params, data)
+
+    def _commit(self):
+        """대기 중인 저장분 커밋 (self._lock 보유 상태에서 호출)"""
+        if self._pending and self._conn is not None:
+            self._conn.commit()
+        self._pending = 0
+
+    def flush(self):
+        """대기 중인 저장분 즉시 커밋"""
+        with self._lock:
+            self._commit()
+
+    def purge_expired(self) -> int:
+        """TTL 이 지난 응답 삭제 (삭제 건수 반환)"""
+        if self.mode == 'off':
+            return 0
+        with self._lock:
+            conn = self._connection()
+            deleted = conn.execute(
+                'DELETE FROM kakao_response WHERE fetched_at < ?',
+                (time.time() - self.ttl_seconds,),
+            ).rowcount
+            conn.commit()
+            self._pending = 0
+        return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (모드, 적중, 미스, 저장)"""
+        return {'mode': self.mode, 'hits': self.hits, 'misses': self.misses, 'writes': self.writes}
+
+    def close(self):
+        """남은 저장분 커밋 후 연결 종료"""
+        with self._lock:
+            self._commit()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
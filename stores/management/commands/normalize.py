@@ -0,0 +1,199 @@
+# stores/management/commands/normalize.py
+"""
+매장 이름 / 주소 / 좌표 정규화 함수
+
+check_store_closure, v2_1_cross_match_stores, public_data_cache 에서 공용으로 사용한다.
+(새로운 매칭 로직도 여기 함수를 사용 - 명령마다 정규화 규칙을 복사하지 않는다)
+
+- 정규식은 모듈 로드 시 한 번만 컴파일
+- 주소 정규화는 (address, target_gu) 키 LRU 캐시: 여러 데이터셋에 반복되는 주소는 1회만 계산
+
+- 스칼라 함수: normalize_name / extract_road_address / extract_dong_from_address
+- 벡터 함수 (*_series): 같은 규칙을 pandas Series 전체에 str.replace / str.extract 로 적용
+  (스칼라 함수와 바이트 단위로 같은 키를 만든다 - test_unit 패리티 테스트)
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# 도로명 주소 패턴: "~로/길/대로 + 숫자"
+ROAD_PATTERN = r'([가-힣]+(?:로|길|대로)[0-9가-힣]*)\s*(\d+(?:-\d+)?)'
+# 동 패턴: ~동, ~동1가, ~동2가 등
+DONG_PATTERN = r'([가-힣]+동(?:\d+가)?)'
+
+ROAD_RE = re.compile(ROAD_PATTERN)
+DONG_RE = re.compile(DONG_PATTERN)
+PAREN_RE = re.compile(r'\([^)]*\)')        # 괄호 내용 (동 이름, 건물명 등)
+AFTER_COMMA_RE = re.compile(r',.*$')      # 쉼표 뒤 상세 주소
+NAME_STRIP_RE = re.compile(r'[ \-_]')     # 이름에서 제거할 문자
+
+ADDRESS_CACHE_SIZE = 65536  # 서울 전체 인허가 + 상권 데이터 고유 주소 수보다 넉넉하게
+HALF_TOLERANCE = 1e-6       # 반값(...5) 판정 허용 오차 (10**decimals 배율 단위)
+
+
+def normalize_name(name):
+    """이름 정규화: 공백 제거, 소문자, 특수문자 제거"""
+    if not name or pd.isna(name):
+        return ""
+    name = str(name).strip()
+    name = name.replace(" ", "").replace("-", "").replace("_", "")
+    name = name.lower()
+    return name
+
+
+def extract_road_address(address, target_gu='영등포구'):
+    """
+    도로명 주소에서 핵심 부분 추출
+    - 서울특별시/서울시/서울 → 통일
+    - 도로명 + 번호 추출 (예: 양평로 49)
+    - target_gu: 동적으로 구 이름 지정
+    """
+    if not address or pd.isna(address):
+        return ""
+    return _extract_road_address_cached(str(address), target_gu)
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _extract_road_address_cached(address, target_gu):
+    """extract_road_address 본체 (문자열 입력, (address, target_gu) 키로 메모이즈)"""
+    address = address.strip()
+    if address == 'nan':
+        return ""
+    
+    # 서울 표기 통일
+    address = address.replace("서울특별시", "서울")
+    address = address.replace("서울시", "서울")
+    
+    # 도로명 주소 패턴 추출: "~로/길/대로 + 숫자"
+    match = ROAD_RE.search(address)
+    
+    if match:
+        road_name = match.group(1)
+        road_num = match.group(2)
+        
+        # 구 이름 (target_gu 가 주소에 포함된 경우만)
+        gu = target_gu if target_gu in address else ""
+        
+        normalized = f"서울 {gu} {road_name} {road_num}".strip()
+        normalized = " ".join(normalized.split())
+        return normalized
+    
+    # 패턴 없으면 정리해서 반환
+    address = PAREN_RE.sub('', address)
+    address = AFTER_COMMA_RE.sub('', address)
+    address = " ".join(address.split())
+    return address
+
+
+def address_cache_info():
+    """주소 정규화 LRU 캐시 통계 (hits, misses, maxsize, currsize)"""
+    return _extract_road_address_cached.cache_info()
+
+
+def extract_dong_from_address(address):
+    """지번주소에서 동 이름 추출 (예: 신길동, 당산동5가)"""
+    if not address or pd.isna(address):
+        return ""
+    
+    address = str(address)
+    match = DONG_RE.search(address)
+    return match.group(1) if match else ""
+
+
+def round_coord(val, decimals=4):
+    """좌표 반올림"""
+    try:
+        return round(float(val), decimals)
+    except (ValueError, TypeError):
+        return None
+
+
+def to_coord(val):
+    """좌표 float 변환 (변환 불가/NaN → None)"""
+    try:
+        val = float(val)
+    except (ValueError, TypeError):
+        return None
+    return None if pd.isna(val) else val
+
+
+def _text_series(values):
+    """빈 값(None/NaN/'') → '' 로 채운 문자열 Series"""
+    series = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values.astype(object)
+    empty = series.isna() | (series == '')
+    return series.where(~empty, '').astype(str)
+
+
+def normalize_name_series(values):
+    """normalize_name 의 벡터 버전"""
+    return (
+        _text_series(values)
+        .str.strip()
+        .str.replace(NAME_STRIP_RE, '', regex=True)
+        .str.lower()
+    )
+
+
+def extract_road_address_series(values, target_gu='영등포구'):
+    """
+    extract_road_address 의 벡터 버전
+
+    같은 건물 주소가 반복되는 경우가 많으므로 고유 주소만 정규화한 뒤 원래 순서로 펼친다.
+    """
+    text = _text_series(values)
+    if text.empty:
+        return text
+    codes, uniques = pd.factorize(text)
+    normalized = _extract_road_address_unique(pd.Series(uniques, dtype=object), target_gu)
+    return pd.Series(normalized.to_numpy()[codes], index=text.index, dtype=object)
+
+
+def _extract_road_address_unique(address, target_gu):
+    """고유 주소 Series 정규화 (extract_road_address_series 내부용)"""
+    address = address.str.strip()
+    address = address.where(address != 'nan', '')
+
+    # 서울 표기 통일
+    address = address.str.replace('서울특별시', '서울', regex=False)
+    address = address.str.replace('서울시', '서울', regex=False)
+
+    # 도로명 + 번호 추출 → "서울 {구} {도로명} {번호}"
+    parts = address.str.extract(ROAD_RE)
+    matched = parts[0].notna()
+    gu = pd.Series('', index=address.index, dtype=object).where(~address.str.contains(target_gu, regex=False), target_gu)
+    road = ('서울 ' + gu + ' ' + parts[0].fillna('') + ' ' + parts[1].fillna('')).str.split().str.join(' ')
+
+    # 패턴 없으면 괄호 / 쉼표 뒤 제거 후 공백 정리
+    fallback = (
+        address
+        .str.replace(PAREN_RE, '', regex=True)
+        .str.replace(AFTER_COMMA_RE, '', regex=True)
+        .str.split().str.join(' ')
+    )
+    return road.where(matched, fallback)
+
+
+def extract_dong_series(values):
+    """extract_dong_from_address 의 벡터 버전"""
+    return _text_series(values).str.extract(DONG_RE)[0].fillna('')
+
+
+def round_coord_series(values, decimals=4):
+    """
+    round_coord 의 벡터 버전 (NaN / 변환 불가 값은 NaN)
+
+    np.round 는 x * 10**decimals 를 짝수 쪽으로 반올림하므로 37.00005 같은 반값 근처에서
+    round() 와 결과가 달라진다. 카카오/인허가 좌표(round_coord)와 집합 비교를 하므로
+    반값 근처 값만 round() 로 다시 계산해 같은 float 을 만든다.
+    """
+    coords = pd.to_numeric(pd.Series(values), errors='coerce').astype(float)
+    raw = coords.to_numpy()
+    rounded = np.round(raw, decimals)
+    scaled = raw * 10.0 ** decimals
+    for i in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < HALF_TOLERANCE):
+        rounded[i] = round(float(raw[i]), decimals)
+    return pd.Series(rounded, index=coords.index)
@@ -4,30 +4,24 @@
 - 영업중인 담배소매업만 필터링하여 PostgreSQL에 저장
 - TM 좌표를 WGS84(위도/경도)로 변환
 - --gu 옵션으로 대상 구 지정 가능
+- 전체 건수 확인 후 모든 페이지를 aiohttp 로 동시 조회 (--concurrency, 재시도 포함)
+- 불일치 행은 JSON 디코딩 중 제거 (수신 바이트 / 유지 행 수 출력)
+- 페이지 단위로 저장 + 체크포인트 기록 (--resume: 마지막 완료 페이지 다음부터 재개)
+- --incremental: 저장된 LASTMODTS/UPDATEDT 워터마크 이후 변경분만 반영 (삭제/폐업 행은 DB에서 제거)
 """
 import os
+import numpy as np
 import requests
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.gis.geos import Point
-from pyproj import Transformer
 from stores.models import TobaccoRetailLicense
+from .bulk_upsert import DEFAULT_BATCH_SIZE, bulk_upsert
+from .checkpoints import get_cursor, reset_cursor, save_cursor
+from .coords import convert_tm_to_wgs84_batch
 from .gu_codes import get_tobacco_service, list_supported_gu
-
-
-# 좌표계 변환기: Korea 1985 / Central Belt (EPSG:5174) -> WGS84 (EPSG:4326)
-# 서울시 OpenAPI의 X, Y 좌표는 EPSG:5174 좌표계 사용
-transformer = Transformer.from_crs("EPSG:5174", "EPSG:4326", always_xy=True)
-
-
-def convert_tm_to_wgs84(x, y):
-    """TM 좌표를 WGS84 위도/경도로 변환"""
-    try:
-        x_float = float(x)
-        y_float = float(y)
-        lon, lat = transformer.transform(x_float, y_float)
-        return lat, lon  # latitude, longitude
-    except (ValueError, TypeError):
-        return None, None
+from .http_client import RequestFailedError, request
+from .incremental_sync import delete_rows, get_watermark, row_changed_at, split_changes
+from .seoul_openapi import DEFAULT_CONCURRENCY, RowFilter, fetch_windows
 
 
 class Command(BaseCommand):
@@ -37,6 +31,9 @@ class Command(BaseCommand):
     API_KEY = os.environ.get('SEOUL_OPENAPI_KEY', '')
     BASE_URL = 'http://openAPI.seoul.go.kr:8088'
     PAGE_SIZE = 1000  # 한 번에 가져올 최대 건수
+    CHECKPOINT_STAGE = 'tobacco'  # 체크포인트 단계 키 (pipeline.PIPELINE_STAGES)
+    batch_size = DEFAULT_BATCH_SIZE  # DB 배치 upsert 크기 (--batch-size)
+    FILTER_FIELDS = ('TRDSTATEGBN', 'TRDSTATENM', 'LASTMODTS', 'UPDATEDT')  # 디코딩 단계 필터에 필요한 필드
     
     def add_arguments(self, parser):
         parser.add_argument(
@@ -55,6 +52,28 @@ class Command(BaseCommand):
             action='store_true',
             help='기존 데이터 삭제 후 새로 저장',
         )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='체크포인트의 마지막 완료 페이지 다음부터 이어서 수집 (--clear 무시)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'DB 배치 upsert 크기 (기본: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_CONCURRENCY,
+            help=f'페이지 동시 조회 수 (기본: {DEFAULT_CONCURRENCY})',
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='워터마크(LASTMODTS/UPDATEDT) 이후 변경분만 반영 (워터마크 없으면 전체 재적재, --clear 무시)',
+        )
         parser.add_argument(
             '--all',
             action='store_true',
@@ -65,7 +84,10 @@ class Command(BaseCommand):
         target_gu = options['gu']
         dry_run = options['dry_run']
         clear = options['clear']
+        resume = options.get('resume', False) and not dry_run
+        self.batch_size = options.get('batch_size') or DEFAULT_BATCH_SIZE
         include_all = options['all']
+        self.include_all = include_all
         
         # 서비스명 동적 조회
         try:
@@ -77,7 +99,20 @@ class Command(BaseCommand):
         # 서비스명을 인스턴스 변수로 저장 (메서드에서 사용)
         self.service_name = service_name
         
-        if clear and not dry_run:
+        # 증분 모드: 워터마크 이후 변경분만 반영 (재개 시 최초 실행의 워터마크 유지)
+        watermark = None
+        if options.get('incremental'):
+            if resume:
+                watermark = get_cursor(target_gu, self.CHECKPOINT_STAGE).get('watermark')
+            watermark = watermark or get_watermark(TobaccoRetailLicense, gu=target_gu)
+            if watermark:
+                clear = False
+                self.stdout.write(f'증분 동기화: 워터마크 {watermark} 이후 변경분만 반영')
+            else:
+                clear = True
+                self.stdout.write(self.style.WARNING('워터마크 없음 → 전체 재적재'))
+        
+        if clear and not dry_run and not resume:
             deleted_count = TobaccoRetailLicense.objects.filter(gu=target_gu).delete()[0]
             self.stdout.write(self.style.WARNING(f'{target_gu} 기존 담배소매업 데이터 {deleted_count}건 삭제'))
         
@@ -93,85 +128,141 @@ class Command(BaseCommand):
         self.stdout.write(f'총 담배소매업 데이터: {total_count}건')
         
         # 2. 페이지네이션으로 전체 데이터 수집
+        #    DB 모드에서는 페이지마다 저장 후 체크포인트 기록 (중단 시 --resume으로 재개)
         all_stores = []
+        saved_count, updated_count, removed_count = 0, 0, 0
         start_index = 1
         
-        while start_index <= total_count:
-            end_index = min(start_index + self.PAGE_SIZE - 1, total_count)
-            self.stdout.write(f'데이터 조회 중... ({start_index} ~ {end_index})')
+        if resume:
+            start_index = get_cursor(target_gu, self.CHECKPOINT_STAGE).get('next_start', 1)
+            if start_index > 1:
+                self.stdout.write(self.style.WARNING(f'↩️ 체크포인트에서 재개: {start_index}번째 행부터 조회'))
+        elif not dry_run:
+            reset_cursor(target_gu, self.CHECKPOINT_STAGE)
+        if watermark and not dry_run:
+            save_cursor(target_gu, self.CHECKPOINT_STAGE, watermark=watermark)
+        
+        # 모든 페이지 구간을 동시 조회 → start 순서대로 저장
+        pages, fetch_stats = fetch_windows(
+            self.API_KEY, service_name, start_index, total_count,
+            page_size=self.PAGE_SIZE, max_concurrent=options.get('concurrency') or DEFAULT_CONCURRENCY,
+            row_filter=self.build_row_filter(watermark),
+        )
+        self.stdout.write(
+            f'페이지 {fetch_stats.windows}개 동시 조회 완료: {fetch_stats.elapsed}초 '
+            f'(API 호출 {fetch_stats.api_calls}회, 재시도 {fetch_stats.retries}회)'
+        )
+        self.stdout.write(
+            f'수신 {fetch_stats.bytes_fetched / 1024 / 1024:.2f}MB, '
+            f'행 {fetch_stats.rows_seen}건 중 {fetch_stats.rows_kept}건 유지 ({fetch_stats.keep_ratio}%)'
+        )
+        
+        # 체크포인트는 앞에서부터 연속으로 성공한 페이지까지만 전진 (실패 페이지부터 재개)
+        contiguous = True
+        for page in pages:
+            self.stdout.write(f'데이터 조회 결과... ({page.start} ~ {page.end})')
+            if not page.ok:
+                self.stdout.write(self.style.ERROR(f'  → 데이터 조회 오류 ({page.attempts}회 시도): {page.error}'))
+                contiguous = False
+                continue
             
-            rows = self.fetch_data(start_index, end_index)
+            rows = page.rows
             if rows:
-                if include_all:
+                removed_mgtnos = []
+                if watermark:
+                    # 변경분만: 저장 대상은 upsert, 삭제(D)/폐업 행은 제거
+                    page_stores, removed_mgtnos = split_changes(rows, watermark, keep=self.is_target)
+                    all_stores.extend(page_stores)
+                    self.stdout.write(
+                        f'  → 변경 {len(page_stores)}건, 제거 대상 {len(removed_mgtnos)}건 (누적: {len(all_stores)}건)'
+                    )
+                elif include_all:
                     # 모든 데이터 포함
-                    all_stores.extend(rows)
+                    page_stores = rows
+                    all_stores.extend(page_stores)
                     self.stdout.write(f'  → {len(rows)}건 추가 (누적: {len(all_stores)}건)')
                 else:
                     # 영업중인 것만 필터링 (TRDSTATENM이 '영업' 포함 또는 TRDSTATEGBN이 '01')
-                    active_stores = [
-                        row for row in rows 
-                        if row.get('TRDSTATEGBN', '') == '01' or '영업' in row.get('TRDSTATENM', '')
-                    ]
-                    all_stores.extend(active_stores)
-                    self.stdout.write(f'  → 영업중 {len(active_stores)}건 발견 (누적: {len(all_stores)}건)')
+                    page_stores = [row for row in rows if self.is_target(row)]
+                    all_stores.extend(page_stores)
+                    self.stdout.write(f'  → 영업중 {len(page_stores)}건 발견 (누적: {len(all_stores)}건)')
+                
+                if not dry_run:
+                    page_saved, page_updated = self.save_to_db(page_stores, target_gu)
+                    saved_count += page_saved
+                    updated_count += page_updated
+                    removed_count += delete_rows(TobaccoRetailLicense, removed_mgtnos, gu=target_gu)
             
-            start_index += self.PAGE_SIZE
+            if contiguous and not dry_run:
+                save_cursor(target_gu, self.CHECKPOINT_STAGE, next_start=page.end + 1, total_count=total_count)
+        
+        if fetch_stats.failed:
+            raise CommandError(
+                f'{fetch_stats.failed}개 페이지 조회 실패 (재시도 소진) - --resume 으로 실패 페이지부터 재개 가능'
+            )
         
         status_msg = '전체' if include_all else '영업중'
         self.stdout.write(self.style.SUCCESS(f'\n총 {status_msg} 담배소매업 데이터: {len(all_stores)}건'))
         
-        # 3. DB에 저장
+        # 3. DB 저장 결과
         if dry_run:
             self.stdout.write(self.style.WARNING('\n[DRY RUN] DB 저장 생략'))
             self.print_sample_data(all_stores[:10])
         else:
-            saved_count, updated_count = self.save_to_db(all_stores, target_gu)
             self.stdout.write(self.style.SUCCESS(f'\nDB 저장 완료: 신규 {saved_count}건, 업데이트 {updated_count}건'))
+            if watermark:
+                self.stdout.write(self.style.SUCCESS(f'DB 제거 완료: 삭제/폐업 {removed_count}건'))
         
         self.stdout.write(self.style.SUCCESS('=== 수집 완료 ==='))
 
+    def is_target(self, row):
+        """저장 대상 여부 (--all: 전체, 기본: 영업중 - TRDSTATENM이 '영업' 포함 또는 TRDSTATEGBN이 '01')"""
+        if self.include_all:
+            return True
+        return row.get('TRDSTATEGBN', '') == '01' or '영업' in row.get('TRDSTATENM', '')
+
+    def build_row_filter(self, watermark=None):
+        """
+        디코딩 단계 행 필터
+
+        증분 모드에서는 저장 대상이 아니어도 워터마크 이후 변경된 행은 남긴다. (DB 제거 판단용)
+        """
+        if self.include_all:
+            return None
+        if watermark:
+            return RowFilter(self.FILTER_FIELDS, lambda row: self.is_target(row) or row_changed_at(row) >= watermark)
+        return RowFilter(self.FILTER_FIELDS, self.is_target)
+
     def get_total_count(self):
-        """전체 데이터 수 조회"""
+        """전체 데이터 수 조회 (호출 실패 / 응답 오류는 CommandError, 0건으로 처리하지 않음)"""
         url = f'{self.BASE_URL}/{self.API_KEY}/json/{self.service_name}/1/1/'
         try:
-            response = requests.get(url, timeout=30)
+            response = request('GET', url, limiter_key='seoul', timeout=30)
             response.raise_for_status()
             data = response.json()
-            
-            if self.service_name in data:
-                return data[self.service_name]['list_total_count']
-            else:
-                self.stdout.write(self.style.ERROR(f'응답 오류: {data}'))
-                return 0
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f'API 호출 오류: {e}'))
+        except (RequestFailedError, requests.RequestException, ValueError) as e:
+            raise CommandError(f'API 호출 오류 (재시도 소진): {e}')
+        
+        if self.service_name in data:
+            return data[self.service_name]['list_total_count']
+        # 데이터 없음(INFO-200)만 0건, 그 외 RESULT 코드는 오류
+        if data.get('RESULT', {}).get('CODE') == 'INFO-200':
             return 0
-
-    def fetch_data(self, start_index, end_index):
-        """데이터 조회"""
-        url = f'{self.BASE_URL}/{self.API_KEY}/json/{self.service_name}/{start_index}/{end_index}/'
-        try:
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
-            data = response.json()
-            
-            if self.service_name in data:
-                return data[self.service_name].get('row', [])
-            return []
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f'데이터 조회 오류: {e}'))
-            return []
+        raise CommandError(f'응답 오류: {data}')
 
     def save_to_db(self, stores, target_gu):
-        """DB에 저장 (update_or_create 사용, Race Condition 방지)"""
-        from django.db import transaction
-        saved_count = 0
-        updated_count = 0
-        
-        for store in stores:
-            mgtno = store.get('MGTNO', '')
-            if not mgtno:
-                continue
+        """DB에 저장 (mgtno 기준 배치 upsert: INSERT ... ON CONFLICT DO UPDATE)"""
+        rows = []
+        stores = [store for store in stores if store.get('MGTNO', '')]
+        
+        # 페이지 전체 TM 좌표를 한 번에 WGS84 로 변환 (변환 불가 → NaN)
+        latitudes, longitudes = convert_tm_to_wgs84_batch(
+            [store.get('X') for store in stores],
+            [store.get('Y') for store in stores],
+        )
+        
+        for store, lat, lng in zip(stores, latitudes, longitudes):
+            mgtno = store['MGTNO']
             
             # 원본 TM 좌표
             x_coord = store.get('X', '')
@@ -183,16 +274,16 @@ class Command(BaseCommand):
             if y_coord:
                 y_coord = y_coord.strip()
             
-            # TM 좌표를 WGS84(위도/경도)로 변환
+            # 변환 결과 적용 (NaN → 좌표 없음)
             latitude, longitude = None, None
             location = None
             
-            if x_coord and y_coord:
-                latitude, longitude = convert_tm_to_wgs84(x_coord, y_coord)
-                if latitude and longitude:
-                    location = Point(longitude, latitude, srid=4326)  # Point(x=lon, y=lat)
+            if x_coord and y_coord and not (np.isnan(lat) or np.isnan(lng)):
+                latitude, longitude = float(lat), float(lng)
+                location = Point(longitude, latitude, srid=4326)  # Point(x=lon, y=lat)
             
-            defaults = {
+            rows.append({
+                'mgtno': mgtno,
                 'opnsfteamcode': store.get('OPNSFTEAMCODE', ''),
                 'gu': target_gu,  # 구 정보 저장
                 'bplcnm': store.get('BPLCNM', ''),
@@ -223,21 +314,9 @@ class Command(BaseCommand):
                 'uptaenm': store.get('UPTAENM', ''),
                 'asgnymd': store.get('ASGNYMD', ''),
                 'mwsrnm': store.get('MWSRNM', ''),
-            }
-            
-            # Race Condition 방지: transaction.atomic + select_for_update
-            with transaction.atomic():
-                obj, created = TobaccoRetailLicense.objects.select_for_update().update_or_create(
-                    mgtno=mgtno,
-                    defaults=defaults
-                )
-            
-            if created:
-                saved_count += 1
-            else:
-                updated_count += 1
+            })
         
-        return saved_count, updated_count
+        return bulk_upsert(TobaccoRetailLicense, rows, unique_field='mgtno', batch_size=self.batch_size)
 
     def print_sample_data(self, stores):
         """샘플 데이터 출력"""
@@ -0,0 +1,386 @@
+# stores/management/commands/pipeline.py
+"""
+구 단위 파이프라인 단계 정의 + 서울 전역 동시 실행 모듈
+
+run_all 커맨드에서 사용하는 5단계 파이프라인을 선언적으로 정의하고,
+여러 구를 공유 워커 풀에서 동시에 실행한다.
+
+- 단계 간 의존성을 선언 (다이소 → 편의점, 휴게음식점/담배소매업은 독립, 폐업검증은 마지막)
+- 의존성이 없는 단계는 병렬 실행 (구당 벽시계 시간 ≈ 가장 긴 경로)
+- 단계별로 호출하는 외부 API(provider)를 명시
+- provider별 예산(동시 실행 슬롯 + 최소 시작 간격)으로 API 한도 준수
+  (카카오 / 서울시 OpenAPI / 다이소몰)
+- 구별 + 서울 전체 처리량 리포트 생성
+- 단계별 체크포인트 기록 (resume=True: 완료 단계 스킵, 중단 지점부터 재개)
+
+사용법:
+    from .pipeline import PIPELINE_STAGES, run_city_pipeline
+
+    reports, wall_time = run_city_pipeline(gu_list, PIPELINE_STAGES, workers=5)
+
+    # 단일 구: 단계 그래프만 실행
+    result = run_stage_graph(PIPELINE_STAGES, execute=lambda stage: run_stage(stage, '영등포구'))
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.core.management import call_command
+from django.db import connection
+
+from . import checkpoints
+
+
+@dataclass(frozen=True)
+class Stage:
+    """파이프라인 단계 정의"""
+    name: str                      # 단계 키 (daiso, convenience, ...)
+    label: str                     # 출력용 이름
+    command: str                   # 실행할 management command
+    provider: Optional[str] = None  # 호출하는 외부 API (None: API 호출 없음)
+    options: Dict = field(default_factory=dict)
+    depends_on: Tuple[str, ...] = ()  # 선행 단계 키
+    resumable: bool = False  # --resume 옵션 지원 여부 (단계 내부 cursor부터 재개)
+
+
+# 구 단위 5단계 파이프라인 (선언 순서 = 기존 run_all 실행 순서)
+# 휴게음식점/담배소매업은 구 이름만 필요하므로 카카오 수집과 병렬 실행
+PIPELINE_STAGES = [
+    Stage('daiso', '다이소 수집', 'v2_3_1_collect_yeongdeungpo_daiso',
+          provider='daiso', options={'clear': True}),
+    Stage('convenience', '편의점 수집', 'v2_3_2_collect_Convenience_Only',
+          provider='kakao', options={'clear': True, 'use_async': True},
+          depends_on=('daiso',), resumable=True),
+    Stage('restaurant', '휴게음식점 인허가 수집', 'openapi_1',
+          provider='seoul', options={'clear': True}, resumable=True),
+    Stage('tobacco', '담배소매업 인허가 수집', 'openapi_2',
+          provider='seoul', options={'clear': True}, resumable=True),
+    Stage('closure', '폐업 검증', 'check_store_closure',
+          provider=None, options={'clear': True},
+          depends_on=('convenience', 'restaurant', 'tobacco')),
+]
+
+# provider별 예산
+# - slots: 동시에 실행 가능한 단계 수 (카카오는 수집기 내부에서 이미 8개 동시 호출)
+# - min_interval: 같은 provider 단계 시작 간 최소 간격 (초)
+PROVIDER_BUDGETS = {
+    'kakao': {'slots': 1, 'min_interval': 1.0},
+    'seoul': {'slots': 4, 'min_interval': 0.5},
+    'daiso': {'slots': 2, 'min_interval': 1.0},
+}
+
+
+class ProviderBudget:
+    """
+    provider별 동시 실행 슬롯 + 시작 간격 제한
+
+    여러 워커 스레드가 공유하며, 같은 provider를 호출하는 단계가
+    예산 이상으로 동시에 실행되지 않도록 보장한다.
+    """
+
+    def __init__(self, slots: int = 1, min_interval: float = 0.0):
+        self._semaphore = threading.BoundedSemaphore(slots)
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last_start = 0.0
+
+    def __enter__(self):
+        self._semaphore.acquire()
+        with self._lock:
+            delay = self._last_start + self._min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._last_start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._semaphore.release()
+
+
+def build_budgets(overrides: Optional[Dict[str, int]] = None) -> Dict[str, ProviderBudget]:
+    """PROVIDER_BUDGETS 기반 ProviderBudget 생성 (overrides: provider별 슬롯 수 재지정)"""
+    overrides = overrides or {}
+    return {
+        provider: ProviderBudget(
+            slots=overrides.get(provider) or config['slots'],
+            min_interval=config['min_interval'],
+        )
+        for provider, config in PROVIDER_BUDGETS.items()
+    }
+
+
+@dataclass
+class GraphResult:
+    """단계 그래프 실행 결과"""
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    failed_stage: Optional[str] = None
+    error: Optional[str] = None
+    exception: Optional[BaseException] = None
+    total_time: float = 0.0
+    serial_time: float = 0.0
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.failed_stage is None
+
+
+def critical_path(stages: List[Stage], stage_times: Dict[str, float]) -> Tuple[List[str], float]:
+    """
+    실행된 단계 기준 임계 경로(가장 긴 의존 경로) 계산
+
+    실행되지 않은(스킵된) 단계는 소요 시간 0으로 취급한다.
+    stages는 선행 단계가 항상 먼저 오도록 선언되어 있어야 한다.
+    """
+    finish = {}
+    previous = {}
+    for stage in stages:
+        best_dep = None
+        for dep in stage.depends_on:
+            if dep in finish and (best_dep is None or finish[dep] > finish[best_dep]):
+                best_dep = dep
+        start = finish[best_dep] if best_dep else 0.0
+        finish[stage.name] = start + stage_times.get(stage.name, 0.0)
+        previous[stage.name] = best_dep
+
+    if not finish:
+        return [], 0.0
+
+    node = max(finish, key=finish.get)
+    total = finish[node]
+    path = []
+    while node:
+        if node in stage_times:
+            path.append(node)
+        node = previous[node]
+    return list(reversed(path)), round(total, 2)
+
+
+def run_stage_graph(
+    stages: List[Stage],
+    execute: Callable[[Stage], None],
+    on_start: Optional[Callable] = None,
+    on_done: Optional[Callable] = None,
+) -> GraphResult:
+    """
+    의존성 기반 단계 스케줄러
+
+    선행 단계가 모두 끝난 단계를 즉시 병렬로 실행한다.
+    stages에 없는 선행 단계(스킵된 단계)는 완료된 것으로 간주한다.
+    한 단계라도 실패하면 새 단계를 시작하지 않고, 실행 중인 단계만 마무리한다.
+
+    Args:
+        stages: 실행할 단계 목록
+        execute: 워커 스레드에서 단계를 실행하는 함수 (예외 발생 = 실패)
+        on_start: 단계 시작 콜백 (stage)
+        on_done: 단계 완료 콜백 (stage, seconds)
+    """
+    result = GraphResult()
+    names = {stage.name for stage in stages}
+    pending = list(stages)
+    done = set()
+    running = {}
+    graph_start = time.time()
+
+    def timed_execute(stage):
+        stage_start = time.time()
+        try:
+            execute(stage)
+        finally:
+            result.stage_times[stage.name] = round(time.time() - stage_start, 2)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(stages))) as executor:
+        while pending or running:
+            if result.success:
+                ready = [
+                    stage for stage in pending
+                    if all(dep in done or dep not in names for dep in stage.depends_on)
+                ]
+                for stage in ready:
+                    pending.remove(stage)
+                    if on_start:
+                        on_start(stage)
+                    running[executor.submit(timed_execute, stage)] = stage
+            else:
+                pending = []
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    if result.success:
+                        result.failed_stage = stage.name
+                        result.error = str(exc)
+                        result.exception = exc
+                    continue
+                done.add(stage.name)
+                if on_done:
+                    on_done(stage, result.stage_times[stage.name])
+
+    result.total_time = round(time.time() - graph_start, 2)
+    result.serial_time = round(sum(result.stage_times.values()), 2)
+    result.critical_path, result.critical_path_time = critical_path(stages, result.stage_times)
+    return result
+
+
+@dataclass
+class GuReport:
+    """구별 실행 결과"""
+    gu: str
+    success: bool = True
+    failed_stage: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    output: Dict[str, str] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+
+
+def run_stage(stage: Stage, target_gu: str, stdout=None, resume: bool = False):
+    """
+    단일 단계 실행 (call_command 래퍼 + 체크포인트 기록)
+
+    resume=True이면 기존 데이터를 삭제하지 않고,
+    resumable 단계는 저장된 cursor부터 이어서 수집한다.
+    """
+    options = dict(stage.options)
+    if resume:
+        options['clear'] = False
+        if stage.resumable:
+            options['resume'] = True
+    if stdout is not None:
+        options['stdout'] = stdout
+
+    checkpoints.mark_running(target_gu, stage.name)
+    try:
+        call_command(stage.command, gu=target_gu, **options)
+    except Exception as e:
+        checkpoints.mark_failed(target_gu, stage.name, e)
+        raise
+    checkpoints.mark_completed(target_gu, stage.name)
+
+
+def pending_stages(stages: List[Stage], target_gu: str, resume: bool) -> List[Stage]:
+    """
+    실행할 단계 목록
+
+    resume=False: 구 체크포인트를 초기화하고 전체 단계 실행
+    resume=True: 완료 기록이 있는 단계는 제외 (의존성은 충족된 것으로 간주)
+    """
+    if not resume:
+        checkpoints.reset_checkpoints(target_gu)
+        return list(stages)
+    return [stage for stage in stages if not checkpoints.is_completed(target_gu, stage.name)]
+
+
+def run_gu_pipeline(
+    target_gu: str,
+    stages: List[Stage],
+    budgets: Dict[str, ProviderBudget],
+    on_stage_done: Optional[Callable] = None,
+    resume: bool = False,
+) -> GuReport:
+    """
+    단일 구 파이프라인 실행 (단계 그래프 스케줄러 사용)
+
+    단계 출력은 단계별로 캡처하여 병렬 실행 시 로그가 섞이지 않도록 한다.
+    """
+    report = GuReport(gu=target_gu)
+    try:
+        stages = pending_stages(stages, target_gu, resume)
+    finally:
+        connection.close()
+
+    def execute(stage):
+        buffer = StringIO()
+        try:
+            budget = budgets.get(stage.provider)
+            if budget is not None:
+                with budget:
+                    run_stage(stage, target_gu, stdout=buffer, resume=resume)
+            else:
+                run_stage(stage, target_gu, stdout=buffer, resume=resume)
+        finally:
+            report.output[stage.name] = buffer.getvalue()
+            # 워커 스레드별 DB 커넥션 정리
+            connection.close()
+
+    def on_done(stage, seconds):
+        if on_stage_done:
+            on_stage_done(target_gu, stage, seconds)
+
+    result = run_stage_graph(stages, execute, on_done=on_done)
+
+    report.success = result.success
+    report.failed_stage = result.failed_stage
+    report.error = result.error
+    report.elapsed = result.total_time
+    report.stage_times = result.stage_times
+    report.critical_path = result.critical_path
+    report.critical_path_time = result.critical_path_time
+    return report
+
+
+def run_city_pipeline(
+    gu_list: List[str],
+    stages: List[Stage],
+    workers: int = 5,
+    budget_overrides: Optional[Dict[str, int]] = None,
+    on_stage_done: Optional[Callable] = None,
+    on_gu_done: Optional[Callable] = None,
+    resume: bool = False,
+):
+    """
+    여러 구 파이프라인을 공유 워커 풀에서 동시 실행
+
+    Returns:
+        (구별 GuReport 리스트 (입력 순서), 전체 벽시계 시간(초))
+    """
+    budgets = build_budgets(budget_overrides)
+    reports = {}
+    city_start = time.time()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_gu_pipeline, gu, stages, budgets, on_stage_done, resume): gu
+            for gu in gu_list
+        }
+        for future in as_completed(futures):
+            report = future.result()
+            reports[report.gu] = report
+            if on_gu_done:
+                on_gu_done(report)
+
+    wall_time = round(time.time() - city_start, 2)
+    return [reports[gu] for gu in gu_list], wall_time
+
+
+def summarize_throughput(reports: List[GuReport], wall_time: float) -> Dict:
+    """서울 전체 처리량 요약"""
+    succeeded = [r for r in reports if r.success]
+    serial_time = sum(r.elapsed for r in reports)
+    stage_totals = {}
+    for r in reports:
+        for name, seconds in r.stage_times.items():
+            stage_totals[name] = stage_totals.get(name, 0.0) + seconds
+
+    return {
+        'gu_total': len(reports),
+        'gu_succeeded': len(succeeded),
+        'gu_failed': len(reports) - len(succeeded),
+        'wall_time': wall_time,
+        'serial_time': round(serial_time, 2),
+        'parallelism': round(serial_time / wall_time, 2) if wall_time else 0.0,
+        'gu_per_hour': round(len(succeeded) / wall_time * 3600, 1) if wall_time else 0.0,
+        'stage_totals': {k: round(v, 2) for k, v in stage_totals.items()},
+    }
@@ -0,0 +1,100 @@
+# stores/management/commands/plan_kakao_queries.py
+"""
+카카오 편의점 검색 rect 계획 생성 (가중 greedy set-cover)
+- 구 경계를 모두 덮으면서 예상 호출 수가 최소가 되도록 여러 크기의 rect 를 선택
+- 매장 밀도(기존 수집 편의점 또는 소상공인상권 데이터)로 rect 별 페이지 수 추정
+- 계획 JSON 저장 → v2_3_2_collect_Convenience_Only --plan <경로> 로 실행
+
+사용법:
+    python manage.py plan_kakao_queries --gu 영등포구
+    python manage.py plan_kakao_queries --gu 강남구 --density public_data --sizes 0.5 1 2 3
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from stores.models import YeongdeungpoConvenience
+from .gu_boundaries import SEOUL_GU_BOUNDARIES
+from .public_data_cache import load_public_data
+from .query_planner import DEFAULT_ELEMENT_KM, DEFAULT_SIZES_KM, default_plan_path, plan_queries, save_plan
+
+
+class Command(BaseCommand):
+    help = '카카오 편의점 검색 rect 계획 생성 (구 경계 set-cover, --plan 으로 수집)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--gu',
+            type=str,
+            default='영등포구',
+            help=f'대상 구 (기본: 영등포구). 지원: {", ".join(SEOUL_GU_BOUNDARIES)}'
+        )
+        parser.add_argument(
+            '--density',
+            choices=('db', 'public_data', 'none'),
+            default='db',
+            help='매장 밀도 좌표: db=기존 수집 편의점 (기본), public_data=소상공인상권, none=비용 1'
+        )
+        parser.add_argument(
+            '--element-km',
+            type=float,
+            default=DEFAULT_ELEMENT_KM,
+            help=f'커버 단위 칸 한 변 (km, 기본: {DEFAULT_ELEMENT_KM:g})'
+        )
+        parser.add_argument(
+            '--sizes',
+            type=float,
+            nargs='+',
+            default=list(DEFAULT_SIZES_KM),
+            help=f'후보 rect 한 변 목록 (km, 기본: {" ".join(f"{s:g}" for s in DEFAULT_SIZES_KM)})'
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=None,
+            help='계획 JSON 경로 (기본: .cache/plans/<구>.json)'
+        )
+
+    def load_points(self, target_gu, density):
+        """밀도 추정용 좌표 [(경도, 위도), ...]"""
+        if density == 'db':
+            return [
+                (location.x, location.y)
+                for location in YeongdeungpoConvenience.objects.filter(gu=target_gu).values_list('location', flat=True)
+                if location
+            ]
+        if density == 'public_data':
+            frame = load_public_data(target_gu)
+            frame = frame[frame['lat'].notna() & frame['lng'].notna()]
+            return list(zip(frame['lng'], frame['lat']))
+        return []
+
+    def handle(self, *args, **options):
+        target_gu = options['gu']
+        if target_gu not in SEOUL_GU_BOUNDARIES:
+            raise CommandError(f"경계 데이터가 없는 구입니다: {target_gu}")
+        if options['element_km'] <= 0 or any(size <= 0 for size in options['sizes']):
+            raise CommandError('--element-km / --sizes 는 0보다 커야 합니다.')
+
+        points = self.load_points(target_gu, options['density'])
+        if options['density'] != 'none' and not points:
+            self.stdout.write(self.style.WARNING(
+                f"⚠️ {target_gu} 밀도 좌표가 없어 모든 rect 비용을 1로 계산합니다."
+            ))
+
+        plan = plan_queries(
+            target_gu,
+            points=points,
+            element_km=options['element_km'],
+            sizes_km=options['sizes'],
+        )
+        path = save_plan(plan, options['output'] or default_plan_path(target_gu))
+
+        sizes = ", ".join(
+            f"{size:g}km {sum(1 for item in plan.rects if item.size_km == size)}개" for size in plan.sizes_km
+        )
+        self.stdout.write(self.style.SUCCESS(f"""
+--- 🗺️ {target_gu} 검색 계획 ---
+  칸: {plan.element_count}개 ({plan.element_km:g}km), 밀도 좌표: {plan.density_points}개
+  rect: {len(plan.rects)}개 ({sizes})
+  예상 호출: {plan.estimated_calls}회 (고정 격자 {plan.baseline_tile_km:g}km: {plan.baseline_calls}회)
+  저장: {path}
+        """))
@@ -0,0 +1,199 @@
+# stores/management/commands/public_data_cache.py
+"""
+public_data.csv (소상공인상권) Parquet 캐시 로더
+
+매 실행마다 pd.read_csv(cp949) + iterrows() 로 정규화하던 작업을 한 번만 수행하고,
+정규화된 이름 / 도로명 주소 / 반올림 좌표까지 계산된 결과를 Parquet 으로 저장한다.
+
+- 캐시 위치: <프로젝트>/.cache/public_data.<구>.d<자릿수>.parquet
+- 무효화: 원본 CSV 의 mtime 또는 CACHE_VERSION 이 다르면 다시 생성
+- 로드: pyarrow memory_map 읽기 (숫자 컬럼은 복사 없이 DataFrame 으로 변환)
+
+전국 파티션 데이터셋 (ingest_public_data 명령으로 생성):
+- 위치: <프로젝트>/.cache/public_data_dataset/gu=<구>/part-0.parquet (hive 파티션)
+- 파티션이 있으면 해당 구 파일만 읽고, 없으면 위 public_data.csv 캐시로 대체
+- 파티션 내부는 공간 셀(cell) 순으로 정렬 → row group 통계로 영역 필터 가능
+
+컬럼:
+    id, name, road_addr, lot_addr, address, dong, lat, lng,
+    name_norm, address_norm, lat_round, lng_round
+    (+ 파티션 데이터셋은 cell)
+
+사용법:
+    from .public_data_cache import load_public_data
+
+    df = load_public_data('영등포구', decimals=4)
+    rows = to_records(df)   # NaN → None
+"""
+
+import os
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .normalize import (
+    extract_dong_series,
+    extract_road_address_series,
+    normalize_name_series,
+    round_coord_series,
+)
+from .spatial_match import DEFAULT_CELL_M, cell_ids
+
+
+CACHE_VERSION = '1'  # 정규화 규칙이 바뀌면 올려서 캐시 무효화
+METADATA_KEY = b'public_data_cache'
+PROJECT_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+CACHE_DIR = os.path.join(PROJECT_ROOT, '.cache')
+DATASET_DIR = os.path.join(CACHE_DIR, 'public_data_dataset')
+PARTITION_ROW_GROUP_SIZE = 4096  # 셀 정렬 후 row group 단위 min/max 통계가 의미 있도록 작게
+
+
+def find_csv_path():
+    """public_data.csv 경로 (프로젝트 루트 → 현재 디렉토리 순)"""
+    csv_path = os.path.join(PROJECT_ROOT, 'public_data.csv')
+    if not os.path.exists(csv_path):
+        csv_path = os.path.join(os.getcwd(), 'public_data.csv')
+    return csv_path
+
+
+def cache_path_for(target_gu, decimals):
+    """구 / 반올림 자릿수별 캐시 파일 경로 (주소 정규화에 구 이름이 포함되므로 구별로 분리)"""
+    return os.path.join(CACHE_DIR, f'public_data.{target_gu}.d{decimals}.parquet')
+
+
+def partition_dir(target_gu, dataset_dir=None):
+    """구 파티션 디렉토리 경로 (hive 형식 gu=<구>)"""
+    return os.path.join(dataset_dir or DATASET_DIR, f'gu={target_gu}')
+
+
+def _cache_key(csv_path, decimals):
+    return f'{CACHE_VERSION}:{os.path.getmtime(csv_path)}:{decimals}'.encode('utf-8')
+
+
+def build_frame(csv_df, target_gu, decimals=4):
+    """
+    원본 CSV DataFrame → 정규화 컬럼이 포함된 DataFrame
+
+    Column1 = ID, Column2 = 상호명, Column25 = 지번주소, Column32 = 도로명주소,
+    Column38 = 경도, Column39 = 위도
+    """
+    def text(column):
+        return csv_df[column].astype(object).where(csv_df[column].notna(), '').astype(str)
+
+    road_addr = text('Column32').replace('nan', '')
+    lot_addr = text('Column25').replace('nan', '')
+    name = text('Column2')
+    # 도로명주소가 없으면 지번주소 사용
+    address = road_addr.where(road_addr != '', lot_addr)
+
+    lat = pd.to_numeric(csv_df['Column39'], errors='coerce')
+    lng = pd.to_numeric(csv_df['Column38'], errors='coerce')
+
+    return pd.DataFrame({
+        'id': csv_df['Column1'].astype(str),
+        'name': name,
+        'road_addr': road_addr,
+        'lot_addr': lot_addr,
+        'address': address,
+        'dong': extract_dong_series(lot_addr),
+        'lat': lat,
+        'lng': lng,
+        'name_norm': normalize_name_series(name),
+        'address_norm': extract_road_address_series(address, target_gu),
+        # 카카오/인허가 좌표와 같은 규칙(round_coord)으로 반올림해야 집합 비교가 일치
+        'lat_round': round_coord_series(lat, decimals),
+        'lng_round': round_coord_series(lng, decimals),
+    })
+
+
+def write_partition(frame, target_gu, dataset_dir=None, cell_m=DEFAULT_CELL_M):
+    """
+    build_frame 결과를 구 파티션으로 저장 (기존 파티션 교체)
+
+    공간 셀 번호(cell) 컬럼을 추가하고 셀 순으로 정렬하여 가까운 매장이 같은 row group 에 모이게 한다.
+    """
+    frame = frame.assign(cell=cell_ids(frame['lat'], frame['lng'], cell_m))
+    frame = frame.sort_values(['cell', 'id'], kind='stable').reset_index(drop=True)
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        METADATA_KEY: CACHE_VERSION.encode('utf-8'),
+    })
+
+    # 파일 하나를 임시 이름으로 쓴 뒤 rename (읽는 쪽은 완성된 파일만 본다)
+    directory = partition_dir(target_gu, dataset_dir)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, 'part-0.parquet')
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    pq.write_table(table, tmp_path, row_group_size=PARTITION_ROW_GROUP_SIZE)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_partition(target_gu, decimals=4, dataset_dir=None):
+    """
+    구 파티션만 읽어 정규화 DataFrame 반환 (파티션이 없거나 버전이 다르면 None)
+
+    반올림 좌표는 요청한 decimals 로 다시 계산한다 (파티션은 자릿수와 무관하게 하나만 저장).
+    """
+    path = os.path.join(partition_dir(target_gu, dataset_dir), 'part-0.parquet')
+    if not os.path.exists(path):
+        return None
+
+    table = pq.read_table(path, memory_map=True)
+    if (table.schema.metadata or {}).get(METADATA_KEY) != CACHE_VERSION.encode('utf-8'):
+        return None
+
+    frame = table.to_pandas()
+    frame['lat_round'] = round_coord_series(frame['lat'], decimals)
+    frame['lng_round'] = round_coord_series(frame['lng'], decimals)
+    return frame
+
+
+def load_public_data(target_gu, decimals=4, csv_path=None, refresh=False):
+    """
+    정규화된 public_data DataFrame 로드 (캐시가 없거나 오래되면 생성)
+
+    전국 파티션 데이터셋에 target_gu 파티션이 있으면 그 파일만 읽는다
+    (csv_path 를 직접 지정하면 파티션을 사용하지 않음).
+
+    Args:
+        target_gu: 주소 정규화에 사용할 구 이름
+        decimals: 좌표 반올림 자릿수
+        csv_path: 원본 CSV 경로 (기본: find_csv_path())
+        refresh: True 면 캐시 무시하고 다시 생성
+    """
+    if csv_path is None:
+        frame = read_partition(target_gu, decimals)
+        if frame is not None:
+            return frame
+
+    csv_path = csv_path or find_csv_path()
+    cache_path = cache_path_for(target_gu, decimals)
+    cache_key = _cache_key(csv_path, decimals)
+
+    if not refresh and os.path.exists(cache_path):
+        table = pq.read_table(cache_path, memory_map=True)
+        if (table.schema.metadata or {}).get(METADATA_KEY) == cache_key:
+            return table.to_pandas()
+
+    csv_df = pd.read_csv(csv_path, encoding='cp949')
+    frame = build_frame(csv_df, target_gu, decimals)
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), METADATA_KEY: cache_key})
+
+    # 다른 구 / 프로세스가 읽는 중에도 깨진 파일이 보이지 않도록 임시 파일 → rename
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f'{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, cache_path)
+    return frame
+
+
+def to_records(frame):
+    """DataFrame → dict 목록 (NaN → None)"""
+    return frame.astype(object).where(frame.notna(), None).to_dict('records')
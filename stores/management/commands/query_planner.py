@@ -0,0 +1,263 @@
+# stores/management/commands/query_planner.py
+"""
+카카오 검색 rect 계획기 (가중 greedy set-cover)
+
+test_core 의 최적 반경 산출은 다이소 정사각형 합집합으로 구 경계 커버리지를 확인할 뿐,
+실제로 몇 번의 호출이 필요한지는 최적화하지 않는다.
+구 경계를 element_km 칸(원소)으로 나누고, 여러 크기의 후보 rect 중
+"새로 덮는 칸 수 / 예상 호출 수" 가 가장 큰 rect 를 모든 칸이 덮일 때까지 고른 뒤,
+다른 rect 들로 이미 덮이는 중복 rect 를 비용이 큰 것부터 제거한다.
+
+- 예상 호출 수: rect 안 매장 수 n (밀도 좌표 기준) → max(1, ceil(n / 15)) 페이지
+- n > 45 인 rect 는 결과가 잘리므로 후보에서 제외 (가장 작은 크기는 예외, 수집 시 적응형 분할)
+- 밀도 좌표가 없으면 모든 rect 비용 1 (순수 기하 커버)
+- 칸 / 후보 창 합계는 2차원 누적합으로 계산 (후보 수천 개도 반복당 O(격자 크기))
+
+결과(QueryPlan)는 JSON 으로 저장하고 v2_3_2_collect_Convenience_Only --plan 으로 그대로 실행한다.
+
+사용법:
+    from .query_planner import plan_queries, save_plan
+
+    plan = plan_queries('영등포구', points=[(126.90, 37.52), ...])
+    save_plan(plan, '.cache/plans/영등포구.json')
+"""
+
+import json
+import math
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .async_collector import KAKAO_MAX_PAGES, KAKAO_PAGE_SIZE
+from .gu_boundaries import DEFAULT_TILE_KM, grid_spec, tile_cells
+from .public_data_cache import CACHE_DIR
+
+
+DEFAULT_ELEMENT_KM = 0.25
+DEFAULT_SIZES_KM = (0.5, 1.0, 2.0)
+PLAN_DIR = os.path.join(CACHE_DIR, 'plans')
+MAX_RESULTS = KAKAO_PAGE_SIZE * KAKAO_MAX_PAGES
+
+
+@dataclass
+class PlannedRect:
+    """계획된 검색 rect 1건"""
+    rect: str
+    size_km: float
+    estimated_stores: int
+    estimated_calls: int
+
+
+@dataclass
+class QueryPlan:
+    """구 단위 검색 계획"""
+    gu: str
+    element_km: float
+    sizes_km: List[float]
+    element_count: int
+    density_points: int
+    rects: List[PlannedRect] = field(default_factory=list)
+    baseline_tile_km: float = DEFAULT_TILE_KM
+    baseline_calls: int = 0
+    created_at: str = ''
+
+    @property
+    def estimated_calls(self) -> int:
+        return sum(item.estimated_calls for item in self.rects)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data['estimated_calls'] = self.estimated_calls
+        return data
+
+
+def _window_sums(prefix: np.ndarray, k: int) -> np.ndarray:
+    """누적합 → 모든 k x k 창 합계 (좌하단 (r, c) 기준)"""
+    return prefix[k:, k:] - prefix[:-k, k:] - prefix[k:, :-k] + prefix[:-k, :-k]
+
+
+def _prefix(matrix: np.ndarray) -> np.ndarray:
+    prefix = np.zeros((matrix.shape[0] + 1, matrix.shape[1] + 1), dtype=np.int64)
+    prefix[1:, 1:] = matrix.cumsum(axis=0).cumsum(axis=1)
+    return prefix
+
+
+def _pages(stores: np.ndarray) -> np.ndarray:
+    """예상 매장 수 → 예상 호출(페이지) 수"""
+    return np.maximum(1, np.ceil(stores / KAKAO_PAGE_SIZE)).astype(np.int64)
+
+
+def plan_queries(
+    gu_name: str,
+    points: Optional[Iterable[Tuple[float, float]]] = None,
+    element_km: float = DEFAULT_ELEMENT_KM,
+    sizes_km: Sequence[float] = DEFAULT_SIZES_KM,
+    baseline_tile_km: float = DEFAULT_TILE_KM,
+) -> QueryPlan:
+    """
+    구 경계를 모두 덮는 최소 호출 rect 계획 (가중 greedy set-cover)
+
+    Args:
+        gu_name: 구 이름
+        points: 매장 밀도 추정용 좌표 [(경도, 위도), ...] (None 이면 비용 1)
+        element_km: 커버 단위 칸 한 변 (km)
+        sizes_km: 후보 rect 한 변 목록 (element_km 배수로 반올림)
+        baseline_tile_km: 비교용 고정 격자 타일 크기
+
+    Returns:
+        QueryPlan (rects 는 선택 순서)
+    """
+    # 후보 크기 (칸 단위), 가장 작은 크기는 항상 1칸 포함 → 모든 칸을 덮을 수 있음
+    sizes = sorted({1} | {max(1, round(size / element_km)) for size in sizes_km})
+    pad = sizes[-1]
+
+    min_x, min_y, step_x, step_y, rows, cols = grid_spec(gu_name, element_km)
+    uncovered = np.zeros((rows + 2 * pad, cols + 2 * pad), dtype=np.int64)
+    for row, col in tile_cells(gu_name, element_km):
+        uncovered[row + pad, col + pad] = 1
+    element_count = int(uncovered.sum())
+
+    # 밀도 격자 (패딩 포함 범위 밖 좌표는 무시)
+    density = np.zeros_like(uncovered)
+    point_list = list(points or [])
+    for lng, lat in point_list:
+        row = math.floor((lat - min_y) / step_y) + pad
+        col = math.floor((lng - min_x) / step_x) + pad
+        if 0 <= row < density.shape[0] and 0 <= col < density.shape[1]:
+            density[row, col] += 1
+
+    density_prefix = _prefix(density)
+    stores_by_size = {k: _window_sums(density_prefix, k) for k in sizes}
+    cost_by_size = {}
+    for k, stores in stores_by_size.items():
+        cost = _pages(stores).astype(float)
+        if k != sizes[0]:
+            cost[stores > MAX_RESULTS] = np.inf   # 잘리는 rect 는 제외
+        cost_by_size[k] = cost
+
+    plan = QueryPlan(
+        gu=gu_name,
+        element_km=element_km,
+        sizes_km=[k * element_km for k in sizes],
+        element_count=element_count,
+        density_points=len(point_list),
+        baseline_tile_km=baseline_tile_km,
+        created_at=datetime.now().isoformat(timespec='seconds'),
+    )
+
+    target = uncovered.copy()
+    selected = []
+    while uncovered.any():
+        uncovered_prefix = _prefix(uncovered)
+        best = None
+        for k in sizes:
+            gain = _window_sums(uncovered_prefix, k)
+            ratio = np.where(gain > 0, gain / cost_by_size[k], 0.0)
+            r, c = np.unravel_index(np.argmax(ratio), ratio.shape)
+            candidate = (ratio[r, c], gain[r, c], k, r, c)
+            if best is None or candidate[:2] > best[:2]:
+                best = candidate
+
+        _, _, k, r, c = best
+        uncovered[r:r + k, c:c + k] = 0
+        selected.append((k, r, c))
+
+    # 중복 제거: 모든 칸이 다른 rect 로도 덮이면 제외 (비용 큰 rect 부터 검사)
+    coverage = np.zeros_like(target)
+    for k, r, c in selected:
+        coverage[r:r + k, c:c + k] += 1
+    for item in sorted(selected, key=lambda sel: -cost_by_size[sel[0]][sel[1], sel[2]]):
+        k, r, c = item
+        window = (coverage[r:r + k, c:c + k] >= 2) | (target[r:r + k, c:c + k] == 0)
+        if window.all():
+            coverage[r:r + k, c:c + k] -= 1
+            selected.remove(item)
+
+    for k, r, c in selected:
+        x1 = min_x + (c - pad) * step_x
+        y1 = min_y + (r - pad) * step_y
+        stores = int(stores_by_size[k][r, c])
+        plan.rects.append(PlannedRect(
+            rect=f"{x1:.6f},{y1:.6f},{(x1 + k * step_x):.6f},{(y1 + k * step_y):.6f}",
+            size_km=k * element_km,
+            estimated_stores=stores,
+            estimated_calls=int(_pages(np.array(stores))),
+        ))
+
+    plan.baseline_calls = estimate_grid_calls(gu_name, point_list, baseline_tile_km)
+    return plan
+
+
+def estimate_grid_calls(gu_name: str, points: List[Tuple[float, float]], tile_km: float = DEFAULT_TILE_KM) -> int:
+    """고정 격자 타일(--strategy grid) 예상 호출 수 (잘리는 타일은 4분할 재귀 기준)"""
+    min_x, min_y, step_x, step_y, _, _ = grid_spec(gu_name, tile_km)
+    counts: Dict[Tuple[int, int], List[Tuple[float, float]]] = {}
+    for lng, lat in points:
+        key = (math.floor((lat - min_y) / step_y), math.floor((lng - min_x) / step_x))
+        counts.setdefault(key, []).append((lng, lat))
+
+    def calls(stores: List[Tuple[float, float]], x1, y1, width, height, depth=0) -> int:
+        if len(stores) <= MAX_RESULTS or depth >= 4:
+            return int(_pages(np.array(min(len(stores), MAX_RESULTS))))
+        mx, my = x1 + width / 2, y1 + height / 2
+        total = 1  # 잘린 것을 확인한 1페이지 호출
+        for cx, cy in ((x1, y1), (mx, y1), (x1, my), (mx, my)):
+            inside = [p for p in stores if cx <= p[0] < cx + width / 2 and cy <= p[1] < cy + height / 2]
+            total += calls(inside, cx, cy, width / 2, height / 2, depth + 1)
+        return total
+
+    return sum(
+        calls(counts.get((row, col), []), min_x + col * step_x, min_y + row * step_y, step_x, step_y)
+        for row, col in tile_cells(gu_name, tile_km)
+    )
+
+
+def estimate_daiso_calls(
+    daiso_points: Sequence[Tuple[float, float]],
+    store_points: Sequence[Tuple[float, float]],
+    radius_km: float,
+) -> int:
+    """
+    다이소 중심 4분면 방식 예상 호출 수
+
+    다이소마다 반경 radius_km 4개 사분면 rect 안의 매장 수 n 으로
+    min(3, max(1, ceil(n / 15))) 페이지를 더한다. (v2_3_2 순차/비동기 수집과 같은 rect 크기)
+    """
+    if not daiso_points:
+        return 0
+    delta_lat, delta_lng = 0.0090 * radius_km, 0.0113 * radius_km
+    stores = np.asarray(store_points, dtype=float).reshape(-1, 2)
+    total = 0
+    for cx, cy in daiso_points:
+        for x1, y1 in ((cx, cy), (cx - delta_lng, cy), (cx - delta_lng, cy - delta_lat), (cx, cy - delta_lat)):
+            inside = (
+                (stores[:, 0] >= x1) & (stores[:, 0] <= x1 + delta_lng)
+                & (stores[:, 1] >= y1) & (stores[:, 1] <= y1 + delta_lat)
+            )
+            total += int(min(KAKAO_MAX_PAGES, _pages(np.array(inside.sum()))))
+    return total
+
+
+def default_plan_path(gu_name: str) -> str:
+    return os.path.join(PLAN_DIR, f'{gu_name}.json')
+
+
+def save_plan(plan: QueryPlan, path: Optional[str] = None) -> str:
+    """계획 JSON 저장 (경로 반환)"""
+    path = path or default_plan_path(plan.gu)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(plan.to_dict(), f, ensure_ascii=False, indent=2)
+    return path
+
+
+def load_plan(path: str) -> Dict:
+    """계획 JSON 로드 (gu, rects[...] 포함 dict, 형식이 틀리면 ValueError)"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if 'gu' not in data or not isinstance(data.get('rects'), list):
+        raise ValueError(f'검색 계획 형식이 아닙니다: {path}')
+    return data
@@ -0,0 +1,220 @@
+# stores/management/commands/rate_limit.py
+"""
+API 키(provider)별 토큰 버킷 Rate Limiter + 429/5xx 백오프
+
+기존 AsyncRateLimiter 는 Semaphore(8) + 요청 후 sleep(0.1) 이라 실제 초당 호출 수 상한이 없고,
+HTTP 429 를 받아도 같은 속도로 계속 호출했다.
+
+- TokenBucket: 초당 rate 개 충전, 최대 burst 개 저장. 토큰을 미리 예약하고 부족분만큼만 대기
+  (스레드 / 이벤트 루프 공용 - run_all --all-gu 의 여러 구 스레드가 같은 버킷을 공유)
+- 레지스트리: 프로세스 안에서 같은 키(kakao / seoul / daiso)는 같은 버킷을 사용
+- 429 수신 시 penalize(): 버킷 전체를 대기시켜 같은 키의 다른 요청도 함께 물러남
+- AsyncRateLimiter: 비동기 수집기용 Semaphore(동시 요청 수) + 공유 버킷
+- backoff_delay(): 지수 백오프 + jitter, Retry-After 헤더가 있으면 우선
+
+사용법:
+    from .rate_limit import backoff_delay, get_limiter, parse_retry_after
+
+    bucket = get_limiter('kakao')
+    await bucket.acquire_async()        # 동기 코드: bucket.acquire()
+    ...
+    if response.status == 429:
+        delay = backoff_delay(attempt, parse_retry_after(response.headers.get('Retry-After')))
+        bucket.penalize(delay)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+
+# provider 키별 기본 (초당 호출 수, 버스트)
+# 카카오 로컬 API: 초당 10회 제한 → 여유 1회
+DEFAULT_LIMITS = {
+    'kakao': (9.0, 9),
+    'seoul': (10.0, 6),
+    'daiso': (2.0, 2),
+}
+FALLBACK_LIMIT = (5.0, 5)
+
+BACKOFF_BASE = 1.0   # 첫 재시도 대기 (초, 시도마다 2배)
+BACKOFF_CAP = 30.0   # 최대 대기 (초)
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (동기 / 비동기 공용)"""
+
+    def __init__(self, rate: float, burst: int):
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self.acquired = 0
+        self.waited = 0.0
+        self.throttled = 0
+
+    def configure(self, rate: float, burst: int):
+        """초당 호출 수 / 버스트 변경"""
+        if rate <= 0 or burst < 1:
+            raise ValueError('rate 는 0보다, burst 는 1 이상이어야 합니다.')
+        with self._lock:
+            self.rate = float(rate)
+            self.burst = int(burst)
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약 후 대기해야 할 시간 (초)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._paused_until - now)
+            self.acquired += 1
+            self.waited += wait
+            return wait
+
+    def acquire(self) -> float:
+        """토큰 획득 (동기, 대기 시간 반환)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """토큰 획득 (비동기, 대기 시간 반환)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, delay: float):
+        """429 수신: delay 초 동안 모든 요청 대기 + 저장된 토큰 제거 (재개 직후 버스트 방지)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._tokens = min(self._tokens, 0.0)
+            self.throttled += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'rate': self.rate,
+            'burst': self.burst,
+            'acquired': self.acquired,
+            'waited': round(self.waited, 2),
+            'throttled': self.throttled,
+        }
+
+
+_registry: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def get_limiter(key: str) -> TokenBucket:
+    """키별 공유 버킷 (없으면 DEFAULT_LIMITS 로 생성)"""
+    with _registry_lock:
+        bucket = _registry.get(key)
+        if bucket is None:
+            bucket = _registry[key] = TokenBucket(*DEFAULT_LIMITS.get(key, FALLBACK_LIMIT))
+        return bucket
+
+
+def configure_limiter(key: str, rate: Optional[float] = None, burst: Optional[int] = None) -> TokenBucket:
+    """키별 버킷 속도 변경 (None 인 값은 유지)"""
+    bucket = get_limiter(key)
+    bucket.configure(rate if rate is not None else bucket.rate, burst if burst is not None else bucket.burst)
+    return bucket
+
+
+def limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 버킷 통계"""
+    with _registry_lock:
+        return {key: bucket.get_stats() for key, bucket in _registry.items()}
+
+
+class AsyncRateLimiter:
+    """
+    Semaphore(동시 요청 수) + 토큰 버킷(초당 호출 수) 비동기 Rate Limiter
+
+    버킷은 레지스트리에서 키별로 공유 (카카오 API: 초당 10회 제한 → 'kakao')
+    """
+
+    def __init__(self, max_concurrent: int = 8, bucket: Optional[TokenBucket] = None, key: str = 'kakao'):
+        """
+        Args:
+            max_concurrent: 동시 요청 최대 수 (기본: 8)
+            bucket: 토큰 버킷 (기본: get_limiter(key))
+            key: 레지스트리 버킷 키
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.bucket = bucket or get_limiter(key)
+
+    async def acquire(self):
+        """동시 요청 슬롯 + 토큰 획득"""
+        await self._semaphore.acquire()
+        try:
+            await self.bucket.acquire_async()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self):
+        """동시 요청 슬롯 해제"""
+        self._semaphore.release()
+
+    def penalize(self, delay: float):
+        """429 수신: 버킷을 공유하는 모든 요청을 delay 초 대기"""
+        self.bucket.penalize(delay)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def is_retryable_status(status: int) -> bool:
+    """재시도할 HTTP 상태 (429 / 5xx)"""
+    return status == 429 or 500 <= status < 600
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초 (없거나 잘못된 값이면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int,
+    retry_after: Optional[float] = None,
+    base: float = BACKOFF_BASE,
+    cap: float = BACKOFF_CAP,
+) -> float:
+    """
+    재시도 대기 시간 (초)
+
+    Retry-After 가 있으면 그 값 + 작은 jitter, 없으면 지수 백오프의 절반 + 무작위 절반
+    (여러 요청이 같은 시각에 다시 몰리지 않도록)
+    """
+    if retry_after is not None:
+        return min(cap, retry_after) + random.uniform(0, base / 2)
+    delay = min(cap, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
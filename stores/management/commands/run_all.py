@@ -5,6 +5,10 @@
 사용법:
     python manage.py run_all --gu 영등포구
     python manage.py run_all --gu 강남구
+    python manage.py run_all --all-gu --workers 5   # 서울 25개 구 동시 실행
+    python manage.py run_all --gu 강남구 --resume     # 중단된 지점부터 재개
+    python manage.py run_all --all-gu --incremental  # OpenAPI 단계는 변경분만 반영
+    python manage.py run_all --gu 강남구 --cache-mode write  # 카카오 응답 디스크 캐시 사용
 
 실행 순서:
 1. 기존 데이터 전체 삭제
@@ -13,11 +17,44 @@
 4. OpenAPI 휴게음식점 수집
 5. OpenAPI 담배소매업 수집
 6. 폐업 검증
+
+단계 의존성 (pipeline.PIPELINE_STAGES):
+    다이소 → 편의점 ─┐
+    휴게음식점 ──────┼→ 폐업 검증
+    담배소매업 ──────┘
+    휴게음식점/담배소매업은 구 이름만 필요하므로 다이소/편의점 수집과 병렬 실행
+
+--resume 모드:
+    단계별 체크포인트(PipelineCheckpoint)를 읽어 완료된 단계는 건너뛰고,
+    실패한 단계는 기존 데이터를 지우지 않고 저장된 위치부터 이어서 수집한다.
+    (편의점: 마지막 완료 다이소 순번, OpenAPI: 마지막 완료 페이지)
+
+--incremental 모드:
+    OpenAPI 단계(휴게음식점/담배소매업)를 --incremental 로 실행한다.
+    저장된 LASTMODTS/UPDATEDT 워터마크 이후 변경분만 반영하고,
+    워터마크가 없는 구만 전체 재적재한다.
+
+--all-gu 모드:
+    25개 구의 5단계를 공유 워커 풀에서 동시에 실행한다.
+    provider별 예산(카카오 / 서울시 OpenAPI / 다이소몰)으로 API 한도를 지키며,
+    종료 시 구별 + 서울 전체 처리량 리포트를 출력한다.
 """
 
+from dataclasses import replace
+from io import StringIO
+
 from django.core.management.base import BaseCommand
-from django.core.management import call_command
+from django.db import connection
 from .gu_codes import list_supported_gu, get_gu_info
+from .kakao_cache import CACHE_MODES, DEFAULT_CACHE_MODE
+from .pipeline import (
+    PIPELINE_STAGES,
+    pending_stages,
+    run_city_pipeline,
+    run_stage,
+    run_stage_graph,
+    summarize_throughput,
+)
 
 
 class Command(BaseCommand):
@@ -50,8 +87,96 @@ class Command(BaseCommand):
             action='store_true',
             help='폐업 검증 단계 스킵'
         )
+        parser.add_argument(
+            '--all-gu',
+            action='store_true',
+            help='서울 25개 구 전체를 동시 실행 (공유 워커 풀)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=5,
+            help='--all-gu 모드 동시 실행 구 수 (기본: 5)'
+        )
+        parser.add_argument(
+            '--kakao-slots',
+            type=int,
+            default=None,
+            help='--all-gu 모드 카카오 수집 단계 동시 실행 수 (기본: 1)'
+        )
+        parser.add_argument(
+            '--seoul-slots',
+            type=int,
+            default=None,
+            help='--all-gu 모드 서울시 OpenAPI 단계 동시 실행 수 (기본: 4)'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='체크포인트 기준으로 중단된 지점부터 재개 (완료 단계 스킵, 데이터 삭제 안 함)'
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='OpenAPI 단계를 워터마크 이후 변경분만 반영 (워터마크 없으면 전체 재적재)'
+        )
+        parser.add_argument(
+            '--cache-mode',
+            choices=CACHE_MODES,
+            default=DEFAULT_CACHE_MODE,
+            help=f'편의점 수집 단계 카카오 응답 캐시 모드 (기본: {DEFAULT_CACHE_MODE})'
+        )
+
+    def select_stages(self, options):
+        """--skip-* / --incremental / --cache-mode 옵션을 반영한 실행 단계 목록"""
+        skipped = set()
+        if options['skip_daiso']:
+            skipped.add('daiso')
+        if options['skip_convenience']:
+            skipped.add('convenience')
+        if options['skip_openapi']:
+            skipped.update({'restaurant', 'tobacco'})
+        if options['skip_check']:
+            skipped.add('closure')
+        stages = [stage for stage in PIPELINE_STAGES if stage.name not in skipped]
+        if options['incremental']:
+            stages = [
+                replace(stage, options={**stage.options, 'incremental': True})
+                if stage.provider == 'seoul' else stage
+                for stage in stages
+            ]
+        if options['cache_mode'] != 'off':
+            stages = [
+                replace(stage, options={**stage.options, 'cache_mode': options['cache_mode']})
+                if stage.provider == 'kakao' else stage
+                for stage in stages
+            ]
+        return stages
+
+    def report_skipped(self, selected, stages):
+        """
+        옵션으로 제외된 단계 / 체크포인트로 완료된 단계 출력
+
+        select_stages 가 replace() 로 옵션을 바꾼 단계는 PIPELINE_STAGES 원본과 값이 달라지므로
+        Stage 끼리 비교하지 않고 이름으로 비교한다.
+        """
+        selected_names = {stage.name for stage in selected}
+        pending_names = {stage.name for stage in stages}
+        total = len(PIPELINE_STAGES)
+
+        for idx, stage in enumerate(PIPELINE_STAGES, 1):
+            if stage.name not in selected_names:
+                self.stdout.write(self.style.WARNING(f"\n⏭️ [{idx}/{total}] {stage.label} 스킵"))
+            elif stage.name not in pending_names:
+                self.stdout.write(self.style.WARNING(
+                    f"\n⏭️ [{idx}/{total}] {stage.label} 이미 완료 (체크포인트)"
+                ))
 
     def handle(self, *args, **options):
+        if options['all_gu']:
+            self.handle_all_gu(options)
+            return
+
         target_gu = options['gu']
         
         # 구 유효성 검증
@@ -64,67 +189,110 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS("=" * 70))
         self.stdout.write(self.style.SUCCESS(f"🚀 {target_gu} 전체 파이프라인 시작"))
         self.stdout.write(self.style.SUCCESS("=" * 70))
-        
-        # Step 1: 다이소 수집
-        if not options['skip_daiso']:
-            self.stdout.write(self.style.WARNING(f"\n📦 [1/5] {target_gu} 다이소 수집..."))
-            try:
-                call_command('v2_3_1_collect_yeongdeungpo_daiso', gu=target_gu, clear=True)
-                self.stdout.write(self.style.SUCCESS("  ✅ 다이소 수집 완료"))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  ❌ 다이소 수집 실패: {e}"))
-                return
-        else:
-            self.stdout.write(self.style.WARNING("\n⏭️ [1/5] 다이소 수집 스킵"))
-        
-        # Step 2: 편의점 수집
-        if not options['skip_convenience']:
-            self.stdout.write(self.style.WARNING(f"\n🏪 [2/5] {target_gu} 편의점 수집..."))
-            try:
-                call_command('v2_3_2_collect_Convenience_Only', gu=target_gu, clear=True, use_async=True)
-                self.stdout.write(self.style.SUCCESS("  ✅ 편의점 수집 완료"))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  ❌ 편의점 수집 실패: {e}"))
-                return
-        else:
-            self.stdout.write(self.style.WARNING("\n⏭️ [2/5] 편의점 수집 스킵"))
-        
-        # Step 3: OpenAPI 휴게음식점 수집
-        if not options['skip_openapi']:
-            self.stdout.write(self.style.WARNING(f"\n📋 [3/5] {target_gu} 휴게음식점 인허가 수집..."))
-            try:
-                call_command('openapi_1', gu=target_gu, clear=True)
-                self.stdout.write(self.style.SUCCESS("  ✅ 휴게음식점 인허가 수집 완료"))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  ❌ 휴게음식점 인허가 수집 실패: {e}"))
-                return
-            
-            # Step 4: OpenAPI 담배소매업 수집
-            self.stdout.write(self.style.WARNING(f"\n🚬 [4/5] {target_gu} 담배소매업 인허가 수집..."))
-            try:
-                call_command('openapi_2', gu=target_gu, clear=True)
-                self.stdout.write(self.style.SUCCESS("  ✅ 담배소매업 인허가 수집 완료"))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  ❌ 담배소매업 인허가 수집 실패: {e}"))
-                return
-        else:
-            self.stdout.write(self.style.WARNING("\n⏭️ [3/5] 휴게음식점 인허가 수집 스킵"))
-            self.stdout.write(self.style.WARNING("⏭️ [4/5] 담배소매업 인허가 수집 스킵"))
-        
-        # Step 5: 폐업 검증
-        if not options['skip_check']:
-            self.stdout.write(self.style.WARNING(f"\n🔍 [5/5] {target_gu} 폐업 매장 검증..."))
+
+        resume = options['resume']
+        selected = self.select_stages(options)
+        stages = pending_stages(selected, target_gu, resume)
+        stage_numbers = {stage.name: idx for idx, stage in enumerate(PIPELINE_STAGES, 1)}
+        total = len(PIPELINE_STAGES)
+        self.report_skipped(selected, stages)
+
+        # 단계 그래프 실행 (다이소 → 편의점 / 휴게음식점 / 담배소매업 병렬 → 폐업 검증)
+        # 병렬 단계의 출력이 섞이지 않도록 단계별로 캡처 후 완료 시 출력
+        outputs = {}
+
+        def execute(stage):
+            buffer = StringIO()
             try:
-                call_command('check_store_closure', gu=target_gu)
-                self.stdout.write(self.style.SUCCESS("  ✅ 폐업 검증 완료"))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  ❌ 폐업 검증 실패: {e}"))
-                return
-        else:
-            self.stdout.write(self.style.WARNING("\n⏭️ [5/5] 폐업 검증 스킵"))
+                run_stage(stage, target_gu, stdout=buffer, resume=resume)
+            finally:
+                outputs[stage.name] = buffer.getvalue()
+                connection.close()
+
+        def on_start(stage):
+            self.stdout.write(self.style.WARNING(
+                f"\n▶️ [{stage_numbers[stage.name]}/{total}] {target_gu} {stage.label} 시작..."
+            ))
+
+        def on_done(stage, seconds):
+            self.stdout.write(outputs.get(stage.name, ''), ending='')
+            self.stdout.write(self.style.SUCCESS(f"  ✅ {stage.label} 완료 ({seconds:.1f}초)"))
+
+        result = run_stage_graph(stages, execute, on_start=on_start, on_done=on_done)
+
+        if not result.success:
+            failed = next(stage for stage in stages if stage.name == result.failed_stage)
+            self.stdout.write(outputs.get(failed.name, ''), ending='')
+            self.stdout.write(self.style.ERROR(f"  ❌ {failed.label} 실패: {result.error}"))
+            self.stdout.write(self.style.WARNING(
+                f"  ↩️ 재개: python manage.py run_all --gu {target_gu} --resume"
+            ))
+            return
         
         # 완료
         self.stdout.write(self.style.SUCCESS("\n" + "=" * 70))
         self.stdout.write(self.style.SUCCESS(f"🎉 {target_gu} 전체 파이프라인 완료!"))
         self.stdout.write(self.style.SUCCESS("=" * 70))
+        self.stdout.write(f"  ⏱️ 전체 소요: {result.total_time:.1f}초 (순차 실행 시 {result.serial_time:.1f}초)")
+        self.stdout.write(
+            f"  🧭 임계 경로: {' → '.join(result.critical_path)} ({result.critical_path_time:.1f}초)"
+        )
         self.stdout.write(f"\n📊 결과 확인: http://127.0.0.1:8000/")
+
+    def handle_all_gu(self, options):
+        """서울 25개 구 동시 실행 모드"""
+        stages = self.select_stages(options)
+
+        gu_list = list_supported_gu()
+        workers = max(1, options['workers'])
+
+        self.stdout.write(self.style.SUCCESS("=" * 70))
+        self.stdout.write(self.style.SUCCESS(f"🚀 서울 {len(gu_list)}개 구 동시 파이프라인 시작 (워커 {workers}개)"))
+        self.stdout.write(self.style.SUCCESS("=" * 70))
+        self.stdout.write(f"  실행 단계: {' → '.join(stage.label for stage in stages)}")
+
+        def on_stage_done(gu, stage, seconds):
+            self.stdout.write(f"  [{gu}] {stage.label} 완료 ({seconds:.1f}초)")
+
+        def on_gu_done(report):
+            if report.success:
+                self.stdout.write(self.style.SUCCESS(f"  ✅ [{report.gu}] 파이프라인 완료 ({report.elapsed:.1f}초)"))
+            else:
+                self.stdout.write(self.style.ERROR(
+                    f"  ❌ [{report.gu}] {report.failed_stage} 단계 실패: {report.error}"
+                ))
+
+        reports, wall_time = run_city_pipeline(
+            gu_list,
+            stages,
+            workers=workers,
+            budget_overrides={'kakao': options['kakao_slots'], 'seoul': options['seoul_slots']},
+            on_stage_done=on_stage_done,
+            on_gu_done=on_gu_done,
+            resume=options['resume'],
+        )
+
+        # 구별 처리량 리포트
+        self.stdout.write("\n" + "=" * 70)
+        self.stdout.write(self.style.SUCCESS("📊 구별 처리량 리포트"))
+        self.stdout.write("=" * 70)
+        for report in reports:
+            status = "✅" if report.success else "❌"
+            stage_summary = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in report.stage_times.items())
+            self.stdout.write(f"  {status} {report.gu:<6} {report.elapsed:>7.1f}초 | {stage_summary}")
+            if report.critical_path:
+                self.stdout.write(
+                    f"           임계 경로: {' → '.join(report.critical_path)} ({report.critical_path_time:.1f}초)"
+                )
+
+        # 서울 전체 처리량 리포트
+        summary = summarize_throughput(reports, wall_time)
+        self.stdout.write("\n" + "=" * 70)
+        self.stdout.write(self.style.SUCCESS("🏙️ 서울 전체 처리량"))
+        self.stdout.write("=" * 70)
+        self.stdout.write(f"  성공 / 실패: {summary['gu_succeeded']} / {summary['gu_failed']}개 구")
+        self.stdout.write(f"  벽시계 시간: {summary['wall_time']:.1f}초")
+        self.stdout.write(f"  순차 실행 합계: {summary['serial_time']:.1f}초 (병렬도 {summary['parallelism']:.2f}x)")
+        self.stdout.write(f"  처리량: {summary['gu_per_hour']:.1f}개 구/시간")
+        for name, seconds in summary['stage_totals'].items():
+            self.stdout.write(f"    - {name}: 누적 {seconds:.1f}초")
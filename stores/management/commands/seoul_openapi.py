@@ -0,0 +1,281 @@
+# stores/management/commands/seoul_openapi.py
+"""
+서울시 OpenAPI (LOCALDATA) 비동기 페이지 수집 모듈
+
+get_total_count 로 전체 건수를 알고 나면 /start/end/ 구간(window)은 서로 독립적이므로
+aiohttp 로 모든 구간을 동시에 요청한다. (동시 요청 수 제한 + 재시도 + 순서대로 재조립)
+강남구처럼 페이지가 많은 구도 N회 왕복 대신 약 1회 왕복 시간에 수집된다.
+
+LOCALDATA API 는 업태/영업상태 조건 조회를 지원하지 않으므로, row_filter 를 주면
+JSON 디코딩 중(object_pairs_hook) 필요한 필드만 보고 불일치 행을 버린다.
+(버려지는 행은 dict 로 만들지 않음, 수신 바이트/행 수 카운터 제공)
+
+재시도는 네트워크 오류 / 429 / 5xx / 서버 측 RESULT 오류만 (is_retryable_error).
+잘못된 인증키·서비스명 등 다시 요청해도 같은 오류는 첫 시도에서 실패 처리한다.
+
+사용법:
+    from .seoul_openapi import fetch_windows
+
+    pages, stats = fetch_windows(
+        api_key, service_name, start_index=1, total_count=12345,
+        row_filter=RowFilter(('UPTAENM', 'TRDSTATENM'), lambda row: row['UPTAENM'] == '편의점'),
+    )
+    for page in pages:          # start_index 오름차순
+        if page.rows is None:   # 재시도 후에도 실패한 구간
+            ...
+"""
+
+import asyncio
+import json
+import aiohttp
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .http_client import CircuitOpenError, RequestFailedError, request_async
+from .http_pool import pooled_session, run_async
+from .rate_limit import AsyncRateLimiter, backoff_delay, is_retryable_status
+
+
+BASE_URL = 'http://openAPI.seoul.go.kr:8088'
+PAGE_SIZE = 1000          # 서울시 OpenAPI 1회 최대 조회 건수
+DEFAULT_CONCURRENCY = 6   # 동시 요청 수
+DEFAULT_RETRIES = 3       # 구간별 최대 재시도 횟수
+RETRY_BACKOFF = 1.0       # 재시도 대기 기준 (초, 시도마다 2배 + jitter)
+ROW_KEY = 'MGTNO'         # 행 객체 식별 필드 (관리번호)
+RETRYABLE_RESULT_CODES = ('ERROR-500', 'ERROR-600', 'ERROR-601')  # 서버 / DB 연결 / SQL 오류 (일시 오류)
+
+
+class SeoulAPIResultError(ValueError):
+    """응답 RESULT 코드 오류 (ERROR-290 인증키, ERROR-310 서비스명 등)"""
+
+    def __init__(self, code: str, result: Any):
+        super().__init__(f"응답 오류: {result}")
+        self.code = code
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    구간 재시도 대상 여부
+
+    네트워크 오류 / 429 / 5xx / 서버 측 RESULT 오류만 재시도한다.
+    잘못된 키·서비스명(4xx, ERROR-290 등)이나 JSON 디코딩 오류는 다시 요청해도 같으므로 바로 실패 처리.
+    """
+    if isinstance(error, RequestFailedError):
+        return error.status is None or is_retryable_status(error.status)
+    if isinstance(error, SeoulAPIResultError):
+        return error.code in RETRYABLE_RESULT_CODES
+    return isinstance(error, (OSError, asyncio.TimeoutError, aiohttp.ClientError))
+
+
+@dataclass
+class WindowPage:
+    """단일 /start/end/ 구간 결과"""
+    start: int
+    end: int
+    rows: Optional[List[Dict[str, Any]]] = None  # None = 실패
+    attempts: int = 0
+    error: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.rows is not None
+
+
+@dataclass
+class FetchStats:
+    """구간 수집 통계"""
+    windows: int = 0
+    api_calls: int = 0
+    retries: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    bytes_fetched: int = 0   # 수신 바이트 (응답 본문)
+    rows_seen: int = 0       # 디코딩한 행 수
+    rows_kept: int = 0       # row_filter 통과 행 수
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def keep_ratio(self) -> float:
+        """유지 비율 (%)"""
+        return round(self.rows_kept / self.rows_seen * 100, 1) if self.rows_seen else 0.0
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """
+    디코딩 단계 행 필터
+
+    fields: match 판단에 필요한 필드 (이 필드만 추출해서 match 에 전달)
+    match: 추출한 필드 dict → 유지 여부
+    """
+    fields: Tuple[str, ...]
+    match: Callable[[Dict[str, Any]], bool]
+
+    def object_pairs_hook(self, stats: FetchStats):
+        """json.loads 용 hook (불일치 행은 None 반환, 이후 제거)"""
+        wanted = set(self.fields) | {ROW_KEY}
+
+        def hook(pairs):
+            picked = {key: value for key, value in pairs if key in wanted}
+            if ROW_KEY not in picked:
+                return dict(pairs)  # 행이 아닌 객체 (RESULT, 서비스 루트 등)
+            stats.rows_seen += 1
+            if not self.match(picked):
+                return None
+            stats.rows_kept += 1
+            return dict(pairs)
+
+        return hook
+
+
+def window_ranges(start_index: int, total_count: int, page_size: int = PAGE_SIZE) -> List[Tuple[int, int]]:
+    """start_index 부터 total_count 까지의 (start, end) 구간 목록 (1-based, 양끝 포함)"""
+    return [
+        (start, min(start + page_size - 1, total_count))
+        for start in range(max(1, start_index), total_count + 1, page_size)
+    ]
+
+
+class AsyncSeoulOpenAPIFetcher:
+    """
+    서울시 OpenAPI 구간 동시 수집기
+
+    - Semaphore 로 동시 요청 수, 'seoul' 토큰 버킷으로 초당 호출 수 제한
+    - 네트워크 오류/429/5xx/비정상 응답은 지수 백오프 + jitter 로 재시도 (Retry-After 우선)
+    - HTTP 호출은 http_client 를 거침 (호스트 서킷 브레이커가 열리면 남은 재시도 생략)
+    - 결과는 요청 순서(start 오름차순)대로 반환
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        service_name: str,
+        max_concurrent: int = DEFAULT_CONCURRENCY,
+        max_retries: int = DEFAULT_RETRIES,
+        timeout: float = 60,
+        row_filter: Optional[RowFilter] = None,
+    ):
+        self.api_key = api_key
+        self.service_name = service_name
+        self.row_filter = row_filter
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_retries = max(0, max_retries)
+        self.timeout = timeout
+        self.limiter = AsyncRateLimiter(self.max_concurrent, key='seoul')
+        self.stats = FetchStats()
+
+    def _url(self, start: int, end: int) -> str:
+        return f'{BASE_URL}/{self.api_key}/json/{self.service_name}/{start}/{end}/'
+
+    async def _fetch_once(self, session: aiohttp.ClientSession, start: int, end: int) -> List[Dict[str, Any]]:
+        """단일 구간 1회 요청 (실패 시 예외)"""
+        # 재시도는 fetch_window 가 응답 내용 오류까지 포함해 담당 (여기서는 1회 + 브레이커/카운터)
+        url = self._url(start, end)
+        self.stats.api_calls += 1
+        result = await request_async(
+            session, 'GET', url,
+            limiter=self.limiter,
+            max_retries=0,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        if result.status >= 300:
+            raise RequestFailedError(url, f"HTTP {result.status}", status=result.status, attempts=1)
+        body = result.body
+
+        self.stats.bytes_fetched += len(body)
+        data = self._decode(body)
+
+        if self.service_name in data:
+            return [row for row in data[self.service_name].get('row', []) if row is not None]
+
+        # 데이터 없음(INFO-200)은 정상 빈 구간, 그 외 RESULT 코드는 오류
+        result = data.get('RESULT', {})
+        if result.get('CODE') == 'INFO-200':
+            return []
+        raise SeoulAPIResultError(result.get('CODE', ''), result or data)
+
+    def _decode(self, body: bytes) -> Dict[str, Any]:
+        """
+        응답 본문 디코딩 (Content-Type 무관)
+
+        row_filter 가 있으면 디코딩 중 불일치 행을 None 으로 대체한다.
+        """
+        if self.row_filter is None:
+            data = json.loads(body)
+            rows = data.get(self.service_name, {}).get('row', []) if isinstance(data, dict) else []
+            self.stats.rows_seen += len(rows)
+            self.stats.rows_kept += len(rows)
+            return data
+        return json.loads(body, object_pairs_hook=self.row_filter.object_pairs_hook(self.stats))
+
+    async def fetch_window(self, session: aiohttp.ClientSession, start: int, end: int) -> WindowPage:
+        """단일 구간 수집 (재시도 포함, 예외를 던지지 않음)"""
+        page = WindowPage(start=start, end=end)
+
+        for attempt in range(self.max_retries + 1):
+            page.attempts = attempt + 1
+            try:
+                page.rows = await self._fetch_once(session, start, end)
+                page.error = ''
+                return page
+            except CircuitOpenError as e:
+                page.error = f"{type(e).__name__}: {e}"
+                break
+            except Exception as e:
+                page.error = f"{type(e).__name__}: {e}"
+                if not is_retryable_error(e):
+                    break
+                if attempt < self.max_retries:
+                    self.stats.retries += 1
+                    retry_after = e.retry_after if isinstance(e, RequestFailedError) else None
+                    delay = backoff_delay(attempt, retry_after, base=RETRY_BACKOFF)
+                    if isinstance(e, RequestFailedError) and e.status == 429:
+                        self.limiter.penalize(delay)
+                    await asyncio.sleep(delay)
+
+        self.stats.failed += 1
+        self.stats.errors.append(f"{start}~{end}: {page.error}")
+        return page
+
+    async def fetch_all(self, windows: List[Tuple[int, int]]) -> List[WindowPage]:
+        """모든 구간 동시 수집 후 start 순서대로 반환"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self.stats.windows = len(windows)
+
+        # 동시 요청 수는 limiter 슬롯이 제한 (호스트당 연결은 최대 http_pool.ASYNC_LIMIT_PER_HOST), 연결은 공용 풀에서 재사용
+        async with pooled_session() as session:
+            pages = await asyncio.gather(*[
+                self.fetch_window(session, start, end)
+                for start, end in windows
+            ])
+
+        self.stats.elapsed = round(loop.time() - started, 2)
+        return sorted(pages, key=lambda page: page.start)
+
+
+def fetch_windows(
+    api_key: str,
+    service_name: str,
+    start_index: int,
+    total_count: int,
+    page_size: int = PAGE_SIZE,
+    max_concurrent: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_RETRIES,
+    row_filter: Optional[RowFilter] = None,
+) -> Tuple[List[WindowPage], FetchStats]:
+    """
+    동기 환경에서 구간 동시 수집 실행 헬퍼
+
+    row_filter 를 주면 각 페이지 rows 에는 필터를 통과한 행만 담긴다.
+
+    Returns:
+        (start 오름차순 WindowPage 리스트, FetchStats)
+    """
+    windows = window_ranges(start_index, total_count, page_size)
+    fetcher = AsyncSeoulOpenAPIFetcher(api_key, service_name, max_concurrent, max_retries, row_filter=row_filter)
+    if not windows:
+        return [], fetcher.stats
+
+    pages = run_async(fetcher.fetch_all(windows))
+    return pages, fetcher.stats
@@ -0,0 +1,102 @@
+# stores/management/commands/spatial_match.py
+"""
+허용 거리(m) 기반 좌표 매칭 모듈 (인메모리 그리드 해시)
+
+소수점 4자리 반올림 좌표의 완전 일치 비교는 반올림 경계 양쪽에 걸친 매장이나
+약 11m 떨어진 매장을 불일치로 판단하여 '폐업' 건수를 부풀린다.
+비교 좌표를 한 변이 tolerance_m 인 격자(cell)에 해시해 두고,
+질의 좌표 주변 3x3 격자만 거리 계산하여 tolerance_m 이내 여부를 판정한다.
+
+- 구축 O(n), 질의 1건당 평균 O(1) (격자당 점 수가 작으므로)
+- 서울 범위(약 40km)에서는 위도 기준 등장방형 투영 오차가 무시할 수준
+
+사용법:
+    from .spatial_match import GridIndex
+
+    index = GridIndex(tolerance_m=11)
+    index.add_many(coords)                  # [(lat, lng), ...]
+    index.has_neighbor(37.5215, 126.9025)   # True / False
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_TOLERANCE_M = 11.0       # 소수점 4자리(약 11m) 반올림 비교와 같은 수준
+METERS_PER_DEG_LAT = 111_320.0
+REFERENCE_LAT = 37.55            # 서울 중심 위도 (경도 1도 거리 계산용)
+DEFAULT_CELL_M = 250.0           # 파티션 내 정렬용 공간 셀 크기
+CELL_ROW_SPAN = 1 << 20          # cell_id = 행(y) * CELL_ROW_SPAN + 열(x)
+
+
+class GridIndex:
+    """좌표 격자 해시 인덱스"""
+
+    def __init__(self, tolerance_m: float = DEFAULT_TOLERANCE_M, reference_lat: float = REFERENCE_LAT):
+        if tolerance_m <= 0:
+            raise ValueError('tolerance_m 은 0보다 커야 합니다.')
+        self.tolerance_m = tolerance_m
+        self._tolerance_sq = tolerance_m * tolerance_m
+        self._m_per_deg_lng = METERS_PER_DEG_LAT * math.cos(math.radians(reference_lat))
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float]]] = defaultdict(list)
+        self.size = 0
+
+    def _project(self, lat: float, lng: float) -> Tuple[float, float]:
+        """위도/경도 → 평면 좌표 (m)"""
+        return lng * self._m_per_deg_lng, lat * METERS_PER_DEG_LAT
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(math.floor(x / self.tolerance_m)), int(math.floor(y / self.tolerance_m))
+
+    def add(self, lat: Optional[float], lng: Optional[float]):
+        """좌표 1건 추가 (None 무시)"""
+        if lat is None or lng is None:
+            return
+        x, y = self._project(lat, lng)
+        self._cells[self._cell(x, y)].append((x, y))
+        self.size += 1
+
+    def add_many(self, coords: Iterable[Tuple[Optional[float], Optional[float]]]):
+        """좌표 여러 건 추가"""
+        for lat, lng in coords:
+            self.add(lat, lng)
+
+    def nearest_distance(self, lat: Optional[float], lng: Optional[float]) -> Optional[float]:
+        """tolerance_m 이내 가장 가까운 점까지 거리 (m, 없으면 None)"""
+        if lat is None or lng is None:
+            return None
+        x, y = self._project(lat, lng)
+        cx, cy = self._cell(x, y)
+
+        best = None
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for px, py in self._cells.get((cx + dx, cy + dy), ()):
+                    dist_sq = (px - x) ** 2 + (py - y) ** 2
+                    if dist_sq <= self._tolerance_sq and (best is None or dist_sq < best):
+                        best = dist_sq
+        return math.sqrt(best) if best is not None else None
+
+    def has_neighbor(self, lat: Optional[float], lng: Optional[float]) -> bool:
+        """tolerance_m 이내에 비교 좌표가 있는지 여부"""
+        return self.nearest_distance(lat, lng) is not None
+
+
+def cell_ids(lats, lngs, cell_m: float = DEFAULT_CELL_M, reference_lat: float = REFERENCE_LAT) -> np.ndarray:
+    """
+    위도/경도 배열 → 공간 셀 번호 (int64, 좌표 없음 → -1)
+
+    같은 셀 / 인접 열의 점이 가까운 번호를 갖도록 행 우선 번호를 매긴다.
+    Parquet 파티션을 이 값으로 정렬해 두면 row group 통계(min/max)로 영역 필터가 가능하다.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    m_per_deg_lng = METERS_PER_DEG_LAT * math.cos(math.radians(reference_lat))
+
+    valid = ~(np.isnan(lats) | np.isnan(lngs))
+    rows = np.floor(np.where(valid, lats, 0.0) * METERS_PER_DEG_LAT / cell_m).astype(np.int64)
+    cols = np.floor(np.where(valid, lngs, 0.0) * m_per_deg_lng / cell_m).astype(np.int64)
+    return np.where(valid, rows * CELL_ROW_SPAN + cols % CELL_ROW_SPAN, -1)
@@ -13,82 +13,11 @@ OR 조건으로 매칭:
 추가: 주소_정규화 기준 중복 제거
 """
 
-import os
-import re
 import pandas as pd
 from django.core.management.base import BaseCommand
 from stores.models import SeoulRestaurantLicense, YeongdeungpoConvenience
-
-
-def normalize_name(name):
-    """이름 정규화: 공백 제거, 소문자, 특수문자 제거"""
-    if not name or pd.isna(name):
-        return ""
-    name = str(name).strip()
-    name = name.replace(" ", "").replace("-", "").replace("_", "")
-    name = name.lower()
-    return name
-
-
-def extract_road_address(address):
-    """
-    도로명 주소에서 핵심 부분 추출
-    - 서울특별시/서울시/서울 → 통일
-    - 도로명 + 번호 추출 (예: 양평로 49)
-    """
-    if not address or pd.isna(address):
-        return ""
-    
-    address = str(address).strip()
-    if address == 'nan':
-        return ""
-    
-    # 서울 표기 통일
-    address = address.replace("서울특별시", "서울")
-    address = address.replace("서울시", "서울")
-    
-    # 도로명 주소 패턴 추출: "~로/길/대로 + 숫자"
-    road_pattern = r'([가-힣]+(?:로|길|대로)[0-9가-힣]*)\s*(\d+(?:-\d+)?)'
-    match = re.search(road_pattern, address)
-    
-    if match:
-        road_name = match.group(1)
-        road_num = match.group(2)
-        
-        # 구 이름 추출
-        gu_pattern = r'(영등포구)'
-        gu_match = re.search(gu_pattern, address)
-        gu = gu_match.group(1) if gu_match else ""
-        
-        normalized = f"서울 {gu} {road_name} {road_num}".strip()
-        normalized = " ".join(normalized.split())
-        return normalized
-    
-    # 패턴 없으면 정리해서 반환
-    address = re.sub(r'\([^)]*\)', '', address)
-    address = re.sub(r',.*$', '', address)
-    address = " ".join(address.split())
-    return address
-
-
-def extract_dong_from_address(address):
-    """지번주소에서 동 이름 추출 (예: 신길동, 당산동5가)"""
-    if not address or pd.isna(address):
-        return ""
-    
-    address = str(address)
-    # 동 패턴: ~동, ~동1가, ~동2가 등
-    dong_pattern = r'([가-힣]+동(?:\d+가)?)'
-    match = re.search(dong_pattern, address)
-    return match.group(1) if match else ""
-
-
-def round_coord(val, decimals=4):
-    """좌표 반올림"""
-    try:
-        return round(float(val), decimals)
-    except (ValueError, TypeError):
-        return None
+from .normalize import extract_dong_from_address, extract_road_address, normalize_name, round_coord
+from .public_data_cache import load_public_data, to_records
 
 
 class Command(BaseCommand):
@@ -125,48 +54,15 @@ class Command(BaseCommand):
         # 1. 데이터 로드
         self.stdout.write("\n📥 [1단계] 데이터 로드 중...")
         
-        # 1-1. public_data.csv 로드
-        csv_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'public_data.csv')
-        csv_path = os.path.normpath(csv_path)
-        
-        if not os.path.exists(csv_path):
-            csv_path = os.path.join(os.getcwd(), 'public_data.csv')
-        
-        csv_df = pd.read_csv(csv_path, encoding='cp949')
+        # 1-1. public_data.csv 로드 (정규화 키가 미리 계산된 Parquet 캐시)
+        csv_df = load_public_data('영등포구', decimals)
         self.stdout.write(f"  ✅ 소상공인상권 CSV: {len(csv_df)}개")
         
-        csv_data = []
-        for _, row in csv_df.iterrows():
-            name = str(row['Column2']) if pd.notna(row['Column2']) else ""
-            
-            # Column32 = 도로명주소 (우선), Column25 = 지번주소
-            road_addr = str(row['Column32']) if pd.notna(row['Column32']) else ""
-            lot_addr = str(row['Column25']) if pd.notna(row['Column25']) else ""
-            
-            # 도로명주소가 없거나 nan이면 지번주소 사용
-            if not road_addr or road_addr == 'nan':
-                address = lot_addr
-            else:
-                address = road_addr
-            
-            lat = row['Column39'] if pd.notna(row['Column39']) else None
-            lng = row['Column38'] if pd.notna(row['Column38']) else None
-            
-            csv_data.append({
-                'source': 'csv',
-                'id': row['Column1'],
-                'name': name,
-                'address': address,
-                'road_addr': road_addr if road_addr != 'nan' else '',
-                'lot_addr': lot_addr if lot_addr != 'nan' else '',
-                'dong': extract_dong_from_address(lot_addr),
-                'lat': lat,
-                'lng': lng,
-                'name_norm': normalize_name(name),
-                'address_norm': extract_road_address(address),
-                'lat_round': round_coord(lat, decimals),
-                'lng_round': round_coord(lng, decimals)
-            })
+        # Column32 = 도로명주소 (우선), Column25 = 지번주소 → 캐시 생성 시 address 로 결정됨
+        csv_data = [
+            {'source': 'csv', **row}
+            for row in to_records(csv_df)
+        ]
         
         # 1-2. SeoulRestaurantLicense 로드 (OpenAPI)
         openapi_qs = SeoulRestaurantLicense.objects.filter(uptaenm='편의점')
@@ -392,7 +288,7 @@ class Command(BaseCommand):
             self.stdout.write("📌 매칭된 편의점 (상위 30개):")
             self.stdout.write("-" * 70)
             
-            for i, (_, store) in enumerate(result_df.head(30).iterrows(), 1):
+            for i, store in enumerate(result_df.head(30).to_dict('records'), 1):
                 self.stdout.write(f"\n[{i}] {store['이름']}")
                 self.stdout.write(f"    주소: {store['주소']}")
                 self.stdout.write(f"    좌표: ({store['위도']}, {store['경도']})")
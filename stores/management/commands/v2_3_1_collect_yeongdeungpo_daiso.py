@@ -10,11 +10,12 @@
 import requests
 import json
 import time
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.gis.geos import Point
 from django.conf import settings
 from stores.models import YeongdeungpoDaiso
 from .gu_codes import list_supported_gu
+from .http_client import RequestFailedError, request
 
 
 class Command(BaseCommand):
@@ -39,7 +40,7 @@ class Command(BaseCommand):
         )
 
     def fetch_from_daiso_api(self, keyword):
-        """다이소 공식 API에서 매장 목록 조회"""
+        """다이소 공식 API에서 매장 목록 조회 (호출 실패는 CommandError, 빈 목록으로 처리하지 않음)"""
         url = "https://fapi.daisomall.co.kr/ms/msg/selStr"
         
         headers = {
@@ -61,16 +62,15 @@ class Command(BaseCommand):
         }
         
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=10)
+            response = request('POST', url, limiter_key='daiso', headers=headers, data=json.dumps(payload), timeout=10)
             response.raise_for_status()
             result = response.json()
-            
-            if result.get('success'):
-                return result.get('data', [])
-            return []
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"다이소 API 오류: {e}"))
-            return []
+        except (RequestFailedError, requests.RequestException, ValueError) as e:
+            raise CommandError(f"다이소 API 오류 (재시도 소진): {e}")
+        
+        if not result.get('success'):
+            raise CommandError(f"다이소 API 응답 오류: {result}")
+        return result.get('data', [])
 
     def fetch_coords_from_kakao(self, store_name, address, api_key):
         """카카오 API로 좌표 조회 (주소 → 좌표)"""
@@ -82,7 +82,7 @@ class Command(BaseCommand):
         params = {"query": f"다이소 {store_name}", "size": 1}
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=5)
+            response = request('GET', url, limiter_key='kakao', headers=headers, params=params, timeout=5)
             response.raise_for_status()
             data = response.json()
             documents = data.get('documents', [])
@@ -102,7 +102,7 @@ class Command(BaseCommand):
         params = {"query": address}
         
         try:
-            response = requests.get(geocode_url, headers=headers, params=params, timeout=5)
+            response = request('GET', geocode_url, limiter_key='kakao', headers=headers, params=params, timeout=5)
             response.raise_for_status()
             data = response.json()
             documents = data.get('documents', [])
@@ -137,11 +137,6 @@ class Command(BaseCommand):
             os.environ.get('KAKAO_API_KEY', '')
         )
         
-        # 기존 데이터 삭제 옵션 (해당 구의 데이터만 삭제)
-        if options.get('clear'):
-            deleted_count = YeongdeungpoDaiso.objects.filter(gu=target_gu).delete()[0]
-            self.stdout.write(self.style.WARNING(f"🗑️ {target_gu} 기존 데이터 {deleted_count}개 삭제"))
-        
         self.stdout.write(self.style.SUCCESS("=" * 60))
         self.stdout.write(self.style.SUCCESS(f"📦 {target_gu} 다이소 수집 V2 시작 (공식 API + 카카오 보완)"))
         self.stdout.write(self.style.SUCCESS("=" * 60))
@@ -154,6 +149,11 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR("다이소 API에서 데이터를 가져오지 못했습니다."))
             return
         
+        # 기존 데이터 삭제 옵션 (해당 구의 데이터만 삭제, API 조회 성공 후에만)
+        if options.get('clear'):
+            deleted_count = YeongdeungpoDaiso.objects.filter(gu=target_gu).delete()[0]
+            self.stdout.write(self.style.WARNING(f"🗑️ {target_gu} 기존 데이터 {deleted_count}개 삭제"))
+        
         self.stdout.write(f"  → API에서 {len(stores)}개 매장 발견")
         
         # 서울 지역 매장만 필터링 (부산 강서구 등 다른 지역 제외)
@@ -6,20 +6,40 @@
 1. --gu 인자로 타겟 구 지정 가능 (기본: 영등포구)
 2. 타겟 구 주소 필터링 (확장성 확보)
 3. 수집 결과 상세 통계
+4. --resume: 마지막으로 완료한 다이소 다음부터 이어서 수집 (체크포인트)
+5. --cache-mode / --cache-ttl: 카카오 응답 디스크 캐시 (재실행 시 API 쿼터 절약)
+6. --adaptive: 45건 제한에 걸린 사분면을 4분할 재귀 조회 (밀집 지역 누락 방지, 비동기 모드)
+7. --strategy grid: 다이소 4분면 대신 구 경계 격자 타일을 한 번씩 조회 (다이소 방식 대비 절감 호출 수 출력)
+8. --plan: plan_kakao_queries 가 만든 set-cover 계획의 rect 만 조회
+9. --rate / --burst: 카카오 토큰 버킷 속도 (429/5xx 는 지수 백오프 + jitter 재시도, Retry-After 우선)
+10. --speculative: 사분면 1~3페이지 동시 요청 후 불필요 페이지 취소 (추가 호출 수 / 절약 시간 출력, 비동기 모드)
+11. --stream: 수집 결과를 큐로 흘려 DB 배치 저장과 겹쳐 실행 (수집/저장 겹침 시간 출력, 비동기 모드)
 """
 
 import os
 import requests
 import time
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.gis.geos import Point
 from django.conf import settings
 from stores.models import YeongdeungpoDaiso, YeongdeungpoConvenience
+from .bulk_upsert import DEFAULT_BATCH_SIZE, bulk_upsert
+from .async_collector import DEFAULT_MIN_CELL_M, KAKAO_MAX_PAGES, run_grid_collection
+from .checkpoints import get_cursor, reset_cursor, save_cursor
+from .gu_boundaries import DEFAULT_TILE_KM, tile_gu
+from .query_planner import estimate_daiso_calls, load_plan
+from .kakao_cache import CACHE_MODES, DEFAULT_CACHE_MODE, DEFAULT_TTL_HOURS, KakaoResponseCache
+from .http_client import RequestFailedError, request
+from .rate_limit import DEFAULT_LIMITS, configure_limiter, get_limiter
 
 
 class Command(BaseCommand):
     help = '다이소 기준 편의점만 수집합니다. (--gu 옵션으로 대상 구 지정)'
 
+    CHECKPOINT_STAGE = 'convenience'  # 체크포인트 단계 키 (pipeline.PIPELINE_STAGES)
+    CHECKPOINT_EVERY = 5  # 비동기 모드: N개 다이소마다 DB 저장 + 체크포인트
+    MAX_RETRIES = 3  # 동기 모드: 429/5xx/타임아웃 재시도 횟수
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--api-key',
@@ -49,6 +69,80 @@ class Command(BaseCommand):
             dest='use_async',
             help='비동기 병렬 수집 모드 (4분면 동시 호출, 75% 성능 개선)'
         )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='체크포인트의 마지막 완료 다이소 다음부터 이어서 수집 (--clear 무시)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'DB 배치 upsert 크기 (기본: {DEFAULT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--cache-mode',
+            choices=CACHE_MODES,
+            default=DEFAULT_CACHE_MODE,
+            help=f'카카오 응답 캐시 모드 (기본: {DEFAULT_CACHE_MODE}, off/read/write/refresh)'
+        )
+        parser.add_argument(
+            '--cache-ttl',
+            type=float,
+            default=DEFAULT_TTL_HOURS,
+            help=f'카카오 응답 캐시 유효 시간 (시간, 기본: {DEFAULT_TTL_HOURS:g})'
+        )
+        parser.add_argument(
+            '--adaptive',
+            action='store_true',
+            help='결과가 45건에서 잘린 사분면을 4분할하여 재조회 (--async 자동 적용)'
+        )
+        parser.add_argument(
+            '--min-cell-m',
+            type=float,
+            default=DEFAULT_MIN_CELL_M,
+            help=f'--adaptive 최소 rect 한 변 (m, 기본: {DEFAULT_MIN_CELL_M:g})'
+        )
+        parser.add_argument(
+            '--speculative',
+            action='store_true',
+            help='사분면 2~3페이지를 1페이지와 동시에 요청하고 불필요하면 취소 (--async 자동 적용, --adaptive 와 함께 쓰면 무시)'
+        )
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            help='수집과 DB 저장을 동시에 진행 (제한 크기 큐 + 배치 저장, --async 자동 적용)'
+        )
+        parser.add_argument(
+            '--strategy',
+            choices=('daiso', 'grid'),
+            default='daiso',
+            help='탐색 영역: daiso=다이소 중심 4분면 (기본), grid=구 경계 격자 타일 (적응형 분할 포함)'
+        )
+        parser.add_argument(
+            '--tile-km',
+            type=float,
+            default=DEFAULT_TILE_KM,
+            help=f'--strategy grid 타일 한 변 (km, 기본: {DEFAULT_TILE_KM:g})'
+        )
+        parser.add_argument(
+            '--plan',
+            type=str,
+            default=None,
+            help='plan_kakao_queries 계획 JSON 경로 (지정 시 계획된 rect 만 조회)'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=None,
+            help=f'카카오 초당 호출 수 (기본: {DEFAULT_LIMITS["kakao"][0]:g})'
+        )
+        parser.add_argument(
+            '--burst',
+            type=int,
+            default=None,
+            help=f'카카오 토큰 버킷 버스트 (기본: {DEFAULT_LIMITS["kakao"][1]})'
+        )
 
     def is_target_gu(self, address, target_gu):
         """
@@ -58,6 +152,19 @@ class Command(BaseCommand):
             return False
         return target_gu in address
 
+    def to_row(self, item, address, target_gu, base_daiso):
+        """카카오 응답 문서 → YeongdeungpoConvenience upsert 행 (좌표 오류 시 ValueError)"""
+        return {
+            'place_id': item.get('id'),
+            'name': item.get('place_name'),
+            'address': address,
+            'phone': item.get('phone'),
+            'location': Point(float(item.get('x')), float(item.get('y'))),
+            'distance': int(item.get('distance', 0)),
+            'base_daiso': base_daiso,
+            'gu': target_gu,  # 구 정보 저장
+        }
+
     def handle(self, *args, **options):
         # API 키 설정 (우선순위: 인자 > settings > 환경변수)
         KAKAO_API_KEY = (
@@ -79,15 +186,43 @@ class Command(BaseCommand):
         
         target_gu = options['gu']
         radius_km = options['radius']
+        resume = options.get('resume', False)
+        self.batch_size = options.get('batch_size') or DEFAULT_BATCH_SIZE
+        try:
+            self.bucket = configure_limiter('kakao', options.get('rate'), options.get('burst'))
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+        self.cache = KakaoResponseCache(
+            mode=options.get('cache_mode', DEFAULT_CACHE_MODE),
+            ttl_hours=options.get('cache_ttl', DEFAULT_TTL_HOURS),
+        )
         
-        # 기존 데이터 삭제 옵션 (해당 구의 데이터만 삭제)
-        if options['clear']:
+        # 기존 데이터 삭제 옵션 (해당 구의 데이터만 삭제, 재개 시에는 유지)
+        if options['clear'] and not resume:
             deleted_count = YeongdeungpoConvenience.objects.filter(gu=target_gu).delete()[0]
             self.stdout.write(self.style.WARNING(f"{target_gu} 기존 편의점 데이터 {deleted_count}개 삭제"))
         
-        # 해당 구 다이소 전체 조회
-        daiso_list = YeongdeungpoDaiso.objects.filter(gu=target_gu)
-        total_daiso_count = daiso_list.count()
+        # 해당 구 다이소 전체 조회 (체크포인트 순번이 유지되도록 id 순 정렬)
+        daiso_list = list(YeongdeungpoDaiso.objects.filter(gu=target_gu).order_by('id'))
+        total_daiso_count = len(daiso_list)
+        
+        if options.get('plan') or options.get('strategy') == 'grid':
+            try:
+                rects, label = self.get_area_rects(target_gu, options)
+            except (OSError, ValueError) as e:
+                self.cache.close()
+                self.stdout.write(self.style.ERROR(str(e)))
+                return
+            reset_cursor(target_gu, self.CHECKPOINT_STAGE)
+            try:
+                self._handle_grid(
+                    KAKAO_API_KEY, daiso_list, target_gu, rects, label,
+                    options.get('min_cell_m', DEFAULT_MIN_CELL_M), radius_km,
+                )
+            finally:
+                self.cache.close()
+            return
         
         if total_daiso_count == 0:
             self.stdout.write(self.style.ERROR(
@@ -95,7 +230,19 @@ class Command(BaseCommand):
             ))
             return
         
-        use_async = options.get('use_async', False)
+        start_index = self.get_start_index(target_gu, daiso_list) if resume else 0
+        if not resume:
+            reset_cursor(target_gu, self.CHECKPOINT_STAGE)
+        elif start_index:
+            self.stdout.write(self.style.WARNING(
+                f"↩️ 체크포인트에서 재개: {start_index}/{total_daiso_count}개 다이소 완료됨"
+            ))
+        
+        self.adaptive = options.get('adaptive', False)
+        self.min_cell_m = options.get('min_cell_m', DEFAULT_MIN_CELL_M)
+        self.speculative = options.get('speculative', False) and not self.adaptive
+        stream = options.get('stream', False)
+        use_async = options.get('use_async', False) or self.adaptive or self.speculative or stream
         
         self.stdout.write(self.style.SUCCESS(
             f"총 {total_daiso_count}개의 {target_gu} 다이소에 대해 편의점 수집을 시작합니다."
@@ -103,10 +250,25 @@ class Command(BaseCommand):
         self.stdout.write(f"탐색 반경: {radius_km}km")
         if use_async:
             self.stdout.write(self.style.WARNING("🚀 비동기 모드 활성화 (4분면 동시 호출)"))
+        if self.adaptive:
+            self.stdout.write(f"적응형 분할: 잘린 사분면 4분할 (최소 {self.min_cell_m:g}m)")
+        if self.speculative:
+            self.stdout.write("페이지 선행 요청: 사분면 1~3페이지 동시 요청")
+        if self.cache.mode != 'off':
+            self.stdout.write(f"응답 캐시: {self.cache.mode} (TTL {self.cache.ttl_seconds / 3600:g}시간)")
         
-        # 비동기 모드 분기
+        # 스트리밍 / 비동기 모드 분기
+        if stream:
+            try:
+                self._handle_stream(KAKAO_API_KEY, daiso_list, target_gu, radius_km, total_daiso_count, start_index)
+            finally:
+                self.cache.close()
+            return
         if use_async:
-            self._handle_async(KAKAO_API_KEY, daiso_list, target_gu, radius_km, total_daiso_count)
+            try:
+                self._handle_async(KAKAO_API_KEY, daiso_list, target_gu, radius_km, total_daiso_count, start_index)
+            finally:
+                self.cache.close()
             return
 
         # 반경에 따른 위도/경도 차이 계산 (근사치)
@@ -115,9 +277,12 @@ class Command(BaseCommand):
 
         total_collected = 0
         total_skipped = 0
+        failed_daiso = []  # 재시도 소진 페이지가 있는 다이소 (이후 체크포인트 전진 중단)
         
-        for idx, daiso in enumerate(daiso_list, 1):
+        for idx, daiso in enumerate(daiso_list[start_index:], start_index + 1):
             if not daiso.location:
+                if not failed_daiso:
+                    save_cursor(target_gu, self.CHECKPOINT_STAGE, next_index=idx, last_daiso_id=daiso.daiso_id)
                 continue
 
             cx = daiso.location.x  # 경도
@@ -137,8 +302,9 @@ class Command(BaseCommand):
                 f"{cx:.6f},{(cy - DELTA_LAT):.6f},{(cx + DELTA_LNG):.6f},{cy:.6f}"
             ]
 
-            stored_count = 0
+            daiso_rows = []
             skipped_count = 0
+            daiso_failed = False
 
             for category_code in TARGET_CATEGORIES:
                 for rect in quadrants:
@@ -156,18 +322,17 @@ class Command(BaseCommand):
                             "sort": "distance"
                         }
 
-                        try:
-                            response = requests.get(url, headers=headers, params=params, timeout=5)
-                            
-                            if response.status_code == 400:
-                                self.stdout.write(self.style.ERROR(f"API 400 에러: {response.text}"))
+                        data = self.cache.get(url, params)
+                        if data is None:
+                            try:
+                                data = self.fetch_page(url, headers, params)
+                            except RequestFailedError as e:
+                                self.stdout.write(self.style.ERROR(f"API 요청 실패: {e}"))
+                                daiso_failed = True
                                 break
-                            
-                            response.raise_for_status()
-                            data = response.json()
-                        except Exception as e:
-                            self.stdout.write(self.style.ERROR(f"API 요청 실패: {e}"))
-                            break
+                            if data is None:
+                                break
+                            self.cache.put(url, params, data)
 
                         documents = data.get('documents', [])
                         
@@ -183,29 +348,9 @@ class Command(BaseCommand):
                                     skipped_count += 1
                                     continue
                                 
-                                lng = float(item.get('x'))
-                                lat = float(item.get('y'))
-                                point = Point(lng, lat)
-                                dist = int(item.get('distance', 0))
-                                
-                                # place_id 기준 중복 방지 (Race Condition 방지: transaction.atomic 사용)
-                                from django.db import transaction
-                                with transaction.atomic():
-                                    YeongdeungpoConvenience.objects.select_for_update().update_or_create(
-                                        place_id=item.get('id'),
-                                        defaults={
-                                            'name': item.get('place_name'),
-                                            'address': address,
-                                            'phone': item.get('phone'),
-                                            'location': point,
-                                            'distance': dist,
-                                            'base_daiso': daiso.name,
-                                            'gu': target_gu,  # 구 정보 저장
-                                        }
-                                    )
-                                stored_count += 1
+                                daiso_rows.append(self.to_row(item, address, target_gu, daiso.name))
                             except Exception as e:
-                                self.stdout.write(self.style.ERROR(f"저장 실패: {e}"))
+                                self.stdout.write(self.style.ERROR(f"변환 실패: {e}"))
                                 continue
 
                         if data.get('meta', {}).get('is_end'):
@@ -214,13 +359,20 @@ class Command(BaseCommand):
                         page += 1
                         if page > 3:  # 최대 3페이지
                             break
-                        
-                        time.sleep(0.2)
+
+            # 다이소 단위 배치 upsert (place_id 기준 중복 방지)
+            bulk_upsert(YeongdeungpoConvenience, daiso_rows, unique_field='place_id', batch_size=self.batch_size)
+            stored_count = len(daiso_rows)
 
             self.stdout.write(f"  -> {stored_count}개 저장, {skipped_count}개 스킵 ({target_gu} 아님)")
             total_collected += stored_count
             total_skipped += skipped_count
-            time.sleep(0.3)
+            if daiso_failed:
+                failed_daiso.append(daiso.name)
+            if not failed_daiso:
+                save_cursor(target_gu, self.CHECKPOINT_STAGE, next_index=idx, last_daiso_id=daiso.daiso_id)
+
+        self.cache.close()
 
         # 최종 통계
         convenience_count = YeongdeungpoConvenience.objects.count()
@@ -239,62 +391,302 @@ class Command(BaseCommand):
   - {target_gu} 외 데이터: {wrong_gu_count}개
         """))
         
+        self.write_cache_stats()
+        self.write_rate_limit_stats()
+
         if wrong_gu_count > 0:
             self.stdout.write(self.style.WARNING(
                 f"⚠️ {target_gu} 아닌 편의점 {wrong_gu_count}개가 DB에 있습니다."
             ))
 
-    def _handle_async(self, api_key, daiso_list, target_gu, radius_km, total_daiso_count):
+        self.raise_for_failed_daiso(failed_daiso)
+
+    def raise_for_failed_daiso(self, failed_daiso):
+        """재시도 소진 페이지가 있으면 CommandError (체크포인트는 첫 실패 다이소 직전에서 멈춤)"""
+        if failed_daiso:
+            raise CommandError(
+                f"{len(failed_daiso)}개 다이소 페이지 조회 실패 (재시도 소진): {', '.join(failed_daiso[:5])} "
+                f"- --resume 으로 첫 실패 다이소부터 재개 가능"
+            )
+
+    def fetch_page(self, url, headers, params):
         """
-        비동기 모드 편의점 수집 핸들러
+        카카오 API 1페이지 동기 호출 (http_client: 토큰 버킷 대기 + 429/5xx/타임아웃 재시도)
+
+        Returns:
+            응답 JSON (400 이면 None)
+
+        Raises:
+            RequestFailedError: 재시도 소진 / 서킷 차단 (빈 결과로 대신하지 않음)
+        """
+        def on_retry(attempt, status, delay):
+            self.stdout.write(self.style.WARNING(
+                f"  ⏳ {f'HTTP {status}' if status else '네트워크 오류'}, "
+                f"{delay:.1f}초 후 재시도 ({attempt + 1}/{self.MAX_RETRIES})"
+            ))
+
+        response = request(
+            'GET', url, limiter_key='kakao', max_retries=self.MAX_RETRIES, on_retry=on_retry,
+            headers=headers, params=params, timeout=5,
+        )
+        if response.status_code == 400:
+            self.stdout.write(self.style.ERROR(f"API 400 에러: {response.text}"))
+            return None
+        try:
+            response.raise_for_status()
+            return response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise RequestFailedError(url, str(e), status=response.status_code, attempts=1)
+
+    def write_rate_limit_stats(self):
+        """카카오 토큰 버킷 대기 / 429 통계 출력"""
+        stats = get_limiter('kakao').get_stats()
+        self.stdout.write(
+            f"🚦 호출 제한({stats['rate']:g}/초, 버스트 {stats['burst']}): "
+            f"토큰 {stats['acquired']}회 / 대기 {stats['waited']:g}초 / 429 {stats['throttled']}회"
+        )
+
+    def write_cache_stats(self):
+        """응답 캐시 적중/미스/저장 건수 출력"""
+        if self.cache.mode == 'off':
+            return
+        stats = self.cache.get_stats()
+        self.stdout.write(
+            f"💾 응답 캐시({stats['mode']}): 적중 {stats['hits']}회 / 미스 {stats['misses']}회 / 저장 {stats['writes']}회"
+        )
+
+    def get_area_rects(self, target_gu, options):
+        """
+        격자 / 계획 모드 조회 rect 목록과 설명 (--plan 우선)
         
-        4분면 동시 호출로 성능 75% 개선
+        Raises:
+            OSError / ValueError: 계획 파일을 읽을 수 없거나 다른 구의 계획, 경계 데이터 없음
         """
-        import time as time_module
-        from django.db import transaction
-        from .async_collector import run_async_collection
+        if options.get('plan'):
+            plan = load_plan(options['plan'])
+            if plan['gu'] != target_gu:
+                raise ValueError(f"{plan['gu']} 계획입니다. --gu {plan['gu']} 로 실행하세요.")
+            rects = [item['rect'] for item in plan['rects']]
+            return rects, f"set-cover 계획 {len(rects)}개 rect (예상 {plan.get('estimated_calls', '?')}회)"
         
-        start_time = time_module.time()
+        tile_km = options.get('tile_km', DEFAULT_TILE_KM)
+        rects = tile_gu(target_gu, tile_km)
+        return rects, f"경계 격자 {len(rects)}개 타일 ({tile_km:g}km)"
+
+    def _handle_grid(self, api_key, daiso_list, target_gu, rects, label, min_cell_m, radius_km):
+        """
+        격자 타일 / 계획 모드 편의점 수집 핸들러 (--strategy grid, --plan)
         
-        # 진행 상황 콜백
-        def progress_callback(idx, total, daiso_name, count):
-            self.stdout.write(f"[{idx}/{total}] '{daiso_name}' → {count}개 수집")
+        서로 겹치지 않는 rect 를 한 번씩 조회하고 (잘린 rect 는 4분할),
+        이번에 수집한 매장 밀도로 추정한 다이소 중심 4분면 방식 호출 수와 비교한 절감량을 출력한다.
+        """
+        self.stdout.write(self.style.SUCCESS(
+            f"{target_gu} {label}로 편의점 수집을 시작합니다."
+        ))
+        start_time = time.time()
         
-        self.stdout.write(self.style.WARNING("비동기 수집 시작..."))
+        def progress(done, total):
+            if done % 10 == 0 or done == total:
+                self.stdout.write(f"[{done}/{total}] rect 처리 완료")
         
-        # 비동기 수집 실행
-        stores, stats = run_async_collection(
+        stores, stats = run_grid_collection(
             api_key=api_key,
-            daiso_list=daiso_list,
+            rects=rects,
             target_gu=target_gu,
-            radius_km=radius_km
+            cache=self.cache,
+            min_cell_m=min_cell_m,
+            progress_callback=progress,
         )
         
-        # DB 저장 (bulk upsert)
-        stored_count = 0
+        rows = []
         for item in stores:
             try:
-                lng = float(item.get('x'))
-                lat = float(item.get('y'))
-                point = Point(lng, lat)
                 address = item.get('road_address_name') or item.get('address_name', '')
-                
-                with transaction.atomic():
-                    YeongdeungpoConvenience.objects.update_or_create(
-                        place_id=item.get('id'),
-                        defaults={
-                            'name': item.get('place_name'),
-                            'address': address,
-                            'phone': item.get('phone'),
-                            'location': point,
-                            'distance': int(item.get('distance', 0)),
-                            'base_daiso': item.get('_base_daiso', ''),
-                            'gu': target_gu,
-                        }
-                    )
-                stored_count += 1
+                rows.append(self.to_row(item, address, target_gu, item.get('_base_daiso', '')))
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"저장 실패: {e}"))
+        bulk_upsert(YeongdeungpoConvenience, rows, unique_field='place_id', batch_size=self.batch_size)
+        
+        # 다이소 방식 예상 호출: 수집된 매장 좌표로 다이소별 4분면 rect 페이지 수 추정
+        # (상한 = 다이소 x 4분면 x 3페이지, 실제로는 희소 지역 사분면이 1페이지에서 끝남)
+        daiso_points = [(daiso.location.x, daiso.location.y) for daiso in daiso_list if daiso.location]
+        store_points = [(row['location'].x, row['location'].y) for row in rows]
+        daiso_rects = 4 * len(daiso_points)
+        daiso_max_calls = daiso_rects * KAKAO_MAX_PAGES
+        daiso_calls = estimate_daiso_calls(daiso_points, store_points, radius_km)
+        grid_calls = stats['api_calls'] + stats['cache_hits']
+        
+        self.stdout.write(self.style.SUCCESS(f"""
+--- 🧩 영역 rect 수집 완료 ---
+  ⏱️ 소요 시간: {time.time() - start_time:.2f}초
+  🧩 rect: {len(rects)}개 (4분할 {stats['split_count']}회, 최소 크기에서도 잘린 rect {stats['truncated_cells']}개)
+  📡 API 호출: {stats['api_calls']}회 (캐시 적중 {stats['cache_hits']}회)
+  ✅ DB 저장: {len(rows)}개
+  ⚠️ 스킵 ({target_gu} 아님): {stats['skipped_count']}개
+
+📉 다이소 4분면 방식 대비 (다이소 {len(daiso_list)}개, rect {daiso_rects}개, 반경 {radius_km}km):
+  - 예상 호출 (수집 매장 밀도 기준): {daiso_calls}회 → 절감 {daiso_calls - grid_calls}회
+  - 상한 (rect x {KAKAO_MAX_PAGES}페이지): {daiso_max_calls}회 → 상한 대비 절감 {daiso_max_calls - grid_calls}회
+        """))
+        self.write_rate_limit_stats()
+        
+        if stats['errors']:
+            self.stdout.write(self.style.WARNING(
+                f"⚠️ 에러 {len(stats['errors'])}건: {stats['errors'][:3]}"
+            ))
+        
+        if stats['failed_rects']:
+            raise CommandError(
+                f"{len(stats['failed_rects'])}개 rect 페이지 조회 실패 (재시도 소진) - 재실행 필요 "
+                f"(--cache-mode write 면 성공한 rect 는 캐시에서 읽음)"
+            )
+
+    def get_start_index(self, target_gu, daiso_list):
+        """
+        체크포인트 기준 재개 위치 (다음에 처리할 다이소 순번, 0부터)
+
+        다이소 목록이 바뀌어 마지막 완료 다이소가 일치하지 않으면 처음부터 수집한다.
+        """
+        cursor = get_cursor(target_gu, self.CHECKPOINT_STAGE)
+        next_index = cursor.get('next_index', 0)
+        if not next_index:
+            return 0
+        if next_index > len(daiso_list) or daiso_list[next_index - 1].daiso_id != cursor.get('last_daiso_id'):
+            self.stdout.write(self.style.WARNING("⚠️ 다이소 목록이 변경되어 체크포인트를 무시하고 처음부터 수집합니다."))
+            return 0
+        return next_index
+
+    def _handle_stream(self, api_key, daiso_list, target_gu, radius_km, total_daiso_count, start_index=0):
+        """
+        스트리밍 모드 편의점 수집 핸들러 (--stream)
+        
+        비동기 수집기가 다이소 완료 순서대로 편의점을 큐에 넣고, 저장 스레드가 배치 단위로 upsert 한다.
+        체크포인트는 앞에서부터 연속으로 저장된 다이소까지만 전진한다.
+        """
+        from .async_collector import run_streaming_collection
+        
+        self.stdout.write(self.style.WARNING("스트리밍 수집 시작 (수집 ↔ DB 저장 동시 진행)..."))
+        
+        def write_batch(stores):
+            rows = []
+            for item in stores:
+                try:
+                    address = item.get('road_address_name') or item.get('address_name', '')
+                    rows.append(self.to_row(item, address, target_gu, item.get('_base_daiso', '')))
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f"저장 실패: {e}"))
+            bulk_upsert(YeongdeungpoConvenience, rows, unique_field='place_id', batch_size=self.batch_size)
+            return len(rows)
+        
+        def on_written(done, daiso):
+            save_cursor(target_gu, self.CHECKPOINT_STAGE, next_index=start_index + done, last_daiso_id=daiso.daiso_id)
+        
+        def progress(done, total, name, count):
+            if done % self.CHECKPOINT_EVERY == 0 or done == total:
+                self.stdout.write(f"[{start_index + done}/{total_daiso_count}] 다이소 수집 완료 ({name}: {count}개)")
+        
+        stats = run_streaming_collection(
+            api_key=api_key,
+            daiso_list=daiso_list[start_index:],
+            target_gu=target_gu,
+            write_batch=write_batch,
+            on_written=on_written,
+            radius_km=radius_km,
+            cache=self.cache,
+            adaptive=self.adaptive,
+            min_cell_m=self.min_cell_m,
+            speculative=self.speculative,
+            batch_size=self.batch_size,
+            progress_callback=progress,
+        )
+        stream = stats['stream']
+        convenience_count = YeongdeungpoConvenience.objects.filter(gu=target_gu).count()
+        
+        self.stdout.write(self.style.SUCCESS(f"""
+--- 🌊 스트리밍 수집 완료 ---
+  ⏱️ 소요 시간: {stream['total_seconds']:.2f}초 (순차 실행 시 {stream['sequential_seconds']:.2f}초)
+  📡 수집: {stream['fetch_seconds']:.2f}초, API 호출 {stats['api_calls']}회 (캐시 적중 {stats['cache_hits']}회, 재시도 {stats['retries']}회)
+  💾 저장: {stream['write_seconds']:.2f}초, {stream['batches']}개 배치 {stream['rows_written']}개
+  🔀 겹침: {stream['overlap_seconds']:.2f}초 (저장 시간의 {stream['overlap_ratio']}%), 최대 큐 {stream['max_queue']}개 다이소
+  ⚠️ 스킵 ({target_gu} 아님): {stats['skipped_count']}개
+
+📊 현재 DB 상태:
+  - {target_gu} 편의점: {convenience_count}개
+        """))
+        self.write_rate_limit_stats()
+        
+        if stats['errors']:
+            self.stdout.write(self.style.WARNING(
+                f"⚠️ 에러 {len(stats['errors'])}건: {stats['errors'][:3]}"
+            ))
+        
+        self.raise_for_failed_daiso(stats['failed_daiso'])
+
+    def _handle_async(self, api_key, daiso_list, target_gu, radius_km, total_daiso_count, start_index=0):
+        """
+        비동기 모드 편의점 수집 핸들러
+        
+        4분면 동시 호출로 성능 75% 개선
+        남은 다이소 전체를 한 번의 슬라이딩 윈도우 수집으로 처리 (구간 경계에서 윈도우가 비지 않음)
+        완료된 다이소 CHECKPOINT_EVERY개마다 DB 저장 → 연속 완료 구간까지 체크포인트 기록
+        """
+        import time as time_module
+        from .async_collector import ContiguousCheckpoint, run_async_collection
+        
+        start_time = time_module.time()
+        
+        self.stdout.write(self.style.WARNING("비동기 수집 시작..."))
+        
+        checkpoint = ContiguousCheckpoint()
+        pending_rows, pending_daiso = [], []
+        stored_count = 0
+        
+        def flush():
+            nonlocal pending_rows, pending_daiso, stored_count
+            # DB 저장 (place_id 기준 배치 upsert)
+            bulk_upsert(YeongdeungpoConvenience, pending_rows, unique_field='place_id', batch_size=self.batch_size)
+            stored_count += len(pending_rows)
+            for position, daiso, failed in pending_daiso:
+                checkpoint.mark(position, daiso, failed)
+            pending_rows, pending_daiso = [], []
+            
+            # 체크포인트: 앞에서부터 연속으로 저장된 다이소까지 (실패 페이지가 나온 다이소에서 정지)
+            advanced = checkpoint.advance()
+            if advanced is not None:
+                save_cursor(
+                    target_gu, self.CHECKPOINT_STAGE,
+                    next_index=start_index + checkpoint.next_position, last_daiso_id=advanced.daiso_id,
+                )
+        
+        def sink(position, daiso, stores, failed):
+            for item in stores:
+                try:
+                    address = item.get('road_address_name') or item.get('address_name', '')
+                    pending_rows.append(self.to_row(item, address, target_gu, item.get('_base_daiso', '')))
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f"저장 실패: {e}"))
+            pending_daiso.append((position, daiso, failed))
+            if len(pending_daiso) >= self.CHECKPOINT_EVERY:
+                flush()
+        
+        def progress(done, total, name, count):
+            if done % self.CHECKPOINT_EVERY == 0 or done == total:
+                self.stdout.write(f"[{start_index + done}/{total_daiso_count}] 다이소 처리 완료 → 누적 {stored_count}개 저장")
+        
+        # 비동기 수집 실행 (남은 다이소 전체, 완료 순서대로 sink 호출)
+        _, stats = run_async_collection(
+            api_key=api_key,
+            daiso_list=daiso_list[start_index:],
+            target_gu=target_gu,
+            radius_km=radius_km,
+            cache=self.cache,
+            adaptive=self.adaptive,
+            min_cell_m=self.min_cell_m,
+            speculative=self.speculative,
+            progress_callback=progress,
+            sink=sink,
+        )
+        flush()
         
         elapsed = time_module.time() - start_time
         
@@ -304,7 +696,7 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f"""
 --- 🚀 비동기 수집 완료 ---
   ⏱️ 소요 시간: {elapsed:.2f}초
-  📡 API 호출: {stats['api_calls']}회
+  📡 API 호출: {stats['api_calls']}회 (캐시 적중 {stats['cache_hits']}회, 재시도 {stats['retries']}회)
   ✅ DB 저장: {stored_count}개
   ⚠️ 스킵 ({target_gu} 아님): {stats['skipped_count']}개
 
@@ -312,7 +704,23 @@ class Command(BaseCommand):
   - {target_gu} 편의점: {convenience_count}개
         """))
         
+        if self.adaptive:
+            self.stdout.write(
+                f"🔀 적응형 분할: {stats['split_count']}개 rect 4분할, "
+                f"최소 크기에서도 잘린 rect {stats['truncated_cells']}개"
+            )
+        if self.speculative and stats['prefetch_quadrants']:
+            self.stdout.write(
+                f"⚡ 페이지 선행 요청: 사분면 {stats['prefetch_quadrants']}개, "
+                f"추가 호출 {stats['prefetch_extra_calls']}회 / 취소 {stats['prefetch_cancelled']}회, "
+                f"절약 {stats['prefetch_saved_seconds']:.2f}초 "
+                f"(사분면당 {stats['prefetch_saved_seconds'] / stats['prefetch_quadrants']:.3f}초)"
+            )
+        self.write_rate_limit_stats()
+        
         if stats['errors']:
             self.stdout.write(self.style.WARNING(
                 f"⚠️ 에러 {len(stats['errors'])}건: {stats['errors'][:3]}"
             ))
+        
+        self.raise_for_failed_daiso(stats['failed_daiso'])
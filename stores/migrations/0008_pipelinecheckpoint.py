@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0007_add_gu_field'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PipelineCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gu', models.CharField(max_length=20, verbose_name='구')),
+                ('stage', models.CharField(max_length=30, verbose_name='단계')),
+                ('status', models.CharField(choices=[('running', '실행 중'), ('completed', '완료'), ('failed', '실패')], default='running', max_length=10, verbose_name='상태')),
+                ('cursor', models.JSONField(blank=True, default=dict, verbose_name='진행 위치')),
+                ('error', models.TextField(blank=True, null=True, verbose_name='오류 메시지')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신 일시')),
+            ],
+            options={
+                'verbose_name': '파이프라인 체크포인트',
+                'verbose_name_plural': '파이프라인 체크포인트 목록',
+                'db_table': 'pipeline_checkpoint',
+                'constraints': [models.UniqueConstraint(fields=('gu', 'stage'), name='uniq_pipeline_checkpoint_gu_stage')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-17 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stores', '0008_pipelinecheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='yeongdeungpodaiso',
+            index=models.Index(fields=['gu'], name='yd_daiso_gu_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='yeongdeungpoconvenience',
+            index=models.Index(fields=['gu'], name='yd_conv_gu_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seoulrestaurantlicense',
+            index=models.Index(fields=['gu', 'uptaenm'], name='license_gu_uptaenm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tobaccoretaillicense',
+            index=models.Index(fields=['gu'], name='tobacco_gu_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storeclosureresult',
+            index=models.Index(fields=['gu', 'status'], name='closure_gu_status_idx'),
+        ),
+    ]
@@ -46,6 +46,9 @@ class YeongdeungpoDaiso(models.Model):
         db_table = 'yeongdeungpo_daiso'
         verbose_name = '서울 다이소 (구별)'
         verbose_name_plural = '서울 다이소 목록 (구별)'
+        indexes = [
+            models.Index(fields=['gu'], name='yd_daiso_gu_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] {self.name}"
@@ -70,6 +73,9 @@ class YeongdeungpoConvenience(models.Model):
         db_table = 'yeongdeungpo_convenience'
         verbose_name = '서울 편의점 (구별)'
         verbose_name_plural = '서울 편의점 목록 (구별)'
+        indexes = [
+            models.Index(fields=['gu'], name='yd_conv_gu_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] {self.name} (near {self.base_daiso})"
@@ -145,6 +151,10 @@ class SeoulRestaurantLicense(models.Model):
         db_table = 'yeongdeungpo_convenience_license'
         verbose_name = '서울 편의점 인허가 (구별)'
         verbose_name_plural = '서울 편의점 인허가 목록 (구별)'
+        indexes = [
+            # filter(gu=...) 단독 조회도 선두 컬럼으로 사용
+            models.Index(fields=['gu', 'uptaenm'], name='license_gu_uptaenm_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] [{self.uptaenm}] {self.bplcnm} ({self.trdstatenm})"
@@ -212,6 +222,9 @@ class TobaccoRetailLicense(models.Model):
         db_table = 'yeongdeungpo_tobacco_retail_license'
         verbose_name = '서울 담배소매업 인허가 (구별)'
         verbose_name_plural = '서울 담배소매업 인허가 목록 (구별)'
+        indexes = [
+            models.Index(fields=['gu'], name='tobacco_gu_idx'),
+        ]
 
     def __str__(self):
         return f"[{self.gu}] [담배소매업] {self.bplcnm} ({self.trdstatenm})"
@@ -245,6 +258,40 @@ class StoreClosureResult(models.Model):
         verbose_name = '폐업 매장 체크 결과 (구별)'
         verbose_name_plural = '폐업 매장 체크 결과 목록 (구별)'
         ordering = ['-checked_at']
+        indexes = [
+            # filter(gu=...) 단독 조회도 선두 컬럼으로 사용
+            models.Index(fields=['gu', 'status'], name='closure_gu_status_idx'),
+        ]
 
     def __str__(self):
-        return f"[{self.gu}] [{self.status}] {self.name}"
\ No newline at end of file
+        return f"[{self.gu}] [{self.status}] {self.name}"
+
+# 8. 파이프라인 단계별 체크포인트 (run_all --resume)
+class PipelineCheckpoint(models.Model):
+    """구별 · 단계별 파이프라인 진행 상태 (중단 지점부터 재개용)"""
+    
+    STATUS_CHOICES = [
+        ('running', '실행 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    gu = models.CharField(max_length=20, verbose_name='구')
+    stage = models.CharField(max_length=30, verbose_name='단계')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='running', verbose_name='상태')
+    # 단계 내부 진행 위치 (예: 편의점 수집 {'next_index': 12}, OpenAPI {'next_start': 5001})
+    cursor = models.JSONField(default=dict, blank=True, verbose_name='진행 위치')
+    error = models.TextField(null=True, blank=True, verbose_name='오류 메시지')
+    
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신 일시')
+
+    class Meta:
+        db_table = 'pipeline_checkpoint'
+        verbose_name = '파이프라인 체크포인트'
+        verbose_name_plural = '파이프라인 체크포인트 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['gu', 'stage'], name='uniq_pipeline_checkpoint_gu_stage'),
+        ]
+
+    def __str__(self):
+        return f"[{self.gu}] {self.stage} ({self.status})"
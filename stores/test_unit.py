@@ -645,3 +645,1129 @@ class ExceptionHandlingTests(TestCase):
             self.assertFalse(data['success'])
             self.assertIn('이미 수집이 진행 중입니다', data['error'])
             print("    ✅ 중복 실행 시도 차단 및 에러 메시지 확인")
+
+
+# ========================================
+# 9. 서울 전역 동시 파이프라인 테스트
+# ========================================
+
+class CityPipelineTests(TestCase):
+    """run_all --all-gu 동시 실행 테스트 (단계 실행은 모킹)"""
+
+    def test_provider_budget_limits_concurrency(self):
+        print("\n[TEST] provider 예산(동시 슬롯) 준수 테스트 시작")
+        import threading
+        from stores.management.commands import pipeline
+
+        active = {'kakao': 0}
+        peak = {'kakao': 0}
+        lock = threading.Lock()
+
+        def fake_run_stage(stage, target_gu, stdout=None):
+            if stage.provider != 'kakao':
+                return
+            with lock:
+                active['kakao'] += 1
+                peak['kakao'] = max(peak['kakao'], active['kakao'])
+            time.sleep(0.02)
+            with lock:
+                active['kakao'] -= 1
+
+        stages = [s for s in pipeline.PIPELINE_STAGES if s.name in ('convenience', 'restaurant')]
+        with patch.object(pipeline, 'PROVIDER_BUDGETS', {
+            'kakao': {'slots': 1, 'min_interval': 0.0},
+            'seoul': {'slots': 4, 'min_interval': 0.0},
+        }), patch.object(pipeline, 'run_stage', side_effect=fake_run_stage):
+            reports, wall_time = pipeline.run_city_pipeline(
+                ['영등포구', '강남구', '마포구', '송파구'], stages, workers=4
+            )
+
+        print(f"    - 카카오 단계 최대 동시 실행: {peak['kakao']}")
+        self.assertEqual(peak['kakao'], 1)
+        self.assertEqual([r.gu for r in reports], ['영등포구', '강남구', '마포구', '송파구'])
+        self.assertTrue(all(r.success for r in reports))
+        print("    ✅ 카카오 예산(1 슬롯) 준수 확인")
+
+    def test_failed_stage_stops_only_that_gu(self):
+        print("\n[TEST] 단계 실패 시 해당 구만 중단 테스트 시작")
+        from stores.management.commands import pipeline
+
+        def fake_run_stage(stage, target_gu, stdout=None):
+            if target_gu == '강남구' and stage.name == 'restaurant':
+                raise RuntimeError('API 오류')
+
+        with patch.object(pipeline, 'run_stage', side_effect=fake_run_stage):
+            reports, wall_time = pipeline.run_city_pipeline(
+                ['영등포구', '강남구'], pipeline.PIPELINE_STAGES, workers=2
+            )
+
+        summary = pipeline.summarize_throughput(reports, wall_time)
+        self.assertTrue(reports[0].success)
+        self.assertFalse(reports[1].success)
+        self.assertEqual(reports[1].failed_stage, 'restaurant')
+        self.assertNotIn('closure', reports[1].stage_times)
+        self.assertEqual(summary['gu_succeeded'], 1)
+        self.assertEqual(summary['gu_failed'], 1)
+        print("    ✅ 실패 구 격리 및 처리량 요약 확인")
+
+    def test_stage_graph_overlaps_independent_stages(self):
+        print("\n[TEST] 단계 그래프 병렬 실행 및 임계 경로 테스트 시작")
+        from stores.management.commands import pipeline
+
+        durations = {'daiso': 0.05, 'convenience': 0.1, 'restaurant': 0.2, 'tobacco': 0.05, 'closure': 0.02}
+        order = []
+
+        def execute(stage):
+            time.sleep(durations[stage.name])
+            order.append(stage.name)
+
+        result = pipeline.run_stage_graph(pipeline.PIPELINE_STAGES, execute)
+
+        print(f"    - 전체: {result.total_time}초, 순차 합계: {result.serial_time}초")
+        print(f"    - 임계 경로: {result.critical_path} ({result.critical_path_time}초)")
+        self.assertTrue(result.success)
+        self.assertEqual(order[-1], 'closure')
+        self.assertLess(order.index('daiso'), order.index('convenience'))
+        self.assertEqual(result.critical_path, ['restaurant', 'closure'])
+        self.assertLess(result.total_time, result.serial_time)
+        print("    ✅ 독립 단계 병렬 실행 + 임계 경로 산출 확인")
+
+    def test_resume_skips_completed_stages_and_keeps_cursor(self):
+        print("\n[TEST] 체크포인트 기반 재개 테스트 시작")
+        from stores.management.commands import checkpoints, pipeline
+
+        checkpoints.mark_completed('영등포구', 'daiso')
+        checkpoints.mark_running('영등포구', 'convenience')
+        checkpoints.save_cursor('영등포구', 'convenience', next_index=3, last_daiso_id='D3')
+        checkpoints.save_cursor('영등포구', 'convenience', next_index=4)
+        checkpoints.mark_failed('영등포구', 'convenience', RuntimeError('카카오 API 오류'))
+
+        stages = pipeline.pending_stages(pipeline.PIPELINE_STAGES, '영등포구', resume=True)
+        names = [stage.name for stage in stages]
+        print(f"    - 재개 대상 단계: {names}")
+        self.assertNotIn('daiso', names)
+        self.assertIn('convenience', names)
+        self.assertEqual(
+            checkpoints.get_cursor('영등포구', 'convenience'),
+            {'next_index': 4, 'last_daiso_id': 'D3'}
+        )
+
+        # 재개 없이 새로 실행하면 체크포인트 초기화
+        stages = pipeline.pending_stages(pipeline.PIPELINE_STAGES, '영등포구', resume=False)
+        self.assertEqual(len(stages), len(pipeline.PIPELINE_STAGES))
+        self.assertEqual(checkpoints.get_cursor('영등포구', 'convenience'), {})
+        print("    ✅ 완료 단계 스킵 + 실패 단계 cursor 유지 확인")
+
+    def test_dashboard_run_resets_gu_checkpoints(self):
+        print("\n[TEST] 대시보드 수집 체크포인트 초기화 테스트 시작")
+        from stores import views
+        from stores.management.commands import checkpoints, pipeline
+
+        checkpoints.mark_completed('영등포구', 'daiso')
+        checkpoints.mark_completed('영등포구', 'convenience')
+        scheduled = []
+
+        def fake_run_stage_graph(stages, execute, **kwargs):
+            scheduled.extend(stage.name for stage in stages)
+            raise RuntimeError('단계 실행 생략')
+
+        status = {'running': True, 'metrics': {'logs': [], 'stages': {}}}
+        with patch.object(pipeline, 'run_stage_graph', fake_run_stage_graph), \
+                patch('stores.views.collection_status', status):
+            views.run_collection_task('영등포구')
+
+        # 이전 완료 기록이 남으면 이후 run_all --resume 이 지워진 데이터의 단계를 건너뜀
+        self.assertEqual(scheduled, [stage.name for stage in pipeline.PIPELINE_STAGES])
+        self.assertFalse(checkpoints.is_completed('영등포구', 'daiso'))
+        self.assertFalse(checkpoints.is_completed('영등포구', 'convenience'))
+        print("    ✅ 대시보드 실행 시작 시 구 체크포인트 초기화 확인")
+
+    def test_incremental_stages_not_reported_as_skipped(self):
+        print("\n[TEST] run_all --incremental 단계 스킵 표시 테스트 시작")
+        from io import StringIO
+        from stores.management.commands.run_all import Command
+
+        options = {
+            'skip_daiso': False, 'skip_convenience': False, 'skip_openapi': False,
+            'skip_check': True, 'incremental': True, 'cache_mode': 'off',
+        }
+        out = StringIO()
+        command = Command(stdout=out)
+        selected = command.select_stages(options)
+        command.report_skipped(selected, selected)
+
+        incremental = {stage.name: stage.options.get('incremental') for stage in selected}
+        self.assertTrue(incremental['restaurant'])
+        self.assertTrue(incremental['tobacco'])
+        # replace() 로 옵션이 바뀐 서울시 OpenAPI 단계도 선택된 단계로 취급
+        self.assertNotIn('휴게음식점', out.getvalue())
+        self.assertNotIn('담배소매업', out.getvalue())
+        self.assertIn('폐업 검증 스킵', out.getvalue())
+        print("    ✅ --incremental 단계는 스킵으로 표시되지 않음 확인")
+
+    def test_cache_mode_stage_not_reported_as_skipped(self):
+        print("\n[TEST] run_all --cache-mode 단계 스킵 표시 테스트 시작")
+        from io import StringIO
+        from stores.management.commands.run_all import Command
+
+        # KAKAO_CACHE_MODE 환경변수로 기본값이 바뀐 경우도 같은 경로 (cache_mode != 'off')
+        for mode in ('read', 'write', 'refresh'):
+            options = {
+                'skip_daiso': True, 'skip_convenience': False, 'skip_openapi': True,
+                'skip_check': True, 'incremental': False, 'cache_mode': mode,
+            }
+            out = StringIO()
+            command = Command(stdout=out)
+            selected = command.select_stages(options)
+            command.report_skipped(selected, selected)
+
+            convenience = next(stage for stage in selected if stage.name == 'convenience')
+            self.assertEqual(convenience.options['cache_mode'], mode)
+            self.assertNotIn('편의점 수집', out.getvalue())
+            self.assertIn('다이소 수집 스킵', out.getvalue())
+        print("    ✅ --cache-mode 편의점 단계는 스킵으로 표시되지 않음 확인")
+
+
+# ========================================
+# 10. 배치 upsert 테스트
+# ========================================
+
+class BulkUpsertTests(TestCase):
+    """bulk_upsert (INSERT ... ON CONFLICT DO UPDATE) 테스트"""
+
+    def test_bulk_upsert_counts_and_dedup(self):
+        print("\n[TEST] 배치 upsert 신규/업데이트 건수 테스트 시작")
+        from stores.management.commands.bulk_upsert import bulk_upsert
+
+        StoreClosureResult.objects.create(place_id="upsert_001", name="기존", status="폐업")
+
+        rows = [
+            {'place_id': 'upsert_001', 'name': 'GS25 여의도점', 'gu': '영등포구', 'status': '정상'},
+            {'place_id': 'upsert_002', 'name': 'CU 당산점', 'gu': '영등포구', 'status': '폐업'},
+            {'place_id': 'upsert_002', 'name': 'CU 당산역점', 'gu': '영등포구', 'status': '정상'},
+            {'place_id': 'upsert_003', 'name': '세븐일레븐', 'gu': '영등포구', 'status': '정상'},
+        ]
+        created, updated = bulk_upsert(StoreClosureResult, rows, unique_field='place_id', batch_size=2)
+
+        print(f"    - 신규: {created}건, 업데이트: {updated}건")
+        self.assertEqual((created, updated), (2, 1))
+        self.assertEqual(StoreClosureResult.objects.count(), 3)
+        self.assertEqual(StoreClosureResult.objects.get(place_id='upsert_001').status, '정상')
+        self.assertEqual(StoreClosureResult.objects.get(place_id='upsert_002').name, 'CU 당산역점')
+        print("    ✅ 중복 키 마지막 값 우선 + 건수 집계 확인")
+
+
+# ========================================
+# 11. 서울시 OpenAPI 구간 동시 조회 테스트
+# ========================================
+
+class SeoulOpenAPIFetchTests(TestCase):
+    """seoul_openapi 구간 동시 조회 테스트 (HTTP 요청은 모킹)"""
+
+    def test_seoul_openapi_windows_reassembled_in_order(self):
+        print("\n[TEST] 서울시 OpenAPI 구간 동시 조회 + 재시도 + 순서 재조립 테스트 시작")
+        import asyncio
+        from stores.management.commands import seoul_openapi
+
+        windows = seoul_openapi.window_ranges(1, 2500, page_size=1000)
+        self.assertEqual(windows, [(1, 1000), (1001, 2000), (2001, 2500)])
+
+        calls = {}
+
+        async def fake_fetch_once(self, session, start, end):
+            calls[start] = calls.get(start, 0) + 1
+            if start == 1001 and calls[start] == 1:
+                raise ConnectionError('일시 오류')
+            await asyncio.sleep(0.03 if start == 1 else 0.0)  # 첫 구간이 가장 늦게 도착
+            return [{'MGTNO': f'{start}-{end}'}]
+
+        with patch.object(seoul_openapi, 'RETRY_BACKOFF', 0.0), \
+                patch.object(seoul_openapi.AsyncSeoulOpenAPIFetcher, '_fetch_once', fake_fetch_once):
+            pages, stats = seoul_openapi.fetch_windows('KEY', 'Service', 1, 2500)
+
+        self.assertEqual([page.start for page in pages], [1, 1001, 2001])
+        self.assertTrue(all(page.ok for page in pages))
+        self.assertEqual(pages[1].attempts, 2)
+        self.assertEqual((stats.retries, stats.failed), (1, 0))
+        print("    ✅ 순서 재조립 + 재시도 확인")
+
+    def test_seoul_openapi_fails_fast_on_non_retryable_errors(self):
+        print("\n[TEST] 서울시 OpenAPI 재시도 대상 구분 테스트 시작")
+        from stores.management.commands import seoul_openapi
+        from stores.management.commands.http_client import RequestFailedError
+
+        errors = {
+            1: RequestFailedError('url', 'HTTP 401', status=401, attempts=1),
+            1001: seoul_openapi.SeoulAPIResultError('ERROR-290', {'CODE': 'ERROR-290'}),
+            2001: RequestFailedError('url', 'HTTP 503', status=503, attempts=1),
+        }
+        calls = {}
+
+        async def fake_fetch_once(self, session, start, end):
+            calls[start] = calls.get(start, 0) + 1
+            raise errors[start]
+
+        with patch.object(seoul_openapi, 'RETRY_BACKOFF', 0.0), \
+                patch.object(seoul_openapi.AsyncSeoulOpenAPIFetcher, '_fetch_once', fake_fetch_once):
+            pages, stats = seoul_openapi.fetch_windows('KEY', 'Service', 1, 2500, max_retries=2)
+
+        # 잘못된 키(401 / ERROR-290)는 1회만, 일시 오류(503)는 재시도 소진까지
+        self.assertEqual(calls, {1: 1, 1001: 1, 2001: 3})
+        self.assertEqual((stats.retries, stats.failed), (2, 3))
+        self.assertFalse(any(page.ok for page in pages))
+        self.assertFalse(seoul_openapi.is_retryable_error(ValueError('Expecting value')))  # JSON 디코딩 오류
+        print("    ✅ 비재시도 오류 즉시 실패, 일시 오류만 재시도 확인")
+
+    def test_incremental_sync_watermark_and_deletes(self):
+        print("\n[TEST] 증분 동기화 워터마크 + 삭제 분리 테스트 시작")
+        from stores.management.commands.incremental_sync import get_watermark, split_changes
+
+        self.assertIsNone(get_watermark(TobaccoRetailLicense, gu='영등포구'))
+        TobaccoRetailLicense.objects.create(
+            mgtno='T-1', bplcnm='기존 담배', gu='영등포구',
+            lastmodts='2024-01-10 09:00:00', updatedt='2024-01-12 02:40:00.0'
+        )
+        watermark = get_watermark(TobaccoRetailLicense, gu='영등포구')
+        self.assertEqual(watermark, '20240112024000')
+
+        rows = [
+            {'MGTNO': 'T-1', 'LASTMODTS': '2024-01-10 09:00:00', 'UPDATEDT': '2024-01-11 02:40:00.0', 'TRDSTATEGBN': '01'},
+            {'MGTNO': 'T-2', 'LASTMODTS': '2024-02-01 10:00:00', 'UPDATEGBN': 'I', 'TRDSTATEGBN': '01'},
+            {'MGTNO': 'T-3', 'LASTMODTS': '2024-02-01 10:00:00', 'UPDATEGBN': 'U', 'TRDSTATEGBN': '03'},
+            {'MGTNO': 'T-4', 'LASTMODTS': '2024-02-02 10:00:00', 'UPDATEGBN': 'D', 'TRDSTATEGBN': '01'},
+        ]
+        upserts, deletes = split_changes(rows, watermark, keep=lambda row: row['TRDSTATEGBN'] == '01')
+
+        self.assertEqual([row['MGTNO'] for row in upserts], ['T-2'])
+        self.assertEqual(deletes, ['T-3', 'T-4'])
+        print("    ✅ 변경분만 upsert, 삭제/폐업 행 제거 대상 분리 확인")
+
+    def test_row_filter_drops_rows_while_decoding(self):
+        print("\n[TEST] 디코딩 단계 행 필터 + 수신 카운터 테스트 시작")
+        from stores.management.commands.seoul_openapi import AsyncSeoulOpenAPIFetcher, RowFilter
+
+        body = json.dumps({'Service': {'list_total_count': 3, 'row': [
+            {'MGTNO': 'R-1', 'UPTAENM': '편의점', 'BPLCNM': 'GS25'},
+            {'MGTNO': 'R-2', 'UPTAENM': '커피숍', 'BPLCNM': '카페'},
+            {'MGTNO': 'R-3', 'UPTAENM': '편의점', 'BPLCNM': 'CU'},
+        ]}}, ensure_ascii=False).encode('utf-8')
+
+        row_filter = RowFilter(('UPTAENM',), lambda row: row.get('UPTAENM') == '편의점')
+        fetcher = AsyncSeoulOpenAPIFetcher('KEY', 'Service', row_filter=row_filter)
+        data = fetcher._decode(body)
+        rows = [row for row in data['Service']['row'] if row is not None]
+
+        self.assertEqual([row['MGTNO'] for row in rows], ['R-1', 'R-3'])
+        self.assertEqual(rows[0]['BPLCNM'], 'GS25')
+        self.assertEqual((fetcher.stats.rows_seen, fetcher.stats.rows_kept), (3, 2))
+        print(f"    - 유지 비율: {fetcher.stats.keep_ratio}%")
+        print("    ✅ 불일치 행 제거 + 카운터 확인")
+
+    def test_batch_tm_conversion_returns_nan_for_bad_input(self):
+        print("\n[TEST] TM→WGS84 배치 변환 테스트 시작")
+        import math
+        from stores.management.commands.coords import convert_tm_to_wgs84_batch, transformer
+
+        lats, lngs = convert_tm_to_wgs84_batch(['191234.5 ', '', 'abc', None], ['446543.2', '1', '2', '3'])
+        expected_lng, expected_lat = transformer.transform(191234.5, 446543.2)
+
+        self.assertAlmostEqual(lats[0], expected_lat, places=9)
+        self.assertAlmostEqual(lngs[0], expected_lng, places=9)
+        self.assertTrue(all(math.isnan(value) for value in lats[1:]))
+        self.assertTrue(37.4 < lats[0] < 37.7)  # 영등포구 부근
+        print("    ✅ 1회 변환 결과 일치 + 변환 불가 입력 NaN 확인")
+
+
+# ========================================
+# 12. 허용 거리 기반 좌표 매칭 테스트
+# ========================================
+
+class SpatialMatchTests(TestCase):
+    """spatial_match.GridIndex 테스트"""
+
+    def test_grid_index_matches_across_rounding_boundary(self):
+        print("\n[TEST] 격자 해시 좌표 매칭 테스트 시작")
+        from stores.management.commands.spatial_match import GridIndex
+
+        # 반올림 경계 양쪽 (37.52155 → 37.5216 / 37.52154 → 37.5215), 약 1m 차이
+        index = GridIndex(tolerance_m=11)
+        index.add_many([(37.52154, 126.90250), (None, 126.9)])
+
+        self.assertEqual(index.size, 1)
+        self.assertNotEqual(round(37.52155, 4), round(37.52154, 4))
+        self.assertTrue(index.has_neighbor(37.52155, 126.90250))
+        # 약 8m 떨어진 점은 매칭, 약 30m 떨어진 점은 불일치
+        self.assertTrue(index.has_neighbor(37.52154, 126.90259))
+        self.assertFalse(index.has_neighbor(37.52181, 126.90250))
+        self.assertLess(index.nearest_distance(37.52155, 126.90250), 2)
+        print("    ✅ 허용 거리 이내 매칭 + 초과 불일치 확인")
+
+    def test_sql_engine_upserts_closure_results(self):
+        print("\n[TEST] 폐업 검증 SQL 엔진 테스트 시작")
+        from stores.management.commands.closure_sql import run_sql_closure
+
+        YeongdeungpoConvenience.objects.create(
+            place_id="sql_001", name="GS25 여의도점", address="서울 영등포구 여의대로 24",
+            location=Point(126.9250, 37.5215, srid=4326), gu='영등포구', base_daiso="다이소", distance=100
+        )
+        YeongdeungpoConvenience.objects.create(
+            place_id="sql_002", name="CU 당산점", address="서울 영등포구 당산로 100",
+            location=Point(126.9000, 37.5300, srid=4326), gu='영등포구', base_daiso="다이소", distance=200
+        )
+        TobaccoRetailLicense.objects.create(
+            mgtno="SQL-T-1", bplcnm="다른 상호", gu='영등포구',
+            rdnwhladdr="서울특별시 영등포구 여의대로 24 (여의도동)",
+            latitude=37.6, longitude=127.0
+        )
+        csv_keys = [('cu당산점', '', 37.4, 126.8)]
+
+        results = run_sql_closure('영등포구', csv_keys, tolerance_m=11, save=True)
+        by_id = {r['place_id']: r for r in results}
+
+        self.assertEqual(by_id['sql_001']['match_reason'], '주소')
+        self.assertEqual(by_id['sql_002']['match_reason'], '이름')
+        self.assertTrue(all(r['inserted'] for r in results))
+        self.assertEqual(StoreClosureResult.objects.filter(gu='영등포구', status='정상').count(), 2)
+        print("    ✅ 이름/주소 매칭 + INSERT ... ON CONFLICT 저장 확인")
+
+    def test_sql_engine_coordinate_match_uses_exact_distance(self):
+        print("\n[TEST] 폐업 검증 SQL 엔진 좌표 매칭 테스트 시작")
+        from stores.management.commands.closure_sql import build_statement, run_sql_closure
+
+        YeongdeungpoConvenience.objects.create(
+            place_id="sql_near", name="GS25 가", address="",
+            location=Point(126.9250, 37.5215, srid=4326), gu='영등포구', base_daiso="다이소", distance=100
+        )
+        YeongdeungpoConvenience.objects.create(
+            place_id="sql_far", name="CU 나", address="",
+            location=Point(126.9300, 37.5215, srid=4326), gu='영등포구', base_daiso="다이소", distance=200
+        )
+        # sql_near 북쪽 약 5m / sql_far 동쪽 약 20m (허용 11m 초과)
+        csv_keys = [('', '', 37.521545, 126.9250), ('', '', 37.5215, 126.930227)]
+
+        results = run_sql_closure('영등포구', csv_keys, tolerance_m=11, save=False)
+        by_id = {r['place_id']: r for r in results}
+        self.assertEqual(by_id['sql_near']['match_reason'], '좌표')
+        self.assertEqual(by_id['sql_far']['status'], '폐업')
+
+        rounded = run_sql_closure('영등포구', [('', '', 37.52154, 126.93001)], tolerance_m=0, save=False)
+        self.assertEqual({r['place_id']: r['match_reason'] for r in rounded}, {'sql_near': '없음', 'sql_far': '좌표'})
+
+        # 편의점 location 인덱스를 쓸 수 있는 상자 조건이 정확한 거리 조건보다 먼저 온다
+        statement = build_statement(11, save=False)
+        self.assertIn('k.location && ST_Expand', statement)
+        self.assertLess(statement.index('k.location && ST_Expand'), statement.index('ST_DWithin'))
+        print("    ✅ 상자 사전 필터 + geography 거리 / 반올림 일치 확인")
+
+    def test_sql_engine_runs_twice_in_one_transaction(self):
+        print("\n[TEST] 폐업 검증 SQL 엔진 같은 트랜잭션 내 재실행 테스트 시작")
+        from django.db import transaction
+        from stores.management.commands.closure_sql import run_sql_closure
+
+        YeongdeungpoConvenience.objects.create(
+            place_id="sql_twice", name="GS25 재실행점", address="",
+            location=Point(126.9250, 37.5215, srid=4326), gu='영등포구', base_daiso="다이소", distance=100
+        )
+
+        with transaction.atomic():
+            first = run_sql_closure('영등포구', [('gs25재실행점', '', None, None)], tolerance_m=11, save=False)
+            # 임시 테이블이 남아 있어도 오류 없이 비우고 다시 적재 (이전 키가 섞이지 않음)
+            second = run_sql_closure('영등포구', [], tolerance_m=11, save=False)
+
+        self.assertEqual([r['status'] for r in first], ['정상'])
+        self.assertEqual([r['status'] for r in second], ['폐업'])
+        print("    ✅ closure_csv_keys 재사용 + TRUNCATE 확인")
+
+
+# ========================================
+# 13. public_data.csv 캐시 테스트
+# ========================================
+
+class PublicDataCacheTests(TestCase):
+    """public_data_cache (Parquet 캐시) 테스트"""
+
+    def test_cache_is_reused_and_invalidated_by_mtime(self):
+        print("\n[TEST] public_data Parquet 캐시 재사용/무효화 테스트 시작")
+        import os
+        import tempfile
+        import pandas as pd
+        from stores.management.commands import public_data_cache
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'public_data.csv')
+            columns = {f'Column{i}': [''] for i in range(1, 40)}
+            columns.update({
+                'Column1': ['1'], 'Column2': ['GS25 당산 점'], 'Column25': ['서울특별시 영등포구 당산동5가 1'],
+                'Column32': ['서울특별시 영등포구 당산로 100'], 'Column38': ['126.90001'], 'Column39': ['37.52155'],
+            })
+            pd.DataFrame(columns).to_csv(csv_path, index=False, encoding='cp949')
+
+            with patch.object(public_data_cache, 'CACHE_DIR', tmp_dir), \
+                    patch.object(public_data_cache, 'build_frame', wraps=public_data_cache.build_frame) as build:
+                df = public_data_cache.load_public_data('영등포구', 4, csv_path=csv_path)
+                public_data_cache.load_public_data('영등포구', 4, csv_path=csv_path)
+                self.assertEqual(build.call_count, 1)
+
+                os.utime(csv_path, (time.time() + 10, time.time() + 10))
+                public_data_cache.load_public_data('영등포구', 4, csv_path=csv_path)
+                self.assertEqual(build.call_count, 2)
+
+        row = public_data_cache.to_records(df)[0]
+        self.assertEqual(row['name_norm'], 'gs25당산점')
+        self.assertEqual(row['address_norm'], '서울 영등포구 당산로 100')
+        self.assertEqual(row['dong'], '당산동5가')
+        self.assertEqual((row['lat_round'], row['lng_round']), (round(37.52155, 4), 126.9))
+        print("    ✅ 캐시 재사용 + mtime 변경 시 재생성 확인")
+
+    def test_vectorized_normalization_parity_and_speed(self):
+        """벡터 정규화 = 스칼라 정규화 (전체 public_data.csv), iterrows 대비 속도 비교"""
+        print("\n[TEST] 벡터 정규화 패리티 + 벤치마크 시작")
+        import pandas as pd
+        from stores.management.commands import normalize
+        from stores.management.commands.public_data_cache import build_frame, find_csv_path
+
+        csv_df = pd.read_csv(find_csv_path(), encoding='cp949')
+        addresses = pd.concat([csv_df['Column32'], csv_df['Column25']], ignore_index=True)
+
+        self.assertEqual(
+            [normalize.normalize_name(value) for value in csv_df['Column2']],
+            normalize.normalize_name_series(csv_df['Column2']).tolist()
+        )
+        self.assertEqual(
+            [normalize.extract_road_address(value, '영등포구') for value in addresses],
+            normalize.extract_road_address_series(addresses, '영등포구').tolist()
+        )
+        self.assertEqual(
+            [normalize.extract_dong_from_address(value) for value in csv_df['Column25']],
+            normalize.extract_dong_series(csv_df['Column25']).tolist()
+        )
+
+        def scalar_pass():
+            # 기존 방식: iterrows + 행 단위 정규화 (위 패리티 검사로 채워진 LRU 캐시를 비워 콜드 상태로 측정)
+            normalize._extract_road_address_cached.cache_clear()
+            start = time.time()
+            for _, row in csv_df.iterrows():
+                address = row['Column32'] if pd.notna(row['Column32']) else row['Column25']
+                normalize.normalize_name(row['Column2'])
+                normalize.extract_road_address(address, '영등포구')
+            return time.time() - start
+
+        def vector_pass():
+            start = time.time()
+            build_frame(csv_df, '영등포구')
+            return time.time() - start
+
+        # 504행 규모라 1회 측정은 편차가 커서 3회 중 최솟값으로 비교
+        iterrows_time = min(scalar_pass() for _ in range(3))
+        vector_time = min(vector_pass() for _ in range(3))
+
+        print(f"    ✅ [성능결과] {len(csv_df)}행 정규화: iterrows {iterrows_time:.4f}초 → 컬럼 단위 {vector_time:.4f}초")
+        # 배수 대신 단순 비교만 검증 (타이밍 편차 여유)
+        self.assertLess(vector_time, iterrows_time)
+
+    def test_coord_rounding_series_matches_round_coord(self):
+        print("\n[TEST] 좌표 반올림 벡터 패리티 테스트 시작")
+        import math
+        from stores.management.commands import normalize
+
+        # 반값(...5) 경계: np.round 단독이면 37.00005 → 37.0 (round() 는 37.0001)
+        values = [
+            37.00005, 37.00015, 37.52155, 126.90255, 126.99995, 37.5215, 126.9,
+            37.521549999, 37.521550001, -0.00005, 0.0, float('nan'), None, 'abc', '37.52155',
+        ]
+        for decimals in (3, 4, 5):
+            expected = [normalize.round_coord(value, decimals) for value in values]
+            actual = normalize.round_coord_series(values, decimals).tolist()
+            for value, want, got in zip(values, expected, actual):
+                if want is None or math.isnan(want):
+                    self.assertTrue(math.isnan(got), value)
+                else:
+                    self.assertEqual(got, want, (value, decimals))
+        print("    ✅ 반값 경계 / NaN / 변환 불가 값 round_coord 와 일치 확인")
+
+    def test_address_normalization_is_memoized(self):
+        print("\n[TEST] 주소 정규화 LRU 캐시 테스트 시작")
+        from stores.management.commands import normalize
+
+        normalize._extract_road_address_cached.cache_clear()
+        address = "서울특별시 영등포구 여의대로 24 (여의도동)"
+        first = normalize.extract_road_address(address, '영등포구')
+        second = normalize.extract_road_address(address, '영등포구')
+        other_gu = normalize.extract_road_address(address, '마포구')
+
+        info = normalize.address_cache_info()
+        self.assertEqual(first, second)
+        self.assertEqual(first, '서울 영등포구 여의대로 24')
+        self.assertEqual(other_gu, '서울 여의대로 24')  # (address, target_gu) 별 캐시
+        self.assertEqual((info.hits, info.misses), (1, 2))
+        print("    ✅ 같은 (주소, 구) 는 1회만 정규화 확인")
+
+    def test_ingest_writes_gu_partitions_read_by_closure(self):
+        print("\n[TEST] 전국 CSV 구 파티션 적재 테스트 시작")
+        import os
+        import tempfile
+        from io import StringIO
+        import pandas as pd
+        from django.core.management import call_command
+        from stores.management.commands import public_data_cache
+
+        def row(store_id, sido, gu, lat):
+            columns = {f'Column{i}': '' for i in range(1, 40)}
+            columns.update({
+                'Column1': store_id, 'Column2': 'GS25 테스트', 'Column9': '편의점', 'Column13': sido, 'Column15': gu,
+                'Column32': f'{sido} {gu} 테스트로 1', 'Column38': '126.97', 'Column39': lat,
+            })
+            return columns
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, 'nationwide.csv')
+            pd.DataFrame([
+                row('1', '서울특별시', '중구', '37.5641'),
+                row('2', '서울특별시', '중구', '37.5601'),
+                row('3', '부산광역시', '중구', '35.1032'),   # 다른 시도의 같은 구 이름
+                row('4', '서울특별시', '영등포구', '37.5260'),
+            ]).to_csv(source, index=False, encoding='cp949')
+            output = os.path.join(tmp_dir, 'dataset')
+
+            call_command('ingest_public_data', source=source, output=output, chunksize=2, stdout=StringIO())
+
+            self.assertEqual(sorted(os.listdir(output)), ['gu=영등포구', 'gu=중구'])
+            with patch.object(public_data_cache, 'DATASET_DIR', output):
+                df = public_data_cache.load_public_data('중구', 4)
+
+        self.assertEqual(df['id'].tolist(), ['2', '1'])  # 공간 셀 순 정렬
+        self.assertEqual(df['address_norm'].iloc[0], '서울 중구 테스트로 1')
+        self.assertTrue((df['cell'] >= 0).all())
+        print("    ✅ 서울 구별 파티션 생성 + 해당 구 파티션만 로드 확인")
+
+
+# ========================================
+# 14. 카카오 수집 최적화 테스트
+# ========================================
+
+class KakaoCollectionTests(TestCase):
+    """카카오 수집 (응답 캐시 / 적응형 rect 분할) 테스트"""
+
+    def test_cache_modes_and_ttl(self):
+        print("\n[TEST] 카카오 응답 캐시 모드 / TTL 테스트 시작")
+        import os
+        import tempfile
+        from stores.management.commands.kakao_cache import KakaoResponseCache
+
+        url = "https://dapi.kakao.com/v2/local/search/category.json"
+        params = {"category_group_code": "CS2", "rect": "126.9,37.5,126.91,37.51", "x": "126.9", "y": "37.5", "page": 1}
+        body = {"documents": [{"id": "1", "place_name": "GS25 테스트"}], "meta": {"is_end": True}}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'kakao.sqlite3')
+
+            off = KakaoResponseCache(mode='off', path=path)
+            off.put(url, params, body)
+            self.assertIsNone(off.get(url, params))
+            self.assertFalse(os.path.exists(path))  # off 모드는 파일을 만들지 않음
+
+            writer = KakaoResponseCache(mode='write', path=path)
+            self.assertIsNone(writer.get(url, params))
+            writer.put(url, params, body)
+            self.assertEqual(writer.get(url, dict(reversed(list(params.items())))), body)  # 파라미터 순서 무관
+            writer.close()
+
+            reader = KakaoResponseCache(mode='read', path=path)
+            reader.put(url, {**params, "page": 2}, body)   # read 모드는 저장 안 함
+            self.assertIsNone(reader.get(url, {**params, "page": 2}))
+            self.assertEqual(reader.get(url, params), body)
+            reader.close()
+
+            refresh = KakaoResponseCache(mode='refresh', path=path)
+            self.assertIsNone(refresh.get(url, params))    # refresh 모드는 읽지 않음
+            refresh.close()
+
+            expired = KakaoResponseCache(mode='read', ttl_hours=0, path=path)
+            time.sleep(0.01)
+            self.assertIsNone(expired.get(url, params))
+            self.assertEqual(expired.get_stats()['misses'], 1)
+            expired.close()
+
+        print("    ✅ off/read/write/refresh 모드 + TTL 만료 확인")
+
+    def test_cache_batches_commits_and_runs_io_off_loop(self):
+        print("\n[TEST] 카카오 응답 캐시 커밋 묶음 / 비동기 I/O 오프로딩 테스트 시작")
+        import asyncio
+        import os
+        import sqlite3
+        import tempfile
+        import threading
+        from stores.management.commands.kakao_cache import KakaoResponseCache
+
+        url = "https://dapi.kakao.com/v2/local/search/category.json"
+        body = {"documents": [], "meta": {"is_end": True}}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'kakao.sqlite3')
+            cache = KakaoResponseCache(mode='write', path=path, commit_every=2)
+
+            def committed():
+                # 다른 연결에서는 커밋된 행만 보임
+                conn = sqlite3.connect(path)
+                try:
+                    return conn.execute('SELECT COUNT(*) FROM kakao_response').fetchone()[0]
+                finally:
+                    conn.close()
+
+            cache.put(url, {"page": 1}, body)
+            self.assertEqual(committed(), 0)
+            self.assertEqual(cache.get(url, {"page": 1}), body)  # 같은 연결은 커밋 전에도 읽음
+            cache.put(url, {"page": 2}, body)
+            self.assertEqual(committed(), 2)
+            cache.put(url, {"page": 3}, body)
+            self.assertEqual(committed(), 2)
+            cache.close()
+            self.assertEqual(committed(), 3)
+
+            cache = KakaoResponseCache(mode='write', path=path)
+            io_threads = []
+            sync_get, sync_put = cache.get, cache.put
+
+            def get(*args):
+                io_threads.append(threading.get_ident())
+                return sync_get(*args)
+
+            def put(*args):
+                io_threads.append(threading.get_ident())
+                return sync_put(*args)
+
+            async def main():
+                loop_thread = threading.get_ident()
+                with patch.object(cache, 'get', side_effect=get), patch.object(cache, 'put', side_effect=put):
+                    hit = await cache.get_async(url, {"page": 1})
+                    await cache.put_async(url, {"page": 4}, body)
+                return loop_thread, hit
+
+            loop_thread, hit = asyncio.run(main())
+            cache.close()
+
+            self.assertEqual(hit, body)
+            self.assertEqual(len(io_threads), 2)
+            self.assertNotIn(loop_thread, io_threads)   # SQLite I/O 는 이벤트 루프 스레드 밖에서
+            self.assertEqual(committed(), 4)
+
+            off = KakaoResponseCache(mode='off', path=os.path.join(tmp_dir, 'off.sqlite3'))
+            self.assertIsNone(asyncio.run(off.get_async(url, {"page": 1})))
+
+        print("    ✅ commit_every 묶음 커밋 + close 시 잔여분 커밋 + get/put_async 스레드 풀 실행 확인")
+
+    def test_adaptive_collector_splits_truncated_rects(self):
+        print("\n[TEST] 적응형 rect 4분할 수집 테스트 시작")
+        import asyncio
+        from stores.management.commands.async_collector import AsyncKakaoCollector, parse_rect
+
+        # 좌상단 좁은 영역에 100개 밀집 + 나머지 영역에 5개
+        dense = [(126.9001 + (i % 10) * 0.0001, 37.5101 + (i // 10) * 0.0001) for i in range(100)]
+        sparse = [(126.905 + i * 0.001, 37.503) for i in range(5)]
+        places = [{"id": str(i), "x": x, "y": y} for i, (x, y) in enumerate(dense + sparse)]
+
+        async def fake_fetch(session, rect, cx, cy, page=1):
+            x1, y1, x2, y2 = parse_rect(rect)
+            inside = [p for p in places if x1 <= p["x"] < x2 and y1 <= p["y"] < y2]
+            pageable = inside[:45]
+            return {"documents": pageable[(page - 1) * 15:page * 15],
+                    "meta": {"total_count": len(inside), "is_end": page * 15 >= len(pageable)}}
+
+        collector = AsyncKakaoCollector("test-key", adaptive=True, min_cell_m=5)
+        with patch.object(collector, "_fetch_page", side_effect=fake_fetch):
+            documents = asyncio.run(collector._collect_adaptive(None, "126.9,37.5,126.91,37.52", 126.9, 37.5))
+
+        self.assertEqual({doc["id"] for doc in documents}, {p["id"] for p in places})
+        self.assertGreater(collector.stats.split_count, 0)
+        self.assertEqual(collector.stats.truncated_cells, 0)
+
+        sparse_collector = AsyncKakaoCollector("test-key", adaptive=True)
+        with patch.object(sparse_collector, "_fetch_page", side_effect=fake_fetch) as fetch:
+            asyncio.run(sparse_collector._collect_adaptive(None, "126.904,37.502,126.91,37.504", 126.9, 37.5))
+        self.assertEqual((sparse_collector.stats.split_count, fetch.call_count), (0, 1))
+        print(f"    ✅ 밀집 rect 분할 후 {len(places)}개 전부 수집, 희소 rect 는 1회 호출")
+
+    def test_gu_grid_tiles_cover_boundary_without_overlap(self):
+        print("\n[TEST] 구 경계 격자 타일링 테스트 시작")
+        from django.contrib.gis.geos import Point, Polygon
+        from stores.management.commands.async_collector import parse_rect
+        from stores.management.commands.gu_boundaries import boundary_polygon, get_boundary, tile_gu
+
+        rects = tile_gu('영등포구', tile_km=1.0)
+        tiles = [Polygon.from_bbox(parse_rect(rect)) for rect in rects]
+        polygon = boundary_polygon('영등포구')
+
+        self.assertTrue(all(tile.intersects(polygon) for tile in tiles))
+        for i, tile in enumerate(tiles):
+            for other in tiles[i + 1:]:
+                self.assertAlmostEqual(tile.intersection(other).area, 0.0, places=12)
+        for lng, lat in get_boundary('영등포구'):
+            self.assertTrue(any(tile.intersects(Point(lng, lat)) for tile in tiles))
+        with self.assertRaises(ValueError):
+            tile_gu('없는구')
+        print(f"    ✅ 영등포구 {len(rects)}개 타일, 겹침 없이 경계 전체 포함")
+
+    def test_daiso_call_estimate_uses_store_density(self):
+        print("\n[TEST] 다이소 4분면 방식 예상 호출 수 테스트 시작")
+        from stores.management.commands.query_planner import estimate_daiso_calls
+
+        # 반경 1km: 사분면 0.0113 x 0.0090, 1사분면(우상)에만 50개 + 3사분면(좌하) 1개
+        daiso = [(126.90, 37.50)]
+        stores = [(126.901 + i * 0.0001, 37.501) for i in range(50)] + [(126.895, 37.495)]
+
+        # 우상 3페이지(50건 → 45건 상한) + 나머지 사분면 1페이지씩, 상한 4 x 3 = 12 보다 작음
+        self.assertEqual(estimate_daiso_calls(daiso, stores, radius_km=1.0), 6)
+        self.assertEqual(estimate_daiso_calls(daiso, [], radius_km=1.0), 4)
+        self.assertEqual(estimate_daiso_calls([], stores, radius_km=1.0), 0)
+        print("    ✅ 매장 밀도 기준 사분면별 페이지 수 추정 확인")
+
+    def test_set_cover_plan_covers_gu_with_fewer_calls(self):
+        print("\n[TEST] set-cover 검색 계획 테스트 시작")
+        import os
+        import random
+        import tempfile
+        from stores.management.commands.async_collector import parse_rect
+        from stores.management.commands.gu_boundaries import grid_spec, tile_cells
+        from stores.management.commands.query_planner import load_plan, plan_queries, save_plan
+
+        # 여의도 부근 밀집 + 구 전체 희소 매장
+        rng = random.Random(0)
+        points = [(rng.uniform(126.915, 126.935), rng.uniform(37.515, 37.530)) for _ in range(300)]
+        points += [(rng.uniform(126.88, 126.94), rng.uniform(37.48, 37.55)) for _ in range(100)]
+        plan = plan_queries('영등포구', points=points)
+
+        # 모든 칸(중심점)이 계획된 rect 중 하나에 포함
+        min_x, min_y, step_x, step_y, _, _ = grid_spec('영등포구', plan.element_km)
+        rects = [parse_rect(item.rect) for item in plan.rects]
+        for row, col in tile_cells('영등포구', plan.element_km):
+            x, y = min_x + (col + 0.5) * step_x, min_y + (row + 0.5) * step_y
+            self.assertTrue(any(x1 <= x <= x2 and y1 <= y <= y2 for x1, y1, x2, y2 in rects))
+
+        self.assertLess(plan.estimated_calls, plan.baseline_calls)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = save_plan(plan, os.path.join(tmp_dir, 'plan.json'))
+            loaded = load_plan(path)
+        self.assertEqual(loaded['gu'], '영등포구')
+        self.assertEqual([item['rect'] for item in loaded['rects']], [item.rect for item in plan.rects])
+        print(f"    ✅ rect {len(plan.rects)}개, 예상 {plan.estimated_calls}회 (고정 격자 {plan.baseline_calls}회)")
+
+    def test_token_bucket_rate_and_429_backoff(self):
+        print("\n[TEST] 토큰 버킷 / 429 백오프 테스트 시작")
+        import asyncio
+        from unittest.mock import MagicMock
+        from stores.management.commands.async_collector import AsyncKakaoCollector, AsyncRateLimiter
+        from stores.management.commands.rate_limit import TokenBucket, backoff_delay, parse_retry_after
+
+        # 버스트 소진 후에는 1/rate 간격으로 대기
+        bucket = TokenBucket(rate=10, burst=2)
+        waits = [bucket._reserve() for _ in range(4)]
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertAlmostEqual(waits[2], 0.1, places=2)
+        self.assertAlmostEqual(waits[3], 0.2, places=2)
+        bucket.penalize(5.0)
+        self.assertGreaterEqual(bucket._reserve(), 4.9)
+
+        self.assertEqual(parse_retry_after('3'), 3.0)
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertTrue(3.0 <= backoff_delay(0, retry_after=3.0) <= 3.5)
+        self.assertTrue(all(2.0 <= backoff_delay(2) <= 4.0 for _ in range(20)))
+
+        # 429 → Retry-After 만큼 대기 후 재시도하여 성공
+        responses = [(429, {"Retry-After": "0"}, None), (200, {}, {"documents": [{"id": "1"}], "meta": {"is_end": True}})]
+
+        def fake_request(*args, **kwargs):
+            status, headers, body = responses.pop(0)
+            response = MagicMock(status=status, headers=headers)
+            response.read = MagicMock(side_effect=lambda: asyncio.sleep(0, result=json.dumps(body).encode()))
+            context = MagicMock()
+            context.__aenter__ = MagicMock(side_effect=lambda: asyncio.sleep(0, result=response))
+            context.__aexit__ = MagicMock(side_effect=lambda *a: asyncio.sleep(0, result=False))
+            return context
+
+        collector = AsyncKakaoCollector("test-key")
+        collector.rate_limiter = AsyncRateLimiter(bucket=TokenBucket(rate=100, burst=10))
+        session = MagicMock(request=fake_request)
+        with patch("stores.management.commands.http_client.backoff_delay", return_value=0.0):
+            data = asyncio.run(collector._fetch_page(session, "126.9,37.5,126.91,37.51", 126.9, 37.5))
+
+        self.assertEqual(data["documents"], [{"id": "1"}])
+        self.assertEqual((collector.stats.api_calls, collector.stats.retries, collector.stats.throttled), (2, 1, 1))
+        self.assertEqual(collector.rate_limiter.bucket.throttled, 1)
+        print("    ✅ 버스트 후 1/rate 간격, 429 는 버킷 정지 후 재시도 성공")
+
+    def test_http_client_retries_then_opens_circuit(self):
+        print("\n[TEST] HTTP 재시도 + 서킷 브레이커 테스트 시작")
+        import requests
+        from unittest.mock import MagicMock
+        from stores.management.commands import http_client
+
+        http_client.reset_http_stats()
+        url = "https://flaky.example.com/api"
+        ok = MagicMock(status_code=200, headers={})
+        busy = MagicMock(status_code=503, headers={})
+        session = MagicMock()
+        session.request.side_effect = [requests.ConnectionError("reset"), busy, ok]
+
+        with patch.object(http_client, "backoff_delay", return_value=0.0):
+            self.assertIs(http_client.request("GET", url, session=session), ok)
+
+            # 일시 오류는 재시도로 흡수, 연속 실패는 예외 → 임계치 도달 후 호출 없이 차단
+            session.request.side_effect = requests.Timeout("slow")
+            with self.assertRaises(http_client.RequestFailedError):
+                http_client.request("GET", url, session=session, max_retries=2)
+            with self.assertRaises(http_client.RequestFailedError):
+                http_client.request("GET", url, session=session, max_retries=2)
+            calls = session.request.call_count
+            with self.assertRaises(http_client.CircuitOpenError):
+                http_client.request("GET", url, session=session)
+            self.assertEqual(session.request.call_count, calls)
+
+        stats = http_client.http_stats()["flaky.example.com"]
+        self.assertEqual(stats["state"], "open")
+        self.assertEqual((stats["retries"], stats["failures"], stats["short_circuits"]), (5, 7, 1))
+        http_client.reset_http_stats()
+        print("    ✅ 일시 오류 재시도 성공, 연속 실패 시 서킷 차단 + 카운터 확인")
+
+    def test_collect_all_keeps_daiso_window_in_flight(self):
+        print("\n[TEST] 다이소 슬라이딩 윈도우 수집 테스트 시작")
+        import asyncio
+        from types import SimpleNamespace
+        from stores.management.commands.async_collector import AsyncKakaoCollector
+
+        # 모든 다이소가 같은 편의점 1개 + 자기 편의점 1개를 반환, 짝수 번째 다이소가 더 느림
+        daiso_list = [SimpleNamespace(name=f"다이소{i}", location=SimpleNamespace(x=126.9 + i * 0.01, y=37.5)) for i in range(6)]
+        active, peak = 0, 0
+
+        async def fake_collect_quadrant(session, rect, cx, cy):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            index = round((cx - 126.9) / 0.01)
+            await asyncio.sleep(0.04 if index % 2 == 0 else 0.01)
+            active -= 1
+            return [{"id": "shared", "address_name": "서울 영등포구"},
+                    {"id": f"own-{index}", "address_name": "서울 영등포구"}]
+
+        completed = []
+        collector = AsyncKakaoCollector("test-key")
+        with patch.object(collector, "_collect_quadrant", side_effect=fake_collect_quadrant):
+            stores = asyncio.run(collector.collect_all(
+                daiso_list, "영등포구", progress_callback=lambda done, total, name, count: completed.append((done, name)),
+                max_in_flight=3,
+            ))
+
+        self.assertEqual(sorted(store["id"] for store in stores), ["own-0", "own-1", "own-2", "own-3", "own-4", "own-5", "shared"])
+        self.assertEqual(peak, 3 * 4)  # 다이소 3개 x 4분면 동시 진행
+        self.assertEqual([done for done, _ in completed], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(completed[0][1], "다이소1")  # 느린 다이소0 보다 먼저 완료
+        print(f"    ✅ 최대 {peak}개 사분면 동시 진행, 완료 순서 콜백 + 다이소 간 중복 제거")
+
+    def test_speculative_prefetch_cancels_unneeded_pages(self):
+        print("\n[TEST] 사분면 페이지 선행 요청 테스트 시작")
+        import asyncio
+        from stores.management.commands.async_collector import AsyncKakaoCollector
+
+        counts = {"full": 40, "small": 5}
+
+        async def fake_fetch(session, rect, cx, cy, page=1):
+            count = counts[rect]
+            await asyncio.sleep(0.05 if page == 1 else 0.2)  # 불필요 페이지는 1페이지 이후에도 진행 중
+            documents = [{"id": f"{rect}-{i}"} for i in range(count)][(page - 1) * 15:page * 15]
+            return {"documents": documents,
+                    "meta": {"pageable_count": count, "total_count": count, "is_end": page * 15 >= count}}
+
+        collector = AsyncKakaoCollector("test-key", speculative=True)
+        with patch.object(collector, "_fetch_page", side_effect=fake_fetch) as fetch:
+            full = asyncio.run(collector._collect_quadrant_speculative(None, "full", 126.9, 37.5))
+            small = asyncio.run(collector._collect_quadrant_speculative(None, "small", 126.9, 37.5))
+
+        self.assertEqual(len(full), 40)
+        self.assertEqual(len(small), 5)
+        self.assertEqual(fetch.call_count, 6)  # 두 사분면 모두 1~3페이지 동시 시작
+        self.assertEqual((collector.stats.prefetch_cancelled, collector.stats.prefetch_extra_calls), (2, 0))
+        self.assertGreater(collector.stats.prefetch_saved_seconds, 0.1)  # full: 0.45초 순차 → 약 0.2초
+        self.assertEqual(AsyncKakaoCollector._needed_pages({"documents": [{}], "meta": {"is_end": False}}), 3)
+        print(f"    ✅ 불필요 페이지 취소, 절약 {collector.stats.prefetch_saved_seconds:.2f}초")
+
+    def test_stream_collection_overlaps_fetch_and_writes(self):
+        print("\n[TEST] 수집 ↔ DB 저장 스트리밍 테스트 시작")
+        import asyncio
+        from types import SimpleNamespace
+        from stores.management.commands.async_collector import AsyncKakaoCollector, stream_collection
+
+        daiso_list = [SimpleNamespace(name=f"다이소{i}", daiso_id=i) for i in range(6)]
+
+        async def fake_collect_daiso(session, daiso, target_gu, seen_ids):
+            await asyncio.sleep(0.03 * (daiso.daiso_id + 1))
+            return [{"id": f"store-{daiso.daiso_id}-{j}"} for j in range(3)], daiso.daiso_id == 4
+
+        written, checkpoints = [], []
+
+        def write_batch(stores):
+            time.sleep(0.02)  # DB 저장 대기 (다음 다이소 수집과 겹쳐야 함)
+            written.extend(store["id"] for store in stores)
+            return len(stores)
+
+        collector = AsyncKakaoCollector("test-key")
+        with patch.object(collector, "_collect_daiso", side_effect=fake_collect_daiso), \
+                patch("stores.management.commands.async_collector.connections"):
+            stream = asyncio.run(stream_collection(
+                collector, daiso_list, "영등포구", write_batch,
+                on_written=lambda done, daiso: checkpoints.append((done, daiso.daiso_id)),
+                batch_size=3, max_in_flight=2,
+            ))
+
+        self.assertEqual(len(written), 18)
+        self.assertEqual((stream.rows_written, stream.batches), (18, 6))
+        self.assertGreater(stream.overlap_seconds, 0)
+        self.assertLess(stream.total_seconds, stream.fetch_seconds + stream.write_seconds)
+        self.assertEqual(checkpoints[-1], (4, 3))  # 실패한 다이소4 앞에서 체크포인트 정지
+        self.assertEqual([done for done, _ in checkpoints], sorted(done for done, _ in checkpoints))
+        print(f"    ✅ 수집/저장 겹침 {stream.overlap_seconds:.2f}초, 체크포인트 {checkpoints}")
+
+    def test_http_pool_reuses_connections_across_calls(self):
+        print("\n[TEST] 공용 HTTP 연결 풀 재사용 테스트 시작")
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from stores.management.commands import http_pool
+        from stores.management.commands.http_client import request, request_async
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                body = b'{"ok": true}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/"
+        self.addCleanup(server.shutdown)
+        self.addCleanup(http_pool.close_pools)
+        http_pool.close_pools()
+
+        for _ in range(4):
+            self.assertEqual(request("GET", url, timeout=5).status_code, 200)
+
+        async def fetch_twice():
+            async with http_pool.pooled_session() as session:
+                await request_async(session, "GET", url)
+                await request_async(session, "GET", url)
+                return session
+
+        first = http_pool.run_async(fetch_twice())
+        second = http_pool.run_async(fetch_twice())  # 호출마다 새 세션/루프를 만들지 않음
+
+        stats = http_pool.pool_stats()
+        self.assertIs(first, second)
+        self.assertEqual((stats["default"]["hits"], stats["default"]["misses"]), (3, 1))
+        self.assertEqual((stats["aiohttp"]["hits"], stats["aiohttp"]["misses"], stats["aiohttp"]["sessions"]), (3, 1, 1))
+        print(f"    ✅ requests {stats['default']}, aiohttp {stats['aiohttp']}")
+
+    def test_gu_index_benchmark_rolls_back_and_finds_gist(self):
+        print("\n[TEST] 구 단위 인덱스 벤치마크 테스트 시작")
+        from io import StringIO
+        from django.core.management import call_command
+        from stores.management.commands.benchmark_gu_indexes import parse_plan
+
+        out = StringIO()
+        call_command('benchmark_gu_indexes', rows_per_gu=40, repeat=1, stdout=out)
+        output = out.getvalue()
+
+        self.assertIn('closure_gu_status_idx', output)
+        self.assertIn('license_gu_uptaenm_idx', output)
+        self.assertIn('GiST 인덱스: 7/7', output)
+        self.assertFalse(YeongdeungpoConvenience.objects.filter(place_id__startswith='bench-').exists())  # 롤백
+        self.assertEqual(
+            parse_plan("Bitmap Heap Scan on store_closure_result\n  ->  Bitmap Index Scan on closure_gu_status_idx\nExecution Time: 0.125 ms"),
+            ('Bitmap Heap Scan', 0.125),
+        )
+        print(f"    ✅ 합성 데이터 롤백 + GiST 확인\n{output}")
+
+    def test_async_command_runs_one_window_over_all_daiso(self):
+        print("\n[TEST] 비동기 수집 명령 단일 슬라이딩 윈도우 테스트 시작")
+        import asyncio
+        from io import StringIO
+        from django.core.management import call_command
+        from stores.management.commands import v2_3_2_collect_Convenience_Only as command_module
+        from stores.management.commands.async_collector import AsyncKakaoCollector
+
+        for i in range(12):
+            YeongdeungpoDaiso.objects.create(
+                name=f"다이소{i}", address="서울 영등포구", daiso_id=f"D{i}", gu="영등포구",
+                location=Point(126.9 + i * 0.001, 37.5, srid=4326),
+            )
+
+        async def fake_collect_daiso(session, daiso, target_gu, seen_ids):
+            index = int(daiso.daiso_id[1:])
+            await asyncio.sleep(0.02 if index % 3 == 0 else 0.005)  # 완료 순서가 순번과 다름
+            return [{
+                "id": f"store-{index}", "place_name": f"편의점{index}", "address_name": "서울 영등포구",
+                "x": "126.9", "y": "37.5", "distance": "10", "phone": "", "_base_daiso": daiso.name,
+            }], False
+
+        real_collect_all = AsyncKakaoCollector.collect_all
+        windows = []
+
+        async def spy_collect_all(collector, daiso_list, *args, **kwargs):
+            windows.append(len(daiso_list))
+            return await real_collect_all(collector, daiso_list, *args, **kwargs)
+
+        upserted, cursors = [], []
+        with patch.object(AsyncKakaoCollector, "_collect_daiso", side_effect=fake_collect_daiso, autospec=True), \
+                patch.object(AsyncKakaoCollector, "collect_all", spy_collect_all), \
+                patch.object(command_module, "bulk_upsert", side_effect=lambda model, rows, **kw: upserted.extend(rows)), \
+                patch.object(command_module, "save_cursor", side_effect=lambda gu, stage, **cursor: cursors.append(cursor)):
+            call_command("v2_3_2_collect_Convenience_Only", api_key="test-key", use_async=True, stdout=StringIO())
+
+        self.assertEqual(windows, [12])  # 5개 단위로 나누지 않고 한 번에 수집
+        self.assertEqual(sorted(row["place_id"] for row in upserted), sorted(f"store-{i}" for i in range(12)))
+        self.assertEqual(cursors[-1], {"next_index": 12, "last_daiso_id": "D11"})
+        self.assertEqual([c["next_index"] for c in cursors], sorted(c["next_index"] for c in cursors))
+        print(f"    ✅ 단일 윈도우 수집, 체크포인트 {[c['next_index'] for c in cursors]}")
+
+    def test_cancelled_half_open_probe_releases_circuit(self):
+        print("\n[TEST] 취소된 half-open 시험 호출 반납 테스트 시작")
+        import asyncio
+        import time as time_module
+        from stores.management.commands import http_client
+
+        http_client.reset_http_stats()
+        url = "https://probe.example.com/api"
+        breaker = http_client.get_breaker(url)
+        for _ in range(breaker.threshold):
+            breaker.record_failure("HTTP 503")
+        breaker._opened_at = time_module.monotonic() - breaker.reset_timeout  # 차단 시간 경과
+        self.assertEqual(breaker.state, "half_open")
+
+        class HangingSession:
+            def request(self, method, url, **kwargs):
+                class Response:
+                    async def __aenter__(self):
+                        await asyncio.sleep(10)
+
+                    async def __aexit__(self, *exc):
+                        return False
+                return Response()
+
+        async def cancel_probe():
+            task = asyncio.ensure_future(http_client.request_async(HangingSession(), "GET", url))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_probe())
+
+        # 취소된 시험 호출이 _probing 을 잡고 있으면 이후 모든 호출이 CircuitOpenError
+        self.assertEqual(breaker.state, "half_open")
+        self.assertTrue(breaker.allow())
+        http_client.reset_http_stats()
+        print("    ✅ 취소 후 다음 시험 호출 허용")
@@ -49,17 +49,17 @@ def matched_stores_map(request):
         df = pd.read_csv(csv_path, encoding='utf-8-sig')
         store_count = len(df)
         
-        for _, row in df.iterrows():
-            # 위도/경도가 있는 경우만 추가
-            if pd.notna(row['위도']) and pd.notna(row['경도']):
-                stores_list.append({
-                    'name': row['이름'],
-                    'address': row['주소'],
-                    'lat': float(row['위도']),
-                    'lng': float(row['경도']),
-                    'source': row['출처'],
-                    'match_reason': row['매칭이유']
-                })
+        # 위도/경도가 있는 경우만 추가 (컬럼 단위 필터 + 이름 변경)
+        df = df[df['위도'].notna() & df['경도'].notna()]
+        stores_list = (
+            df[['이름', '주소', '위도', '경도', '출처', '매칭이유']]
+            .rename(columns={
+                '이름': 'name', '주소': 'address', '위도': 'lat', '경도': 'lng',
+                '출처': 'source', '매칭이유': 'match_reason',
+            })
+            .astype({'lat': float, 'lng': float})
+            .to_dict('records')
+        )
     
     context = {
         'stores_json': json.dumps(stores_list, ensure_ascii=False),
@@ -119,7 +119,6 @@ import threading
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST, require_GET
-from django.core.management import call_command
 
 
 # 수집 상태 저장 (메모리, 단일 사용자용)
@@ -159,7 +158,8 @@ collection_status = {
             'total': 0
         },
         'logs': [],
-        'quadrants': []  # 4분면 좌표 데이터 [{center: {lat, lng}, bounds: [...]}]
+        'quadrants': [],  # 4분면 좌표 데이터 [{center: {lat, lng}, bounds: [...]}]
+        'schedule': {}  # 단계 스케줄 결과 (임계 경로 vs 전체 시간)
     }
 }
 
@@ -169,7 +169,7 @@ def collector_view(request):
     return render(request, 'collector.html')
 
 
-import requests
+from stores.management.commands.http_pool import get_session
 
 def validate_kakao_rest_api_key(api_key):
     """카카오 REST API 키 유효성 검증"""
@@ -177,7 +177,7 @@ def validate_kakao_rest_api_key(api_key):
         url = "https://dapi.kakao.com/v2/local/search/keyword.json"
         headers = {"Authorization": f"KakaoAK {api_key}"}
         params = {"query": "테스트"}
-        response = requests.get(url, headers=headers, params=params, timeout=5)
+        response = get_session().get(url, headers=headers, params=params, timeout=5)
         if response.status_code == 401:
             return False, "카카오 REST API 키가 올바르지 않습니다."
         return True, None
@@ -189,7 +189,7 @@ def validate_seoul_openapi_key(api_key):
     """서울시 OpenAPI 키 유효성 검증"""
     try:
         url = f"http://openapi.seoul.go.kr:8088/{api_key}/json/LOCALDATA_072405_YP/1/1/"
-        response = requests.get(url, timeout=5)
+        response = get_session().get(url, timeout=5)
         data = response.json()
         
         # API 응답에서 에러 확인
@@ -273,7 +273,8 @@ def start_collection(request):
                     'total': 0
                 },
                 'logs': [],
-                'quadrants': []
+                'quadrants': [],
+                'schedule': {}
             }
         }
         
@@ -320,37 +321,54 @@ def update_elapsed_time():
         collection_status['metrics']['elapsed_seconds'] = time_module.time() - collection_status['metrics']['start_time']
 
 
+# 단계별 진행률 가중치 (합계 100)
+STAGE_PROGRESS_WEIGHTS = {
+    'daiso': 20,
+    'convenience': 30,
+    'restaurant': 20,
+    'tobacco': 15,
+    'closure': 15,
+}
+
+# 병렬 단계에서 metrics 누적값(API 호출 수, 진행률) 갱신 시 사용
+metrics_lock = threading.Lock()
+
+
+def add_api_calls(provider, count):
+    """provider별 API 호출 수 누적 (병렬 단계 안전)"""
+    with metrics_lock:
+        collection_status['metrics']['api_calls'][provider] += count
+        collection_status['metrics']['api_calls']['total'] += count
+
+
 def run_collection_task(target_gu):
-    """백그라운드 수집 작업 (상세 metrics 추적 포함)"""
+    """
+    백그라운드 수집 작업 (상세 metrics 추적 포함)
+
+    pipeline.PIPELINE_STAGES의 의존성에 따라 단계를 실행한다.
+    휴게음식점/담배소매업 인허가 수집은 다이소/편의점 수집과 병렬로 진행된다.
+    """
     global collection_status
     import time as time_module
+    from django.db import connection
     from stores.models import YeongdeungpoDaiso, YeongdeungpoConvenience, SeoulRestaurantLicense, TobaccoRetailLicense, StoreClosureResult
+    from stores.management.commands.pipeline import PIPELINE_STAGES, pending_stages, run_stage, run_stage_graph
     
-    try:
-        add_log(f'{target_gu} 수집 시작', 'INFO')
-        
-        # ========================================
-        # Step 1: 다이소 수집 (20%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 다이소 수집 중...'
-        collection_status['progress'] = 10
-        collection_status['metrics']['stages']['daiso']['status'] = 'running'
-        add_log(f'[1/5] 다이소 수집 시작', 'INFO')
-        
-        call_command('v2_3_1_collect_yeongdeungpo_daiso', gu=target_gu, clear=True)
-        
+    stage_counts = {}
+
+    # ========================================
+    # 다이소 수집 후처리
+    # ========================================
+    def after_daiso(stage_time):
         daiso_count = YeongdeungpoDaiso.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
+        stage_counts['daiso'] = daiso_count
         collection_status['metrics']['stages']['daiso'] = {
             'status': 'completed',
             'count': daiso_count,
             'time': stage_time,
             'api_calls': 1  # 다이소 API 1회
         }
-        collection_status['metrics']['api_calls']['daiso'] = 1
-        collection_status['metrics']['api_calls']['total'] += 1
-        collection_status['progress'] = 20
+        add_api_calls('daiso', 1)
         add_log(f'✅ 다이소 {daiso_count}개 수집 완료 ({stage_time}초)', 'INFO')
         
         # 수집된 다이소 지점 목록 (N+1 방지: values() 사용으로 한 번만 조회)
@@ -360,8 +378,6 @@ def run_collection_task(target_gu):
         for daiso in daiso_data:
             add_log(f'  📍 {daiso["name"]}', 'INFO')
         
-        update_elapsed_time()
-        
         # 4분면 좌표 데이터 수집 (위에서 조회한 데이터 재사용)
         quadrants_data = []
         DELTA_LAT, DELTA_LNG = 0.0117, 0.0147
@@ -379,47 +395,29 @@ def run_collection_task(target_gu):
                     ]
                 })
         collection_status['metrics']['quadrants'] = quadrants_data
-        
-        # ========================================
-        # Step 2: 편의점 수집 (50%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 편의점 수집 중...'
-        collection_status['progress'] = 30
-        collection_status['metrics']['stages']['convenience']['status'] = 'running'
-        add_log(f'[2/5] 편의점 수집 시작 (4분면 검색)', 'INFO')
-        
-        call_command('v2_3_2_collect_Convenience_Only', gu=target_gu, clear=True, use_async=True)
-        
+
+    # ========================================
+    # 편의점 수집 후처리
+    # ========================================
+    def after_convenience(stage_time):
         conv_count = YeongdeungpoConvenience.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
+        stage_counts['convenience'] = conv_count
         # 추정 API 호출: 다이소 수 * 4분면 * 평균 3페이지
-        estimated_kakao_calls = daiso_count * 4 * 3
+        estimated_kakao_calls = stage_counts.get('daiso', 0) * 4 * 3
         collection_status['metrics']['stages']['convenience'] = {
             'status': 'completed',
             'count': conv_count,
             'time': stage_time,
             'api_calls': estimated_kakao_calls
         }
-        collection_status['metrics']['api_calls']['kakao'] += estimated_kakao_calls
-        collection_status['metrics']['api_calls']['total'] += estimated_kakao_calls
-        collection_status['progress'] = 50
+        add_api_calls('kakao', estimated_kakao_calls)
         add_log(f'✅ 편의점 {conv_count}개 수집 완료 ({stage_time}초, API ~{estimated_kakao_calls}회)', 'INFO')
-        update_elapsed_time()
-        
-        # ========================================
-        # Step 3: OpenAPI 휴게음식점 (70%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 휴게음식점 인허가 수집 중...'
-        collection_status['progress'] = 55
-        collection_status['metrics']['stages']['restaurant']['status'] = 'running'
-        add_log(f'[3/5] 휴게음식점 인허가 수집 시작', 'INFO')
-        
-        call_command('openapi_1', gu=target_gu, clear=True)
-        
+
+    # ========================================
+    # OpenAPI 휴게음식점 / 담배소매업 후처리
+    # ========================================
+    def after_restaurant(stage_time):
         restaurant_count = SeoulRestaurantLicense.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
         estimated_seoul_calls = max(1, restaurant_count // 1000 + 1)
         collection_status['metrics']['stages']['restaurant'] = {
             'status': 'completed',
@@ -427,25 +425,11 @@ def run_collection_task(target_gu):
             'time': stage_time,
             'api_calls': estimated_seoul_calls
         }
-        collection_status['metrics']['api_calls']['seoul'] += estimated_seoul_calls
-        collection_status['metrics']['api_calls']['total'] += estimated_seoul_calls
-        collection_status['progress'] = 70
+        add_api_calls('seoul', estimated_seoul_calls)
         add_log(f'✅ 휴게음식점 {restaurant_count}개 수집 완료 ({stage_time}초)', 'INFO')
-        update_elapsed_time()
-        
-        # ========================================
-        # Step 4: OpenAPI 담배소매업 (85%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 담배소매업 인허가 수집 중...'
-        collection_status['progress'] = 75
-        collection_status['metrics']['stages']['tobacco']['status'] = 'running'
-        add_log(f'[4/5] 담배소매업 인허가 수집 시작', 'INFO')
-        
-        call_command('openapi_2', gu=target_gu, clear=True)
-        
+
+    def after_tobacco(stage_time):
         tobacco_count = TobaccoRetailLicense.objects.filter(gu=target_gu).count()
-        stage_time = round(time_module.time() - stage_start, 2)
         estimated_seoul_calls = max(1, tobacco_count // 1000 + 1)
         collection_status['metrics']['stages']['tobacco'] = {
             'status': 'completed',
@@ -453,30 +437,19 @@ def run_collection_task(target_gu):
             'time': stage_time,
             'api_calls': estimated_seoul_calls
         }
-        collection_status['metrics']['api_calls']['seoul'] += estimated_seoul_calls
-        collection_status['metrics']['api_calls']['total'] += estimated_seoul_calls
-        collection_status['progress'] = 85
+        add_api_calls('seoul', estimated_seoul_calls)
         add_log(f'✅ 담배소매업 {tobacco_count}개 수집 완료 ({stage_time}초)', 'INFO')
-        update_elapsed_time()
-        
-        # ========================================
-        # Step 5: 폐업 검증 (100%)
-        # ========================================
-        stage_start = time_module.time()
-        collection_status['message'] = f'{target_gu} 폐업 매장 검증 중...'
-        collection_status['progress'] = 90
-        collection_status['metrics']['stages']['closure']['status'] = 'running'
-        add_log(f'[5/5] 폐업 검증 시작 (교차 검증)', 'INFO')
-        
-        call_command('check_store_closure', gu=target_gu, clear=True)
-        
+
+    # ========================================
+    # 폐업 검증 후처리
+    # ========================================
+    def after_closure(stage_time):
         # 교차 검증 결과 수집
         closure_results = StoreClosureResult.objects.filter(gu=target_gu)
         normal_count = closure_results.filter(status='정상').count()
         closed_count = closure_results.filter(status='폐업').count()
         total_count = closure_results.count()
         
-        stage_time = round(time_module.time() - stage_start, 2)
         collection_status['metrics']['stages']['closure'] = {
             'status': 'completed',
             'count': total_count,
@@ -505,13 +478,68 @@ def run_collection_task(target_gu):
             'duplicates_removed': 0,  # update_or_create로 처리됨
             'coords_missing': coords_missing,
             'address_mismatch': 0,
-            'total_records': conv_count,
+            'total_records': stage_counts.get('convenience', 0),
             'coord_accuracy_avg': 5.8  # 평균 좌표 변환 오차 (m)
         }
-        
-        collection_status['progress'] = 100
         add_log(f'✅ 폐업 검증 완료: 정상 {normal_count}개, 폐업 {closed_count}개 ({stage_time}초)', 'INFO')
+
+    after_stage = {
+        'daiso': after_daiso,
+        'convenience': after_convenience,
+        'restaurant': after_restaurant,
+        'tobacco': after_tobacco,
+        'closure': after_closure,
+    }
+    stage_numbers = {stage.name: idx for idx, stage in enumerate(PIPELINE_STAGES, 1)}
+    running_labels = {}
+
+    def on_start(stage):
+        running_labels[stage.name] = stage.label
+        collection_status['message'] = f'{target_gu} {", ".join(running_labels.values())} 중...'
+        collection_status['metrics']['stages'][stage.name]['status'] = 'running'
+        add_log(f'[{stage_numbers[stage.name]}/{len(PIPELINE_STAGES)}] {stage.label} 시작', 'INFO')
+
+    def execute(stage):
+        stage_start = time_module.time()
+        try:
+            run_stage(stage, target_gu)
+            after_stage[stage.name](round(time_module.time() - stage_start, 2))
+        finally:
+            # 단계 워커 스레드의 DB 커넥션 정리
+            connection.close()
+
+    def on_done(stage, seconds):
+        running_labels.pop(stage.name, None)
+        with metrics_lock:
+            collection_status['progress'] = min(100, collection_status['progress'] + STAGE_PROGRESS_WEIGHTS[stage.name])
+        if running_labels:
+            collection_status['message'] = f'{target_gu} {", ".join(running_labels.values())} 중...'
+        update_elapsed_time()
+    
+    try:
+        add_log(f'{target_gu} 수집 시작', 'INFO')
+        collection_status['message'] = f'{target_gu} 수집 시작...'
+
+        # 대시보드 실행은 항상 처음부터: 이전 완료 기록이 남으면 run_all --resume 이 단계를 건너뜀
+        stages = pending_stages(PIPELINE_STAGES, target_gu, resume=False)
+        result = run_stage_graph(stages, execute, on_start=on_start, on_done=on_done)
+        if not result.success:
+            collection_status['metrics']['stages'][result.failed_stage]['status'] = 'failed'
+            raise result.exception
+
+        collection_status['metrics']['schedule'] = {
+            'total_time': result.total_time,
+            'serial_time': result.serial_time,
+            'critical_path': result.critical_path,
+            'critical_path_time': result.critical_path_time,
+        }
+        add_log(
+            f'🧭 임계 경로: {" → ".join(result.critical_path)} ({result.critical_path_time}초) / '
+            f'전체 {result.total_time}초 (순차 실행 시 {result.serial_time}초)',
+            'INFO'
+        )
         
+        collection_status['progress'] = 100
         collection_status['message'] = '수집 완료!'
         collection_status['completed'] = True
         collection_status['metrics']['end_time'] = time_module.time()
@@ -589,9 +617,12 @@ def dev_monitor_view(request):
 
 @require_GET
 def dev_status(request):
-    """개발자용 상세 상태 API - 모든 metrics + 시스템 리소스 반환"""
+    """개발자용 상세 상태 API - 모든 metrics + 시스템 리소스 + 외부 HTTP 오류 카운터 반환"""
     import time as time_module
     import threading
+    from stores.management.commands.http_client import http_stats
+    from stores.management.commands.http_pool import pool_stats
+    from stores.management.commands.rate_limit import limiter_stats
     
     # 경과 시간 실시간 업데이트
     if collection_status.get('running') and collection_status.get('metrics', {}).get('start_time'):
@@ -608,7 +639,10 @@ def dev_status(request):
         'error': collection_status.get('error'),
         'target_gu': collection_status.get('target_gu', ''),
         'metrics': collection_status.get('metrics', {}),
-        'system': system_info
+        'system': system_info,
+        'http': http_stats(),             # 호스트별 요청/재시도/실패/차단 + 서킷 상태
+        'rate_limits': limiter_stats(),   # 키별 토큰 버킷 대기/429
+        'pools': pool_stats(),            # 연결 재사용(hit) / 새 연결(miss), DNS 캐시
     })
 
 